@@ -1,19 +1,37 @@
 import re
 import os
+import io
+import csv
+import bisect
+import pickle
+import hashlib
+import tempfile
+import zipfile
+import posixpath
+import xml.etree.ElementTree as ET
+from copy import copy
+import threading
 import warnings
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 from robot.api import logger
 from robot.api.deco import keyword, not_keyword
 from robot.libraries.BuiltIn import BuiltIn
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
+from pandas.io.parsers import TextParser
 from pathlib import Path
 import openpyxl as excel
 from openpyxl import Workbook
 from openpyxl.workbook.protection import WorkbookProtection
 from openpyxl.worksheet.protection import SheetProtection
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.cell.cell import Cell, MergedCell, ERROR_CODES
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.utils import get_column_letter, column_index_from_string, range_boundaries
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 __version__ = "1.3.0"
 
@@ -26,6 +44,11 @@ class ExcelError(Exception):
         self.message = message
         super().__init__(self.message)
 
+    def __reduce__(self):
+        # Subclasses take other constructor arguments than the final message, so errors raised in a worker process
+        # are rebuilt from their message and attributes instead of calling __init__ again.
+        return Exception.__new__, (type(self), *self.args), self.__dict__
+
 
 class WorkbookNotProtectedError(ExcelError):
     def __init__(
@@ -175,6 +198,894 @@ class InvalidSheetPositionError(ExcelError):
         super().__init__(message)
 
 
+class WorkbookTransactionError(ExcelError):
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class WorkbookReadOnlyError(ExcelError):
+    def __init__(self, workbook_name: str):
+        self.workbook_name = workbook_name
+        message = f"Workbook '{self.workbook_name}' is opened in read mode and cannot be modified. Open it with mode=edit to make changes."
+        super().__init__(message)
+
+
+class _WorkbookCache:
+    """
+    Process-wide LRU cache of parsed workbooks, keyed by file identity and load options.
+
+    A workbook is parsed once and kept as its pickled bytes, which unpickle much faster than the file parses. Every
+    lookup builds a fresh ``Workbook`` from them, so no two aliases or library instances share a workbook object and
+    a change made to one never shows in another. Memory usage is the size of the pickled bytes.
+    """
+
+    def __init__(self, memory_limit: int) -> None:
+        self.memory_limit = memory_limit
+        self.limit_configured = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.memory = 0
+        self._entries = OrderedDict()
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(workbook_name: str, load_kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+        stat = os.stat(workbook_name)
+        options = tuple(sorted((name, repr(value)) for name, value in load_kwargs.items()))
+        return os.path.realpath(workbook_name), stat.st_mtime_ns, stat.st_size, options
+
+    def request_memory_limit(self, memory_limit: int) -> int:
+        """
+        Sets the memory limit in bytes for the whole process. Once a library instance has set it, other instances
+        can only raise it, so one of them cannot shrink the cache under the others. Returns the limit in effect.
+        """
+        with self._lock:
+            if not self.limit_configured or memory_limit >= self.memory_limit:
+                self.memory_limit = memory_limit
+                self.limit_configured = True
+            return self.memory_limit
+
+    def get_or_load(self, workbook_name: str, load_kwargs: Dict[str, Any]) -> Workbook:
+        key = self.make_key(workbook_name, load_kwargs)
+
+        while True:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    data = self._entries[key][0]
+                    break
+                loading = self._loading.get(key)
+                if loading is None:
+                    self.misses += 1
+                    self._loading[key] = threading.Event()
+            if loading is None:
+                return self._load(key, workbook_name, load_kwargs)
+            # Another thread is parsing the same file; its result is served once it is stored.
+            loading.wait()
+
+        return pickle.loads(data)
+
+    def _load(self, key: Tuple[Any, ...], workbook_name: str, load_kwargs: Dict[str, Any]) -> Workbook:
+        """Parses a workbook outside the lock and stores its pickled bytes, if they fit, for the next lookups."""
+        data = None
+        try:
+            workbook = excel.load_workbook(filename=workbook_name, **load_kwargs)
+            try:
+                data = pickle.dumps(workbook, protocol=pickle.HIGHEST_PROTOCOL)
+            except (TypeError, AttributeError, pickle.PicklingError):
+                # Workbooks holding open archives, such as with keep_vba=True, are not cached.
+                pass
+            return workbook
+        finally:
+            with self._lock:
+                if data is not None:
+                    self._store(key, data)
+                self._loading.pop(key).set()
+
+    def _store(self, key: Tuple[Any, ...], data: bytes) -> None:
+        """Adds an entry, evicting the least recently used ones. Called with the lock held."""
+        # Older versions of the same file can never be hit again.
+        for stale_key in [k for k in self._entries if k[0] == key[0] and k[3] == key[3]]:
+            self.memory -= self._entries.pop(stale_key)[1]
+
+        size = len(data)
+        if size > self.memory_limit:
+            return
+
+        while self._entries and self.memory + size > self.memory_limit:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.memory -= evicted_size
+            self.evictions += 1
+
+        self._entries[key] = (data, size)
+        self.memory += size
+
+    def clear(self) -> int:
+        with self._lock:
+            cleared = len(self._entries)
+            self._entries.clear()
+            self.memory = 0
+            return cleared
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "memory": self.memory,
+                "memory_limit": self.memory_limit,
+            }
+
+
+_WORKBOOK_CACHE = _WorkbookCache(memory_limit=512 * 1024 * 1024)
+
+# Rough memory taken by one parsed cell, used to size the chunks of streamed reads.
+_CELL_MEMORY_ESTIMATE = 256
+
+# Size of the row chunks Merge Excels streams from each input sheet with write_only=True.
+_MERGE_CHUNK_MEMORY = 16 * 1024 * 1024
+
+
+def _read_excel_sheets(file_path: str) -> List[Tuple[str, Union[DataFrame, Exception]]]:
+    """
+    Parses every sheet of an Excel file into a DataFrame, in sheet order, opening the file only once. A sheet that
+    cannot be parsed comes back with its exception instead, so the caller decides whether to skip it. It lives at
+    module level so it can run in a worker process.
+    """
+    sheets = []
+    with pd.ExcelFile(file_path) as excel_file:
+        for sheet_name in excel_file.sheet_names:
+            try:
+                sheets.append((sheet_name, excel_file.parse(sheet_name)))
+            except Exception as e:
+                sheets.append((sheet_name, e))
+    return sheets
+
+
+def _stream_excel_sheets(
+    file_path: str, chunk_memory: int
+) -> List[Tuple[str, Union[Tuple[DataFrame, Iterator[DataFrame]], Exception]]]:
+    """
+    Counterpart of ``_read_excel_sheets`` that does not keep the sheets in memory. Every sheet comes back as its
+    empty header frame and an iterator over its rows in DataFrames of about ``chunk_memory`` bytes, with the
+    values and dtypes ``pd.read_excel`` gives them, or with its exception if it cannot be parsed. Files openpyxl
+    cannot stream are parsed whole instead and come back as a single chunk.
+    """
+    if Path(file_path).suffix.lower() not in (".xlsx", ".xlsm"):
+        return [
+            (sheet_name, df if isinstance(df, Exception) else (df.iloc[:0], iter([df])))
+            for sheet_name, df in _read_excel_sheets(file_path)
+        ]
+
+    workbook = excel.load_workbook(file_path, read_only=True, keep_links=False)
+    sheet_names = workbook.sheetnames
+    workbook.close()
+
+    sheets = []
+    for sheet_name in sheet_names:
+        chunks = _read_sheet_chunks(file_path, {"sheet_name": sheet_name}, chunk_memory)
+        try:
+            sheets.append((sheet_name, (next(chunks), chunks)))
+        except Exception as e:
+            sheets.append((sheet_name, e))
+    return sheets
+
+
+def _compare_read_options(file_name: str, config: Optional[dict]) -> Tuple[Union[str, int], int, Optional[List[Any]]]:
+    """
+    Checks the file and the ``starting_cell`` of a ``Compare Excels`` config and returns the sheet, the header row
+    number and the columns to keep.
+    """
+    if not os.path.exists(file_name):
+        raise ExcelFileNotFoundError(file_name)
+
+    sheet_name = config.get("sheet_name", 0) if config else 0
+    starting_cell = config.get("starting_cell", "A1") if config else "A1"
+    columns = config.get("columns", None) if config else None
+
+    try:
+        range_boundaries(starting_cell)
+    except ValueError:
+        raise InvalidCellAddressError(starting_cell)
+
+    return sheet_name, int("".join(filter(str.isdigit, starting_cell))), columns
+
+
+def _iter_sheet_values(
+    sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet],
+    min_row: int,
+    max_row: int,
+    min_col: int,
+    max_col: int,
+) -> Iterator[Tuple[Any, ...]]:
+    """
+    Reads the values of a cell block row by row without creating ``Cell`` objects.
+
+    Read-only sheets are streamed with ``iter_rows(values_only=True)``. Regular sheets are read straight from the
+    worksheet's cell store, so missing cells are never added to the sheet: small blocks are looked up cell by
+    cell, large blocks walk the stored cells in row order. Either way the rows are produced lazily, one at a time.
+    """
+    if isinstance(sheet, ReadOnlyWorksheet):
+        yield from sheet.iter_rows(
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
+            values_only=True,
+        )
+        return
+
+    columns = range(min_col, max_col + 1)
+    row_numbers = range(min_row, max_row + 1)
+    cells = sheet._cells
+
+    if len(row_numbers) * len(columns) * 2 < len(cells):
+        get_cell = cells.get
+        for row in row_numbers:
+            yield tuple(
+                None if (cell := get_cell((row, column))) is None else cell._value
+                for column in columns
+            )
+        return
+
+    # Only the cell positions are sorted up front; values are read row by row as the rows are consumed.
+    positions = sorted(cells)
+    empty_row = (None,) * len(columns)
+    next_row, current_row, values = min_row, None, {}
+    for index in range(bisect.bisect_left(positions, (min_row, 0)), len(positions)):
+        row, column = positions[index]
+        if row > max_row:
+            break
+        if not min_col <= column <= max_col:
+            continue
+        if row != current_row:
+            if current_row is not None:
+                yield tuple(map(values.get, columns))
+                next_row = current_row + 1
+            for _ in range(next_row, row):
+                yield empty_row
+            next_row, current_row, values = row, row, {}
+        cell = cells.get((row, column))
+        values[column] = None if cell is None else cell._value
+
+    if current_row is not None:
+        yield tuple(map(values.get, columns))
+        next_row = current_row + 1
+    for _ in range(next_row, max_row + 1):
+        yield empty_row
+
+
+def _write_sheet_csv(sheet: Any, output_filename: str, separator: str) -> int:
+    """
+    Streams the rows of a worksheet, regular or read-only, into a CSV file through a buffered ``csv.writer`` and
+    returns the number of data rows written. Regular sheets are read without adding cells to them. The first row is the header, named the way ``pd.read_excel`` names
+    columns. Whole numbers stored as floats are written as integers and trailing empty rows are dropped, also as
+    ``pd.read_excel`` does.
+    """
+
+    def convert(row: Tuple[Any, ...]) -> List[Any]:
+        return [int(value) if isinstance(value, float) and value.is_integer() else value for value in row]
+
+    written = empty_rows = 0
+    with open(output_filename, "w", newline="", encoding="utf-8", buffering=1024 * 1024) as file:
+        writer = csv.writer(file, delimiter=separator)
+        rows = _iter_sheet_values(sheet, 1, sheet.max_row, 1, sheet.max_column)
+        header = next(rows, None)
+        if header is None:
+            return 0
+        header = ["" if value is None else value for value in convert(header)]
+        writer.writerow(TextParser([header], header=0, skip_blank_lines=False).read().columns)
+
+        for row in rows:
+            if all(value is None or value == "" for value in row):
+                # Empty rows only count when data follows them.
+                empty_rows += 1
+                continue
+            for _ in range(empty_rows):
+                writer.writerow([""] * len(row))
+            writer.writerow(convert(row))
+            written += empty_rows + 1
+            empty_rows = 0
+    return written
+
+
+def _export_csv_file(filename: str, sheet_name: str, output_filename: str, separator: str) -> int:
+    """
+    Exports one sheet of an Excel file to CSV through a read-only workbook, so memory use does not grow with the
+    sheet. It lives at module level so it can run in a worker process.
+    """
+    workbook = excel.load_workbook(filename, read_only=True, data_only=True, keep_links=False)
+    try:
+        return _write_sheet_csv(workbook[sheet_name], output_filename, separator)
+    finally:
+        workbook.close()
+
+
+def _load_compare_frame(file_name: str, config: Optional[dict] = None, nrows: Optional[int] = None) -> DataFrame:
+    """
+    Reads the sheet a ``Compare Excels`` config points at into a DataFrame: ``sheet_name`` (default the first
+    sheet), ``starting_cell`` of the header (default ``A1``) and optionally the ``columns`` to keep. ``nrows``
+    limits the number of data rows read, ``0`` reads the header only.
+    """
+    sheet_name, start_row, columns = _compare_read_options(file_name, config)
+    df = pd.read_excel(file_name, sheet_name=sheet_name, header=start_row - 1, nrows=nrows)
+
+    if columns is not None:
+        missing_columns = [col for col in columns if col not in df.columns]
+        if missing_columns:
+            raise InvalidColumnNameError(sheet_name, missing_columns)
+        df = df[columns]
+
+    return df
+
+
+_RELATIONSHIP_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_SPREADSHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def _file_digest(file_name: str) -> str:
+    """Returns the SHA-256 digest of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_workbook_parts(archive: zipfile.ZipFile) -> Tuple[List[Tuple[str, str]], List[str], str]:
+    """
+    Reads the package structure of an opened xlsx file without touching any cells. It returns the worksheets in
+    workbook order as ``(name, part)`` pairs, the shared strings and styles parts, and the 1904 date setting.
+    """
+    workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+    relationships = {
+        relationship.get("Id"): relationship
+        for relationship in ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    }
+
+    def part_name(relationship: ET.Element) -> str:
+        target = relationship.get("Target")
+        if target.startswith("/"):
+            return target.lstrip("/")
+        return posixpath.normpath(posixpath.join("xl", target))
+
+    worksheets = [
+        (sheet.get("name"), part_name(relationship))
+        for sheet in workbook.iter(f"{_SPREADSHEET_NS}sheet")
+        if (relationship := relationships[sheet.get(f"{_RELATIONSHIP_NS}id")]).get("Type").endswith("/worksheet")
+    ]
+    value_parts = sorted(
+        part_name(relationship)
+        for relationship in relationships.values()
+        if relationship.get("Type").endswith(("/sharedStrings", "/styles"))
+    )
+    properties = workbook.find(f"{_SPREADSHEET_NS}workbookPr")
+    date1904 = properties.get("date1904", "0") if properties is not None else "0"
+    return worksheets, value_parts, date1904
+
+
+def _worksheet_names(file_name: str) -> List[str]:
+    """
+    Returns the worksheet names of an Excel file in workbook order. They are read from the xlsx package when
+    possible, so no worksheet is parsed; other formats are opened with ``pd.ExcelFile``.
+    """
+    try:
+        with zipfile.ZipFile(file_name) as archive:
+            return [name for name, _ in _read_workbook_parts(archive)[0]]
+    except (KeyError, zipfile.BadZipFile, ET.ParseError):
+        with pd.ExcelFile(file_name) as excel_file:
+            return excel_file.sheet_names
+
+
+def _find_worksheet_part(worksheets: List[Tuple[str, str]], sheet_name: Union[str, int]) -> Optional[str]:
+    """Returns the part of a worksheet given by name or by position among the worksheets, or ``None``."""
+    if isinstance(sheet_name, int):
+        return worksheets[sheet_name][1] if 0 <= sheet_name < len(worksheets) else None
+    return next((part for name, part in worksheets if name == sheet_name), None)
+
+
+def _sheet_xml_size(file_name: str, sheet_name: Union[str, int]) -> Optional[int]:
+    """
+    Returns the uncompressed size of a sheet's XML, shared strings and styles in an xlsx file, read from the zip
+    directory without decompressing anything, or ``None`` when the file or sheet cannot be measured this way.
+    """
+    try:
+        with zipfile.ZipFile(file_name) as archive:
+            worksheets, value_parts, _ = _read_workbook_parts(archive)
+            sheet_part = _find_worksheet_part(worksheets, sheet_name)
+            if sheet_part is None:
+                return None
+            return sum(archive.getinfo(part).file_size for part in [sheet_part, *value_parts])
+    except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError):
+        return None
+
+
+def _sheet_fingerprint(file_name: str, sheet_name: Union[str, int]) -> Optional[str]:
+    """
+    Returns a SHA-256 digest over the xlsx parts that decide the cell values of one sheet, read straight from the
+    zip container without parsing any cells: the sheet XML, the shared strings and styles it refers to, and the
+    workbook's 1904 date setting. ``sheet_name`` is a name or a position among the worksheets. It returns ``None``
+    when the file or sheet cannot be fingerprinted this way, such as an ``.xls`` file.
+    """
+    try:
+        with zipfile.ZipFile(file_name) as archive:
+            worksheets, value_parts, date1904 = _read_workbook_parts(archive)
+            sheet_part = _find_worksheet_part(worksheets, sheet_name)
+            if sheet_part is None:
+                return None
+
+            digest = hashlib.sha256(f"date1904={date1904}".encode())
+            for part in [sheet_part, *value_parts]:
+                digest.update(f"\0{part}\0".encode())
+                with archive.open(part) as stream:
+                    for block in iter(lambda: stream.read(1024 * 1024), b""):
+                        digest.update(block)
+            return digest.hexdigest()
+    except (OSError, KeyError, IndexError, zipfile.BadZipFile, ET.ParseError):
+        return None
+
+
+def _same_sheet_contents(
+    source_excel: str, source_config: Optional[dict], target_excel: str, target_config: Optional[dict]
+) -> bool:
+    """
+    Tells whether the two sheets a ``Compare Excels`` call points at are known to hold the same data, so the cells
+    need not be parsed. Both configs must read the same header cell and columns. The sheets then match when the
+    files have the same SHA-256 digest and the same sheet is named, or when their sheet fingerprints are equal.
+    A ``False`` only means the sheets have to be compared cell by cell.
+    """
+
+    def read_options(config: Optional[dict]) -> Tuple[Any, Any, Any]:
+        config = config or {}
+        return config.get("sheet_name", 0), str(config.get("starting_cell", "A1")).upper(), config.get("columns")
+
+    source_sheet, *source_options = read_options(source_config)
+    target_sheet, *target_options = read_options(target_config)
+    if source_options != target_options:
+        return False
+
+    try:
+        if source_sheet == target_sheet and (
+            os.path.samefile(source_excel, target_excel)
+            or (
+                os.path.getsize(source_excel) == os.path.getsize(target_excel)
+                and _file_digest(source_excel) == _file_digest(target_excel)
+            )
+        ):
+            return True
+    except OSError:
+        return False
+
+    source_fingerprint = _sheet_fingerprint(source_excel, source_sheet)
+    return source_fingerprint is not None and source_fingerprint == _sheet_fingerprint(target_excel, target_sheet)
+
+
+def _check_compare_columns(source_df: DataFrame, target_df: DataFrame) -> None:
+    """Raises a ``ColumnMismatchError`` unless both frames have the same set of columns."""
+    source_columns = set(source_df.columns.tolist())
+    target_columns = set(target_df.columns.tolist())
+
+    if source_columns != target_columns:
+        missing_in_source = (
+            target_columns - source_columns
+            if len(target_columns - source_columns) != 0
+            else None
+        )
+        missing_in_target = (
+            source_columns - target_columns
+            if len(source_columns - target_columns) != 0
+            else None
+        )
+        error_message = f"Column mismatch found in excel files.\nMissing in source: {missing_in_source}\nMissing in target: {missing_in_target}"
+        raise ColumnMismatchError(error_message)
+
+
+def _compare_sheets(
+    source_excel: str,
+    source_config: Optional[dict],
+    target_excel: str,
+    target_config: Optional[dict],
+    key_columns: Optional[List[Any]] = None,
+    memory_limit: Optional[int] = None,
+) -> Union[DataFrame, Dict[str, DataFrame]]:
+    """
+    Compares the two sheets the configs point at the way ``Compare Excels`` does: by whole rows, or on
+    ``key_columns`` when given. Sheets known to be identical are only read up to their headers. With a
+    ``memory_limit`` in bytes, other sheets are compared out of core by ``_compare_sheets_out_of_core``.
+    """
+    identical = _same_sheet_contents(source_excel, source_config, target_excel, target_config)
+    if memory_limit is not None and not identical:
+        return _compare_sheets_out_of_core(
+            source_excel, source_config, target_excel, target_config, key_columns, memory_limit
+        )
+
+    nrows = 0 if identical else None
+    source_df = _load_compare_frame(source_excel, source_config, nrows)
+    target_df = _load_compare_frame(target_excel, target_config, nrows)
+    _check_compare_columns(source_df, target_df)
+
+    if key_columns is None:
+        return _diff_rows(source_df, target_df)
+
+    missing_columns = [col for col in key_columns if col not in source_df.columns]
+    if missing_columns:
+        sheet_name = source_config.get("sheet_name", 0) if source_config else 0
+        raise InvalidColumnNameError(sheet_name, missing_columns)
+
+    differences = _diff_by_key(source_df, target_df, key_columns)
+    return {name: frame.reset_index(drop=True) for name, frame in differences.items()}
+
+
+def _diff_rows(source_df: DataFrame, target_df: DataFrame) -> DataFrame:
+    """
+    Returns the rows that appear in only one of the frames, marked with the frame they come from in an
+    ``Excel_Source`` column (``__Excel_Source__`` if the data already has such a column).
+    """
+    excel_column_name = "Excel_Source"
+    if "Excel_Source" in source_df.columns or "Excel_Source" in target_df.columns:
+        excel_column_name = "__Excel_Source__"
+
+    source_df = source_df.assign(**{excel_column_name: "Source"})
+    target_df = target_df.assign(**{excel_column_name: "Target"})
+
+    return pd.concat([source_df, target_df]).drop_duplicates(
+        subset=source_df.columns.difference([excel_column_name]), keep=False
+    )
+
+
+def _diff_by_key(source_df: DataFrame, target_df: DataFrame, key_columns: List[Any]) -> Dict[str, DataFrame]:
+    """
+    Matches the rows of both frames on ``key_columns`` with a single hash join and returns the ``added`` rows (only
+    in the target), the ``removed`` rows (only in the source) and the ``changed`` cells of the rows in both. Changed
+    cells come one per row, with the key values, the ``Column`` name and the ``Source`` and ``Target`` values, in
+    source row order. Two missing values count as equal. The rows keep the index labels of the frame they come
+    from, changed cells those of their source row.
+    """
+    for side, df in (("source", source_df), ("target", target_df)):
+        if df.duplicated(subset=key_columns).any():
+            raise ValueError(
+                f"Key columns {key_columns} do not identify the rows of the {side} sheet uniquely."
+            )
+
+    source_position, target_position = "__source_row__", "__target_row__"
+    matches = pd.merge(
+        source_df[key_columns].assign(**{source_position: np.arange(len(source_df))}),
+        target_df[key_columns].assign(**{target_position: np.arange(len(target_df))}),
+        on=key_columns,
+        how="outer",
+        sort=False,
+        indicator=True,
+    )
+
+    removed_rows = np.sort(matches.loc[matches["_merge"] == "left_only", source_position].to_numpy(dtype=int))
+    added_rows = np.sort(matches.loc[matches["_merge"] == "right_only", target_position].to_numpy(dtype=int))
+    both = matches[matches["_merge"] == "both"].sort_values(source_position)
+    source_rows = source_df.iloc[both[source_position].astype(int)].reset_index(drop=True)
+    target_rows = target_df.iloc[both[target_position].astype(int)].reset_index(drop=True)
+
+    changes = []
+    for column in source_df.columns:
+        if column in key_columns:
+            continue
+        source_values = source_rows[column]
+        target_values = target_rows[column]
+        differs = (source_values != target_values) & ~(source_values.isna() & target_values.isna())
+        if differs.any():
+            changes.append(
+                source_rows.loc[differs, key_columns].assign(
+                    Column=column, Source=source_values[differs], Target=target_values[differs]
+                )
+            )
+
+    if changes:
+        changed = pd.concat(changes).sort_index(kind="stable")
+        changed.index = source_df.index[both[source_position].to_numpy(dtype=int)[changed.index]]
+    else:
+        changed = pd.DataFrame(columns=[*key_columns, "Column", "Source", "Target"])
+
+    return {
+        "added": target_df.iloc[added_rows],
+        "removed": source_df.iloc[removed_rows],
+        "changed": changed,
+    }
+
+
+def _convert_sheet_value(value: Any) -> Any:
+    """Converts a worksheet value the way ``pd.read_excel`` does before parsing: blanks, errors and whole numbers."""
+    if value is None:
+        return ""
+    if isinstance(value, str) and value in ERROR_CODES:
+        return np.nan
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _convert_compare_cell(cell: Any) -> Any:
+    """Converts a read-only cell the way ``pd.read_excel`` does before parsing: blanks, errors and whole numbers."""
+    if cell.value is None:
+        return ""
+    if cell.data_type == "e":
+        return np.nan
+    if cell.data_type == "n" and cell.value == int(cell.value):
+        return int(cell.value)
+    return cell.value
+
+
+def _iter_sheet_row_chunks(
+    file_name: str, config: Optional[dict], chunk_memory: int
+) -> Iterator[Union[Tuple[List[Any], int], Tuple[List[List[Any]], int]]]:
+    """
+    Streams the sheet a config points at, as a ``Compare Excels`` config does with its ``sheet_name`` and
+    ``starting_cell`` keys, through a read-only workbook. Cells are converted the way ``pd.read_excel`` converts
+    them and trailing empty cells are left out of every row. It first yields the header row together with the
+    width of the widest row above it, then ``(rows, count)`` chunks of about ``chunk_memory`` bytes of data rows,
+    where ``count`` is the number of data rows before the chunk. Trailing empty rows are dropped the way
+    ``pd.read_excel`` drops them.
+    """
+    sheet_name, start_row, _ = _compare_read_options(file_name, config)
+    workbook = excel.load_workbook(file_name, read_only=True, data_only=True, keep_links=False)
+    try:
+        if isinstance(sheet_name, int):
+            if not 0 <= sheet_name < len(workbook.worksheets):
+                raise SheetDoesntExistsError(str(sheet_name))
+            sheet = workbook.worksheets[sheet_name]
+        elif sheet_name in workbook.sheetnames:
+            sheet = workbook[sheet_name]
+        else:
+            raise SheetDoesntExistsError(sheet_name)
+        sheet.reset_dimensions()
+
+        def convert(row: Tuple[Any, ...]) -> List[Any]:
+            values = [_convert_compare_cell(cell) for cell in row]
+            while values and values[-1] == "":
+                values.pop()
+            return values
+
+        # pd.read_excel pads every row to the widest row of the sheet, including the rows above the header.
+        rows = sheet.iter_rows()
+        width_above = max((len(convert(row)) for row in islice(rows, start_row - 1)), default=0)
+        header = convert(next(rows, ()))
+        yield header, width_above
+
+        chunk_rows = max(1, chunk_memory // (max(len(header), width_above, 1) * _CELL_MEMORY_ESTIMATE))
+        chunk, count, empty_rows = [], 0, 0
+        for row in rows:
+            values = convert(row)
+            if not values:
+                # Empty rows only count when data follows them.
+                empty_rows += 1
+                continue
+            chunk.extend([] for _ in range(empty_rows))
+            chunk.append(values)
+            empty_rows = 0
+            if len(chunk) >= chunk_rows:
+                yield chunk, count
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            yield chunk, count
+    finally:
+        workbook.close()
+
+
+def _read_sheet_chunks(file_name: str, config: Optional[dict], chunk_memory: int) -> Iterator[DataFrame]:
+    """
+    Streams the sheet a config points at as DataFrames, keeping the ``columns`` of the config if it lists any. It
+    first yields an empty frame with the header, then the chunks of ``_iter_sheet_row_chunks`` parsed by pandas
+    and indexed by their data row number, with the shape, values and dtypes ``pd.read_excel`` gives the sheet.
+
+    Both the width of the table and the type pandas guesses for a column depend on the whole sheet: the rows are
+    padded to the widest row, and a column of numeric codes stays text when any chunk holds text among them. A
+    first pass over the sheet therefore notes the widest row and the types each chunk gets, and the second pass
+    gives every chunk the type the whole column gets: the common numeric type, the one type all chunks agree
+    on, or the unconverted cell values where they disagree.
+    """
+    sheet_name, _, columns = _compare_read_options(file_name, config)
+
+    def pad(chunk: List[List[Any]], width: int) -> List[List[Any]]:
+        return [row + [""] * (width - len(row)) for row in chunk]
+
+    def scan() -> Tuple[List[Any], int, List[set], List[bool], List[bool]]:
+        # Runs in its own frame so that no chunk outlives the first pass while this generator is suspended.
+        rows = _iter_sheet_row_chunks(file_name, config, chunk_memory)
+        header, width = next(rows)
+        width = max(width, len(header))
+        chunk_dtypes, has_empty_chunks, all_text = [], [], []
+        for chunk, count in rows:
+            width = max(width, max(len(row) for row in chunk))
+            # Columns first reached by this chunk were empty in the chunks before it.
+            while len(chunk_dtypes) < width:
+                chunk_dtypes.append(set())
+                has_empty_chunks.append(count > 0)
+                all_text.append(True)
+            df = TextParser(pad(chunk, width), header=None, names=list(range(width)), skip_blank_lines=False).read()
+            for position in range(width):
+                column = df.iloc[:, position]
+                if column.isna().all():
+                    has_empty_chunks[position] = True
+                    continue
+                chunk_dtypes[position].add(column.dtype)
+                if all_text[position]:
+                    all_text[position] = all(
+                        isinstance(row[position], str)
+                        for row in chunk
+                        if position < len(row) and row[position] != ""
+                    )
+        return header, width, chunk_dtypes, has_empty_chunks, all_text
+
+    header, width, chunk_dtypes, has_empty_chunks, all_text = scan()
+    names = (
+        list(TextParser([header + [""] * (width - len(header))], header=0, skip_blank_lines=False).read().columns)
+        if width
+        else []
+    )
+    positions = list(range(len(names)))
+    if columns is not None:
+        missing_columns = [col for col in columns if col not in names]
+        if missing_columns:
+            raise InvalidColumnNameError(sheet_name, missing_columns)
+        positions = [names.index(col) for col in columns]
+
+    text_columns = {}
+    dtypes = {}
+    for position, name in enumerate(names):
+        found = chunk_dtypes[position] if position < len(chunk_dtypes) else set()
+        if not found:
+            continue
+        if all(pd.api.types.is_numeric_dtype(dtype) for dtype in found):
+            if has_empty_chunks[position]:
+                found = found | {np.dtype("float64")}
+            dtypes[name] = np.result_type(*found)
+        elif len(found) == 1:
+            dtypes[name] = next(iter(found))
+        else:
+            text_columns[name] = object
+            dtypes[name] = "str" if all_text[position] else object
+
+    selected = [names[position] for position in positions]
+    yield pd.DataFrame(columns=selected)
+
+    rows = _iter_sheet_row_chunks(file_name, config, chunk_memory)
+    next(rows)
+    first_row = 0
+    for chunk, _ in rows:
+        df = TextParser(
+            pad(chunk, width), header=None, names=names, dtype=text_columns or None, skip_blank_lines=False
+        ).read()
+        df = df[selected]
+        df = df.astype({name: dtype for name, dtype in dtypes.items() if name in df and df[name].dtype != dtype})
+        df.index = pd.RangeIndex(first_row, first_row + len(df))
+        first_row += len(df)
+        yield df
+
+
+def _spill_path(spill_directory: str, side: str, bucket: int) -> str:
+    """Returns the spill file of one side of a bucket."""
+    return os.path.join(spill_directory, f"{side}_{bucket}.pkl")
+
+
+def _spill_compare_chunks(
+    chunks: Iterator[DataFrame], hash_columns: List[Any], bucket_count: int, spill_directory: str, side: str
+) -> None:
+    """
+    Partitions streamed chunks into ``bucket_count`` spill files by the hash of their ``hash_columns`` values, so
+    rows with equal values always land in the same bucket. Each file holds a sequence of pickled frames.
+    """
+    for chunk in chunks:
+        values = chunk[hash_columns].astype(object)
+        values = values.where(values.notna(), None)
+        buckets = np.fromiter(
+            (hash(row) % bucket_count for row in values.itertuples(index=False, name=None)),
+            dtype=np.int64,
+            count=len(values),
+        )
+        for bucket, frame in chunk.groupby(buckets, sort=False):
+            with open(_spill_path(spill_directory, side, bucket), "ab") as file:
+                pickle.dump(frame, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load_spilled_frame(path: str, header: DataFrame) -> DataFrame:
+    """Reads back every frame pickled into a spill file, or returns the empty ``header`` frame if there is none."""
+    if not os.path.exists(path):
+        return header
+    frames = []
+    with open(path, "rb") as file:
+        while True:
+            try:
+                frames.append(pickle.load(file))
+            except EOFError:
+                break
+    return pd.concat(frames)
+
+
+def _compare_sheets_out_of_core(
+    source_excel: str,
+    source_config: Optional[dict],
+    target_excel: str,
+    target_config: Optional[dict],
+    key_columns: Optional[List[Any]],
+    memory_limit: int,
+) -> Union[DataFrame, Dict[str, DataFrame]]:
+    """
+    Compares two sheets like ``_compare_sheets`` without loading either of them whole. Both sheets are streamed in
+    chunks and partitioned by the hash of their key columns, or of whole rows, into spill files in a temporary
+    directory, and the matching buckets are compared one pair at a time. The bucket count is derived from the
+    uncompressed size of both sheets so that a bucket pair stays within ``memory_limit`` bytes. The differences
+    are returned in the same order as ``_compare_sheets`` returns them.
+    """
+    total_size = 0
+    for file_name, config in ((source_excel, source_config), (target_excel, target_config)):
+        _compare_read_options(file_name, config)
+        sheet_name = config.get("sheet_name", 0) if config else 0
+        total_size += _sheet_xml_size(file_name, sheet_name) or os.path.getsize(file_name)
+    # A parsed sheet takes about as much memory as its XML; half of the limit is left for the chunks and results.
+    bucket_count = max(1, -(-4 * total_size // memory_limit))
+
+    source_chunks = _read_sheet_chunks(source_excel, source_config, memory_limit // 4)
+    target_chunks = _read_sheet_chunks(target_excel, target_config, memory_limit // 4)
+    try:
+        source_header = next(source_chunks)
+        target_header = next(target_chunks)
+        _check_compare_columns(source_header, target_header)
+
+        if key_columns is None:
+            hash_columns = source_header.columns.tolist()
+        else:
+            missing_columns = [col for col in key_columns if col not in source_header.columns]
+            if missing_columns:
+                sheet_name = source_config.get("sheet_name", 0) if source_config else 0
+                raise InvalidColumnNameError(sheet_name, missing_columns)
+            hash_columns = key_columns
+
+        with tempfile.TemporaryDirectory(prefix="excelsage-compare-") as spill_directory:
+            _spill_compare_chunks(source_chunks, hash_columns, bucket_count, spill_directory, "source")
+            _spill_compare_chunks(target_chunks, hash_columns, bucket_count, spill_directory, "target")
+
+            differences = []
+            for bucket in range(bucket_count):
+                source_file = _spill_path(spill_directory, "source", bucket)
+                target_file = _spill_path(spill_directory, "target", bucket)
+                if not (os.path.exists(source_file) or os.path.exists(target_file)):
+                    continue
+                source_df = _load_spilled_frame(source_file, source_header)
+                target_df = _load_spilled_frame(target_file, target_header)
+                if key_columns is None:
+                    differences.append(_diff_rows(source_df, target_df))
+                else:
+                    differences.append(_diff_by_key(source_df, target_df, key_columns))
+    finally:
+        source_chunks.close()
+        target_chunks.close()
+
+    if not differences:
+        differences.append(
+            _diff_rows(source_header, target_header)
+            if key_columns is None
+            else _diff_by_key(source_header, target_header, key_columns)
+        )
+
+    if key_columns is not None:
+        # Buckets without differences hold empty frames, which would turn the concatenated columns into objects.
+        return {
+            name: pd.concat([bucket[name] for bucket in differences if len(bucket[name])] or [differences[0][name]])
+            .sort_index(kind="stable")
+            .reset_index(drop=True)
+            for name in ("added", "removed", "changed")
+        }
+
+    combined = pd.concat(differences)
+    origin = combined[combined.columns[-1]]
+    return pd.concat(
+        [combined[origin == "Source"].sort_index(kind="stable"), combined[origin == "Target"].sort_index(kind="stable")]
+    )
+
+
 class ExcelSage:
     """
     ExcelSage is a robust and user-friendly tool designed to streamline and enhance Excel file operations using Python.
@@ -211,22 +1122,49 @@ class ExcelSage:
 
     VALID_HORIZONTAL_ALIGNMENTS = ["left", "center", "right"]
     VALID_VERTICAL_ALIGNMENTS = ["top", "center", "bottom"]
+    VALID_AUTOSAVE_POLICIES = ["always", "on_commit", "on_close", "manual"]
+    VALID_OPEN_MODES = ["edit", "read"]
+
+    def __init__(self, workbook_cache_limit: Optional[int] = None) -> None:
+        """
+        ``workbook_cache_limit`` sets the memory budget, in megabytes, of the process-wide workbook cache used by
+        ``Open Workbook`` with ``cache=True``. The default budget is 512 MB. The cache is shared by every library
+        instance in the process: the first instance that sets a budget decides it, and later instances can only
+        raise it. A smaller budget is ignored with a warning.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage    workbook_cache_limit=1024
+        """
+        if workbook_cache_limit is not None:
+            self.__argument_type_checker({"workbook_cache_limit": [workbook_cache_limit, int]})
+            memory_limit = _WORKBOOK_CACHE.request_memory_limit(workbook_cache_limit * 1024 * 1024)
+            if memory_limit != workbook_cache_limit * 1024 * 1024:
+                logger.warn(
+                    f"Workbook cache limit of {workbook_cache_limit} MB ignored. The process-wide cache keeps its "
+                    f"limit of {memory_limit // (1024 * 1024)} MB, which can only be raised."
+                )
 
-    def __init__(self) -> None:
         self.workbooks = {}
         self.active_workbook_alias = None
         self.active_sheet = None
 
     @not_keyword
-    def __get_active_workbook(self) -> Workbook:
-        """Helper method to get the currently active workbook."""
+    def __get_active_workbook(self, for_write: bool = False) -> Workbook:
+        """
+        Helper method to get the currently active workbook. Mutating keywords pass ``for_write=True`` so that a
+        workbook opened in read mode is rejected before anything is changed.
+        """
         if self.active_workbook_alias is None:
             raise WorkbookNotOpenError()
         if self.active_workbook_alias not in self.workbooks:
             raise WorkbookNotOpenError(
                 f"Active workbook alias '{self.active_workbook_alias}' not found in open workbooks."
             )
-        return self.workbooks[self.active_workbook_alias]["workbook"]
+        entry = self.__get_workbook_entry()
+        if for_write and entry["read_only"]:
+            raise WorkbookReadOnlyError(entry["name"])
+        return entry["workbook"]
 
     @not_keyword
     def __get_active_workbook_name(self) -> str:
@@ -239,6 +1177,659 @@ class ExcelSage:
             )
         return self.workbooks[self.active_workbook_alias]["name"]
 
+    @not_keyword
+    def __get_workbook_entry(self, alias: Optional[str] = None) -> Dict[str, Any]:
+        """Helper method to get the bookkeeping entry of an open workbook, defaulting to the active one."""
+        if alias is None:
+            if self.active_workbook_alias is None:
+                raise WorkbookNotOpenError()
+            alias = self.active_workbook_alias
+        if alias not in self.workbooks:
+            raise WorkbookNotOpenError(f"Workbook with alias '{alias}' is not open.")
+
+        entry = self.workbooks[alias]
+        if entry["workbook"] is None:
+            entry["workbook"] = excel.load_workbook(entry["name"], **entry["load_kwargs"])
+        return entry
+
+    @not_keyword
+    def __release_workbook(self, entry: Dict[str, Any]) -> None:
+        """
+        Helper method to hand the loaded workbook of an entry over to a new owner, such as the entry of a file written
+        from it. Unsaved changes go along with the workbook; the entry loads its file again on next use.
+        """
+        entry["workbook"] = None
+        entry["dirty"] = False
+        entry["sheet_cache"].clear()
+
+    @not_keyword
+    def __register_workbook(
+        self,
+        alias: str,
+        workbook: Workbook,
+        workbook_name: str,
+        autosave: str = "always",
+        load_kwargs: Optional[Dict[str, Any]] = None,
+        read_only: bool = False,
+    ) -> None:
+        """Helper method to store an opened workbook together with its save bookkeeping."""
+        self.workbooks[alias] = {
+            "workbook": workbook,
+            "name": workbook_name,
+            "autosave": autosave,
+            "load_kwargs": load_kwargs or {},
+            "read_only": read_only,
+            "dirty": False,
+            "mutations": 0,
+            "in_transaction": False,
+            "snapshot": None,
+            "sheet_cache": {},
+        }
+
+    @not_keyword
+    def __validate_autosave_policy(self, autosave: str) -> None:
+        """Helper method to validate an autosave policy name."""
+        self.__argument_type_checker({"autosave": [autosave, str]})
+        if autosave not in self.VALID_AUTOSAVE_POLICIES:
+            raise ValueError(
+                f"Invalid autosave policy: '{autosave}'. Allowed values are {self.VALID_AUTOSAVE_POLICIES}."
+            )
+
+    @not_keyword
+    def __save_active_workbook(self) -> None:
+        """
+        Helper method called by every mutating keyword. It marks the active workbook dirty, bumps its mutation
+        counter and writes it to disk only when the autosave policy is ``always`` and no transaction is open.
+        """
+        entry = self.__get_workbook_entry()
+        entry["dirty"] = True
+        entry["mutations"] += 1
+
+        if entry["in_transaction"] or entry["autosave"] != "always":
+            return
+
+        entry["workbook"].save(entry["name"])
+        entry["dirty"] = False
+
+    @not_keyword
+    def __get_cached_sheet_stat(
+        self,
+        sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet],
+        key: Tuple[Any, ...],
+        compute: Callable[[], Any],
+        alias: Optional[str] = None,
+    ) -> Any:
+        """
+        Helper method to memoize a value derived from a sheet of the active workbook. The value is reused until the
+        sheet version changes; the version combines the workbook mutation counter, bumped by every mutating keyword,
+        with the number of stored cells. Edits made directly on the workbook object that only change the value of an
+        existing cell keep the version, so callers that act on a cached value must check it against the sheet.
+        ``alias`` selects another open workbook than the active one.
+        """
+        entry = self.__get_workbook_entry(alias)
+        version = (entry["mutations"], len(getattr(sheet, "_cells", ())))
+        cache_key = (sheet.title,) + key
+
+        cached = entry["sheet_cache"].get(cache_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        value = compute()
+        entry["sheet_cache"][cache_key] = (version, value)
+        return value
+
+    @not_keyword
+    def __set_cached_sheet_stat(
+        self, sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet], key: Tuple[Any, ...], value: Any
+    ) -> None:
+        """Helper method to store a value that was kept up to date by the caller under the current sheet version."""
+        entry = self.__get_workbook_entry()
+        version = (entry["mutations"], len(getattr(sheet, "_cells", ())))
+        entry["sheet_cache"][(sheet.title,) + key] = (version, value)
+
+    @not_keyword
+    def __get_value_index(
+        self,
+        sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet],
+        alias: Optional[str] = None,
+        rebuild: bool = False,
+    ) -> Dict[Any, List[Tuple[int, int]]]:
+        """
+        Helper method to get the value index of a sheet, which maps every non-empty cell value to the ``(row, column)``
+        positions holding it in row by row order. The index is built on first use and reused while the sheet is
+        unchanged, so repeated lookups cost the number of matches instead of a scan over the whole sheet.
+        ``rebuild=True`` discards the cached index first.
+        """
+        if rebuild:
+            self.__get_workbook_entry(alias)["sheet_cache"].pop((sheet.title, "value_index"), None)
+
+        def build() -> Dict[Any, List[Tuple[int, int]]]:
+            index = {}
+            if isinstance(sheet, ReadOnlyWorksheet):
+                min_col, min_row, max_col, max_row = self.__get_sheet_extent(sheet, alias)
+                rows = self.__iter_sheet_values(sheet, min_row, max_row, min_col, max_col)
+                for row_number, row in enumerate(rows, start=min_row):
+                    for column, value in enumerate(row, start=min_col):
+                        if value is not None:
+                            index.setdefault(value, []).append((row_number, column))
+                return index
+
+            for position, cell in sheet._cells.items():
+                if cell._value is not None:
+                    index.setdefault(cell._value, []).append(position)
+            for positions in index.values():
+                positions.sort()
+            return index
+
+        return self.__get_cached_sheet_stat(sheet, ("value_index",), build, alias)
+
+    @not_keyword
+    def __update_value_index(
+        self,
+        index: Dict[Any, List[Tuple[int, int]]],
+        old_value: Any,
+        new_value: Any,
+        positions: List[Tuple[int, int]],
+    ) -> None:
+        """Helper method to move replaced cell positions from ``old_value`` to ``new_value`` in a value index."""
+        if old_value is not None:
+            moved = set(positions)
+            remaining = [position for position in index.get(old_value, ()) if position not in moved]
+            if remaining:
+                index[old_value] = remaining
+            else:
+                index.pop(old_value, None)
+        if new_value is not None:
+            try:
+                index[new_value] = sorted(index.get(new_value, []) + positions)
+            except TypeError:
+                pass
+
+    @not_keyword
+    def __find_value_positions(
+        self,
+        sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet],
+        value: Any,
+        alias: Optional[str] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Helper method to get the ``(row, column)`` positions of the cells equal to ``value`` in row by row order.
+        Empty cells are not indexed, so looking for ``None`` scans the sheet from ``A1`` instead. On regular sheets
+        every indexed position is checked against the cell it points at, and the index is rebuilt when one of them no
+        longer holds ``value``, as after a direct edit through the workbook object.
+        """
+        if value is None:
+            _, _, max_col, max_row = self.__get_sheet_extent(sheet, alias)
+            rows = self.__iter_sheet_values(sheet, 1, max_row, 1, max_col)
+            return [
+                (row_number, column)
+                for row_number, row in enumerate(rows, start=1)
+                for column, cell_value in enumerate(row, start=1)
+                if cell_value is None
+            ]
+
+        try:
+            positions = list(self.__get_value_index(sheet, alias).get(value, ()))
+        except TypeError:
+            return []
+
+        if isinstance(sheet, ReadOnlyWorksheet):
+            return positions
+        cells = sheet._cells
+        if all(position in cells and cells[position]._value == value for position in positions):
+            return positions
+        return list(self.__get_value_index(sheet, alias, rebuild=True).get(value, ()))
+
+    @not_keyword
+    def __prepare_workbook_search(
+        self,
+        occurence: str,
+        aliases: List[Optional[str]],
+        sheet_names: Optional[List[str]] = None,
+    ) -> Tuple[str, List[Tuple[str, str]]]:
+        """Helper method to validate the arguments of the multi-sheet searches and list the sheets to search."""
+        self.__argument_type_checker(
+            {
+                "occurence": [occurence, str],
+                "sheet_names": [sheet_names, list, None],
+            }
+        )
+
+        occurence = occurence.lower().strip()
+        if occurence not in ["first", "all"]:
+            raise ValueError("Invalid occurence, use either 'first' or 'all'.")
+
+        targets = []
+        for alias in aliases:
+            self.__get_workbook_entry(alias)
+            alias = self.active_workbook_alias if alias is None else alias
+            workbook = self.workbooks[alias]["workbook"]
+            for sheet_name in workbook.sheetnames if sheet_names is None else sheet_names:
+                if sheet_name not in workbook.sheetnames:
+                    raise SheetDoesntExistsError(sheet_name)
+                targets.append((alias, sheet_name))
+
+        return occurence, targets
+
+    @not_keyword
+    def __search_workbooks(
+        self, value: Any, occurence: str, targets: List[Tuple[str, str]]
+    ) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Helper method behind the multi-sheet searches. The ``(alias, sheet name)`` targets are searched one after
+        the other through their value indexes, which are built on first use and reused by later searches. With
+        ``first`` the search stops at the earliest target in the given order that holds the value.
+        """
+        results = {}
+        for alias, sheet_name in targets:
+            sheet = self.workbooks[alias]["workbook"][sheet_name]
+            positions = self.__find_value_positions(sheet, value, alias)
+            if not positions:
+                continue
+            if occurence == "first":
+                positions = positions[:1]
+            results.setdefault(alias, {})[sheet_name] = [
+                f"{get_column_letter(column)}{row}" for row, column in positions
+            ]
+            if occurence == "first":
+                break
+
+        return results
+
+    @not_keyword
+    def __get_sheet_columns(
+        self, sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet]
+    ) -> List[pd.Series]:
+        """
+        Helper method to get a columnar snapshot of a sheet from ``A1`` to the end of its used range, as one
+        ``object`` Series per column with empty cells as ``None``. The snapshot is reused while the sheet is unchanged.
+        """
+
+        def build() -> List[pd.Series]:
+            _, _, max_col, max_row = self.__get_sheet_extent(sheet)
+            rows = self.__iter_sheet_values(sheet, 1, max_row, 1, max_col)
+            return [pd.Series(values, dtype=object) for values in zip(*rows)]
+
+        return self.__get_cached_sheet_stat(sheet, ("columns",), build)
+
+    @not_keyword
+    def __get_sheet_extent(
+        self, sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet], alias: Optional[str] = None
+    ) -> Tuple[int, int, int, int]:
+        """
+        Helper method to get the ``(min_col, min_row, max_col, max_row)`` bounds of a sheet. The bounds are computed
+        once per sheet version, read-only sheets that lack a stored dimension are sized by scanning them.
+        """
+        if isinstance(sheet, ReadOnlyWorksheet):
+            compute = lambda: range_boundaries(sheet.calculate_dimension(force=True))
+        else:
+            compute = lambda: range_boundaries(sheet.calculate_dimension())
+        return self.__get_cached_sheet_stat(sheet, ("extent",), compute, alias)
+
+    @not_keyword
+    def __get_sheet_dimensions(self, sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet]) -> str:
+        """Helper method to get the used range of a sheet as a range string such as ``A1:H51``."""
+        min_col, min_row, max_col, max_row = self.__get_sheet_extent(sheet)
+        return f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}"
+
+    @not_keyword
+    def __count_sheet_rows(
+        self,
+        sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet],
+        start_row: int,
+        start_col: int,
+        ignore_empty_rows: bool,
+    ) -> Tuple[Optional[int], int]:
+        """
+        Helper method behind ``Get Row Count``. It returns the header row, which is the first non-empty row from
+        ``start_row`` on, and the number of data rows below it up to the end of the sheet, without building a
+        DataFrame. Without ``ignore_empty_rows`` the count follows from the sheet extent once the header is found;
+        otherwise the non-empty rows are collected in a single pass over the stored cells.
+        """
+        _, _, max_col, max_row = self.__get_sheet_extent(sheet)
+
+        if start_row > max_row:
+            return None, 0
+        if start_col > max_col:
+            return None, 0 if ignore_empty_rows else max_row - start_row
+
+        if isinstance(sheet, ReadOnlyWorksheet):
+            header_row = None
+            row_count = 0
+            rows = self.__iter_sheet_values(sheet, start_row, max_row, start_col, max_col)
+            for row_number, row in enumerate(rows, start=start_row):
+                if not any(value is not None for value in row):
+                    continue
+                if header_row is None:
+                    header_row = row_number
+                    if not ignore_empty_rows:
+                        return header_row, max_row - header_row
+                else:
+                    row_count += 1
+            return header_row, row_count
+
+        if not ignore_empty_rows:
+            get_cell = sheet._cells.get
+            columns = range(start_col, max_col + 1)
+            for row_number in range(start_row, max_row + 1):
+                for column in columns:
+                    cell = get_cell((row_number, column))
+                    if cell is not None and cell._value is not None:
+                        return row_number, max_row - row_number
+            return None, 0
+
+        filled_rows = {
+            row_number
+            for (row_number, column), cell in sheet._cells.items()
+            if row_number >= start_row and column >= start_col and cell._value is not None
+        }
+        if not filled_rows:
+            return None, 0
+        return min(filled_rows), len(filled_rows) - 1
+
+    @not_keyword
+    def __iter_sheet_values(
+        self,
+        sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet],
+        min_row: int,
+        max_row: int,
+        min_col: int,
+        max_col: int,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Helper method to read the values of a cell block row by row without creating ``Cell`` objects."""
+        return _iter_sheet_values(sheet, min_row, max_row, min_col, max_col)
+
+    @not_keyword
+    def __write_sheet_values(
+        self,
+        sheet: excel.worksheet.worksheet.Worksheet,
+        rows: List[Union[List[Any], Tuple[Any, ...]]],
+        min_row: int,
+        min_col: int,
+    ) -> Tuple[int, int]:
+        """
+        Helper method to write a block of values row by row, starting at ``min_row``/``min_col``. Values go straight
+        into the worksheet's cell store: existing cells keep their style and get the new value, missing cells are
+        created only for values that are not ``None``. Later appends start below the block. Returns the last row and
+        column of the block.
+        """
+        max_row = min_row + len(rows) - 1
+        max_col = min_col + max((len(row) for row in rows), default=0) - 1
+        if max_row > 1048576:
+            raise InvalidRowIndexError(max_row)
+        if max_col > 16384:
+            raise InvalidColumnIndexError(max_col)
+
+        cells = sheet._cells
+        get_cell = cells.get
+        for row_number, row in enumerate(rows, start=min_row):
+            for column, value in enumerate(row, start=min_col):
+                cell = get_cell((row_number, column))
+                if cell is not None:
+                    cell.value = value
+                elif value is not None:
+                    cells[(row_number, column)] = Cell(sheet, row=row_number, column=column, value=value)
+
+        # Keep the append position past the block, as the worksheet does for cells it adds itself.
+        sheet._current_row = max(sheet._current_row, max_row)
+        return max_row, max_col
+
+    @not_keyword
+    def __parse_index_ranges(self, indices: Union[int, str, List[Union[int, str]]], axis: str) -> List[int]:
+        """
+        Helper method to turn row or column selections into a sorted list of unique indices. An item is an index, a
+        range such as ``5:10``, or for columns a letter or letter range such as ``B:D``.
+        """
+        limit, error = (1048576, InvalidRowIndexError) if axis == "row" else (16384, InvalidColumnIndexError)
+
+        def to_index(value: Union[int, str]) -> int:
+            if isinstance(value, str):
+                value = value.strip()
+                if value.isdigit():
+                    value = int(value)
+                elif axis == "column" and value.isalpha():
+                    try:
+                        value = column_index_from_string(value.upper())
+                    except ValueError:
+                        raise error(value)
+                else:
+                    raise error(value)
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1 or value > limit:
+                raise error(value)
+            return value
+
+        selected = set()
+        for item in indices if isinstance(indices, list) else [indices]:
+            if isinstance(item, str) and ":" in item:
+                start, _, end = item.partition(":")
+                start, end = sorted((to_index(start), to_index(end)))
+            else:
+                start = end = to_index(item)
+            selected.update(range(start, end + 1))
+        return sorted(selected)
+
+    @not_keyword
+    def __remove_sheet_lines(
+        self,
+        sheet: excel.worksheet.worksheet.Worksheet,
+        removed: List[int],
+        axis: str,
+        span: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """
+        Helper method to delete whole rows or columns in a single pass over the stored cells. Cells on a removed line
+        are dropped and every other cell moves up or left by the number of removed lines before it, so the cost
+        does not grow with the number of removed lines the way repeated ``delete_rows`` calls do. With ``span``, a
+        pair of first and last column (or row) indices, only the cells within it are removed or moved.
+        """
+        position = 0 if axis == "row" else 1
+        first, last = span if span is not None else (1, 1048576)
+        cells = {}
+        for key, cell in sheet._cells.items():
+            if not first <= key[1 - position] <= last:
+                cells[key] = cell
+                continue
+            index = key[position]
+            shift = bisect.bisect_left(removed, index)
+            if shift < len(removed) and removed[shift] == index:
+                continue
+            if shift:
+                if position == 0:
+                    cell.row = index - shift
+                    key = (cell.row, key[1])
+                else:
+                    cell.column = index - shift
+                    key = (key[0], cell.column)
+            cells[key] = cell
+        sheet._cells = cells
+
+    @not_keyword
+    def __get_table_column_names(self, header: Tuple[Any, ...], start_col: int) -> List[Any]:
+        """
+        Helper method to turn a header row into the column names ``pandas.read_excel`` would use: trailing blank
+        headers are dropped, blank headers are named ``Unnamed: n`` and repeated headers get a ``.n`` suffix.
+        """
+        header = list(header)
+        while header and header[-1] is None:
+            header.pop()
+
+        names = []
+        seen = {}
+        for offset, value in enumerate(header):
+            name = f"Unnamed: {start_col + offset - 1}" if value is None or value == "" else value
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            names.append(name)
+        return names
+
+    @not_keyword
+    def __get_headers_to_fetch(
+        self, first_row: Tuple[Any, ...], column_names_or_letters: List[str], sheet_name: str
+    ) -> List[str]:
+        """
+        Helper method to resolve column names or letters against the header row of a table. A letter is only accepted
+        when every header of the row is a string, as ``Sort Column`` does, and stands for the header above it.
+        """
+        headers_to_fetch = []
+        for col in column_names_or_letters:
+            if isinstance(col, str) and col in first_row:
+                headers_to_fetch.append(col)
+            elif col.isalpha() and len(col) < 4:
+                col_index = column_index_from_string(col)
+                if col_index - 1 < len(first_row):
+                    for header in first_row:
+                        if not isinstance(header, str):
+                            raise ValueError(
+                                f"{sheet_name} does not have a valid string header: '{header}' found."
+                            )
+                    headers_to_fetch.append(first_row[col_index - 1])
+                else:
+                    raise ValueError(
+                        f"Column letter '{col}' is out of bounds for the provided sheet."
+                    )
+            else:
+                raise ValueError(f"Invalid column name or letter: '{col}'")
+        return headers_to_fetch
+
+    @not_keyword
+    def __find_duplicate_rows(
+        self,
+        sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet],
+        first_row: int,
+        min_col: int,
+        max_col: int,
+        key_offsets: Optional[List[int]] = None,
+        include_first: bool = False,
+        trim_empty_rows: bool = True,
+    ) -> List[int]:
+        """
+        Helper method to find the duplicate rows of the block that starts at ``first_row`` and spans ``min_col`` to
+        ``max_col``. Rows are compared on the values at ``key_offsets`` within the block, or on the whole block row.
+        It returns the duplicate row numbers in sheet order, without the first occurrence of each key unless
+        ``include_first`` is set. With ``trim_empty_rows`` trailing rows without any value are left out, as
+        ``pandas.read_excel`` does.
+
+        The rows are streamed instead of loaded as a whole. The first pass keeps one 64-bit hash per distinct key and
+        notes the hashes seen more than once. Only if there are any, a second pass compares the exact keys of the
+        rows carrying those hashes, so a hash collision never reports distinct rows as duplicates. Memory grows with
+        the number of distinct keys and duplicates rather than with the size of the sheet.
+        """
+        max_row = self.__get_sheet_extent(sheet)[3]
+
+        def iter_keys(last_row: int) -> Iterator[Tuple[int, Tuple[Any, ...], Tuple[Any, ...]]]:
+            rows = self.__iter_sheet_values(sheet, first_row, last_row, min_col, max_col)
+            for row_number, row in enumerate(rows, start=first_row):
+                key = row if key_offsets is None else tuple(row[offset] for offset in key_offsets)
+                yield row_number, row, key
+
+        seen_hashes = set()
+        repeated_hashes = set()
+        last_row = max_row if not trim_empty_rows else first_row - 1
+        for row_number, row, key in iter_keys(max_row):
+            key_hash = hash(key)
+            if key_hash in seen_hashes:
+                repeated_hashes.add(key_hash)
+            else:
+                seen_hashes.add(key_hash)
+            if trim_empty_rows and any(value is not None and value != "" for value in row):
+                last_row = row_number
+        del seen_hashes
+
+        if not repeated_hashes:
+            return []
+
+        first_rows = {}
+        duplicate_rows = []
+        for row_number, _, key in iter_keys(last_row):
+            if hash(key) not in repeated_hashes:
+                continue
+            first = first_rows.setdefault(key, [row_number, False])
+            if first[0] != row_number:
+                first[1] = True
+                duplicate_rows.append(row_number)
+
+        if include_first:
+            duplicate_rows.extend(first for first, has_duplicates in first_rows.values() if has_duplicates)
+            duplicate_rows.sort()
+        return duplicate_rows
+
+    @not_keyword
+    def __find_empty_rows(
+        self,
+        sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet],
+        first_row: int,
+        min_col: int,
+        max_col: int,
+        check_offsets: Iterable[int],
+    ) -> List[int]:
+        """
+        Helper method to find the empty rows of the block that starts at ``first_row`` and spans ``min_col`` to
+        ``max_col``. A row is empty when every value at ``check_offsets`` within the block is ``None`` or an empty
+        string. The rows are streamed once, up to the last row that has a cell within the block; rows further down
+        that only hold cells in other columns are left alone.
+        """
+        max_row = self.__get_sheet_extent(sheet)[3]
+        if not isinstance(sheet, ReadOnlyWorksheet):
+            max_row = max((row for row, column in sheet._cells if min_col <= column <= max_col), default=0)
+        check_offsets = list(check_offsets)
+
+        rows = self.__iter_sheet_values(sheet, first_row, max_row, min_col, max_col)
+        return [
+            row_number
+            for row_number, row in enumerate(rows, start=first_row)
+            if not any(row[offset] is not None and row[offset] != "" for offset in check_offsets)
+        ]
+
+    @not_keyword
+    def __sheet_to_dataframe(
+        self,
+        sheet: Union[excel.worksheet.worksheet.Worksheet, ReadOnlyWorksheet],
+        header_row: int,
+        start_col: int = 1,
+        columns: Optional[List[Any]] = None,
+        row_numbers: Optional[List[int]] = None,
+    ) -> DataFrame:
+        """
+        Helper method to build a DataFrame straight from a loaded worksheet instead of re-reading the file from disk.
+
+        The table starts at ``header_row``/``start_col`` and spans the header columns. The frame has the same shape
+        ``pandas.read_excel`` returns: blank headers are named ``Unnamed: n``, repeated headers get a ``.n`` suffix,
+        trailing empty rows are dropped and the cells are converted and parsed the way ``pandas.read_excel`` parses
+        them, so empty cells are ``NaN`` and whole-number columns with blanks are floats. ``columns`` limits the frame
+        to the given headers, kept in sheet order, and ``row_numbers`` limits it to the given sheet rows. The rows are
+        picked after parsing, so their dtypes are inferred from the whole columns, as if the frame had been sliced.
+        """
+        max_col, max_row = range_boundaries(self.__get_sheet_dimensions(sheet))[2:]
+        rows = self.__iter_sheet_values(
+            sheet, header_row, max(max_row, header_row), start_col, max(max_col, start_col)
+        )
+        names = self.__get_table_column_names(next(rows, ()), start_col)
+        width = len(names)
+
+        data = []
+        data_length = 0
+        for row in rows:
+            data.append([_convert_sheet_value(value) for value in row[:width]])
+            if any(value is not None and value != "" for value in row):
+                data_length = len(data)
+        del data[data_length:]
+
+        if data and names:
+            df = TextParser(data, header=None, names=names, skip_blank_lines=False).read()
+        else:
+            df = pd.DataFrame(columns=names)
+
+        if row_numbers is not None:
+            df = df.iloc[[row_number - header_row - 1 for row_number in row_numbers]]
+
+        if columns is not None:
+            df = df[[name for name in names if name in columns]]
+
+        return df
+
     @not_keyword
     def __get_active_sheet_name(self, sheet_name: Optional[str] = None) -> str:
         """Helper method to get the currently active sheet name."""
@@ -282,6 +1873,23 @@ class ExcelSage:
     def __get_column_values_by_name_or_letter(
         self, sheet: excel.worksheet.worksheet.Worksheet, column_name_or_letter: str
     ) -> List[Any]:
+        column_index = self.__get_column_index_by_name_or_letter(sheet, column_name_or_letter)
+        column_values = [
+            row[0]
+            for row in sheet.iter_rows(
+                min_row=2,
+                min_col=column_index,
+                max_col=column_index,
+                values_only=True,
+            )
+        ]
+        return column_values
+
+    @not_keyword
+    def __get_column_index_by_name_or_letter(
+        self, sheet: excel.worksheet.worksheet.Worksheet, column_name_or_letter: str
+    ) -> int:
+        """Helper method to resolve a header name in the first row, or a column letter, to a column index."""
         self.__argument_type_checker(
             {"column_name_or_letter": [column_name_or_letter, str]}
         )
@@ -300,26 +1908,41 @@ class ExcelSage:
             raise ValueError(
                 f"Column '{column_name_or_letter}' is out of bounds for the provided sheet."
             )
-
-        column_values = next(
-            sheet.iter_cols(
-                min_col=column_index,
-                max_col=column_index,
-                min_row=2,
-                values_only=True,
-            )
-        )
-        return list(column_values)
+        return column_index
 
     @keyword
     def open_workbook(
-        self, workbook_name: str, alias: Optional[str] = None, **kwargs
+        self,
+        workbook_name: str,
+        alias: Optional[str] = None,
+        autosave: str = "always",
+        mode: str = "edit",
+        cache: bool = False,
+        **kwargs,
     ) -> Workbook:
         """
         The ``Open Workbook`` keyword opens an Excel file by its name, checks if the file exists, and raises an ``ExcelFileNotFoundError`` if it doesn't. It uses openpyxl's ``load_workbook`` to load the workbook, allowing additional options via ``**kwargs``. Once the workbook is opened, it is stored with an optional alias and set as the active workbook if it's the first one opened. The keyword returns the loaded workbook object for further use.
 
         If no alias is provided, the workbook name (file path) will be used as the alias. If an alias is provided and already exists, it will raise a ``SheetAlreadyExistsError``.
 
+        The ``autosave`` policy controls when changes made by the mutating keywords are written to disk:
+        - ``always`` (default): after every mutating keyword, or on commit inside a ``Begin Workbook Transaction`` block.
+        - ``on_commit``: only when ``Commit Workbook Transaction`` is called.
+        - ``on_close``: only when the workbook is closed with ``Close Workbook``.
+        - ``manual``: only when ``Save Workbook`` is called.
+
+        With ``mode=read`` the workbook is opened with openpyxl's read-only streaming worksheets: cells are parsed
+        lazily while they are read instead of all at once, which keeps opening large files fast and memory usage
+        low. The read keywords (``Fetch Sheet Data``, ``Get Cell Value``, ``Get Row Values``, ``Find Value``, the
+        ``Should`` assertions, ...) work as usual, while mutating keywords raise a ``WorkbookReadOnlyError``.
+        Passing ``read_only=True`` has the same effect.
+
+        With ``cache=True`` (read mode only) the fully parsed workbook is kept in a process-wide cache keyed by the
+        file path, modification time, size and load options, and the next ``Open Workbook`` of the same file builds
+        its workbook from the cache instead of parsing the file again. Every open gets its own copy, so changes made
+        through the returned workbook object never reach other aliases. Use ``Get Workbook Cache Stats`` and
+        ``Clear Workbook Cache`` to inspect and reset the cache.
+
         *Examples*
         | ***** Settings *****
         | Library    ExcelSage
@@ -329,11 +1952,33 @@ class ExcelSage:
         |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
         |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx     alias=source
         |   Open Workbook     workbook_name=\\path\\to\\excel\\file2.xlsx     alias=target
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx     autosave=on_close
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\big_export.xlsx     alias=export     mode=read
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\reference.xlsx     mode=read     cache=True
         |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx     read_only=False     keep_vba=True     rich_text=False
         """
         if not os.path.exists(workbook_name):
             raise ExcelFileNotFoundError(workbook_name)
-        self.__argument_type_checker({"workbook_name": [workbook_name, str]})
+        self.__argument_type_checker(
+            {
+                "workbook_name": [workbook_name, str],
+                "mode": [mode, str],
+                "cache": [cache, bool],
+            }
+        )
+        self.__validate_autosave_policy(autosave)
+
+        if mode not in self.VALID_OPEN_MODES:
+            raise ValueError(
+                f"Invalid open mode: '{mode}'. Allowed values are {self.VALID_OPEN_MODES}."
+            )
+
+        if mode == "read":
+            kwargs["read_only"] = True
+        read_only = bool(kwargs.get("read_only", False))
+
+        if cache and not read_only:
+            raise ValueError("Only workbooks opened with mode=read can be served from the workbook cache.")
 
         if alias is None:
             alias = workbook_name
@@ -343,9 +1988,16 @@ class ExcelSage:
                 f"A workbook with alias '{alias}' is already open. Use a different alias or close it first."
             )
 
-        workbook = excel.load_workbook(filename=workbook_name, **kwargs)
+        if cache:
+            # The cache keeps fully parsed workbooks, so they are loaded without openpyxl's read-only mode.
+            cache_kwargs = {name: value for name, value in kwargs.items() if name != "read_only"}
+            workbook = _WORKBOOK_CACHE.get_or_load(workbook_name, cache_kwargs)
+        else:
+            workbook = excel.load_workbook(filename=workbook_name, **kwargs)
 
-        self.workbooks[alias] = {"workbook": workbook, "name": workbook_name}
+        self.__register_workbook(
+            alias, workbook, workbook_name, autosave, kwargs, read_only
+        )
 
         if self.active_workbook_alias is None:
             self.active_workbook_alias = alias
@@ -360,12 +2012,23 @@ class ExcelSage:
         self,
         workbook_name: str,
         overwrite_if_exists: bool = False,
-        sheet_data: List[List[Any]] = None,
+        sheet_data: Optional[Iterable[List[Any]]] = None,
         alias: Optional[str] = None,
-    ) -> Workbook:
+        autosave: str = "always",
+        write_only: bool = False,
+        load_after_create: bool = True,
+    ) -> Optional[Workbook]:
         """
         The ``Create Workbook`` keyword creates a new Excel workbook with the option to write data into the first sheet during the creation process. It also includes an option to overwrite the file if needed.
 
+        The ``autosave`` policy of the created workbook works the same way as in ``Open Workbook``.
+
+        With ``write_only=True`` the file is written through an openpyxl write-only worksheet: each row of
+        ``sheet_data``, which may also be a generator, is streamed to disk as it is produced, so memory stays flat
+        however many rows are written. By default the new file is then loaded and opened for further use. Set
+        ``load_after_create=False`` when only the file on disk is needed; the workbook is not opened and the keyword
+        returns ``None``.
+
         *Examples*
         | ***** Settings *****
         | Library    ExcelSage
@@ -383,17 +2046,25 @@ class ExcelSage:
         | Example
         |   ${data}     Prepare Sheet Data
         |   Create Workbook     workbook_name=\\path\\to\\excel\\file.xlsx   overwrite_if_exists=True    sheet_data=${data}
+        |   Create Workbook     workbook_name=\\path\\to\\excel\\export.xlsx   sheet_data=${data}    write_only=True    load_after_create=False
         |   ${all_sheets}   Get Sheets
         |   Rename Sheet    old_name=${all_sheets}[0]    new_name=NewSheet
         |   Close Workbook
         """
-        self.__argument_type_checker({"workbook_name": [workbook_name, str]})
+        self.__argument_type_checker(
+            {
+                "workbook_name": [workbook_name, str],
+                "write_only": [write_only, bool],
+                "load_after_create": [load_after_create, bool],
+            }
+        )
+        self.__validate_autosave_policy(autosave)
 
         if not overwrite_if_exists and os.path.exists(workbook_name):
             raise FileAlreadyExistsError(workbook_name)
 
-        workbook = Workbook()
-        sheet = workbook.active
+        workbook = Workbook(write_only=write_only)
+        sheet = workbook.create_sheet() if write_only else workbook.active
 
         if sheet_data:
             for index, row in enumerate(sheet_data):
@@ -406,6 +2077,10 @@ class ExcelSage:
         workbook.save(workbook_name)
         workbook.close()
 
+        if not load_after_create:
+            logger.info(f"Workbook '{workbook_name}' created.")
+            return None
+
         if alias is None:
             alias = workbook_name
 
@@ -416,7 +2091,7 @@ class ExcelSage:
 
         loaded_workbook = excel.load_workbook(filename=workbook_name)
 
-        self.workbooks[alias] = {"workbook": loaded_workbook, "name": workbook_name}
+        self.__register_workbook(alias, loaded_workbook, workbook_name, autosave)
 
         if self.active_workbook_alias is None:
             self.active_workbook_alias = alias
@@ -477,7 +2152,7 @@ class ExcelSage:
         |   ${newly_added_sheet}     Add Sheet     sheet_name=Sheet1     sheet_pos=1
         |   ${newly_added_sheet}     Add Sheet     sheet_name=Sheet2    sheet_data=${sheet_data}
         """
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
 
         self.__argument_type_checker(
             {
@@ -506,7 +2181,7 @@ class ExcelSage:
                     )
                 sheet.append(row)
 
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Sheet '{sheet_name}' added successfully")
         return sheet_name
 
@@ -525,10 +2200,10 @@ class ExcelSage:
         |   ${deleted_sheet}     Delete Sheet     sheet_name=Sheet1
         """
         sheet_name = self.__get_active_sheet_name(sheet_name)
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet_to_delete = active_workbook[sheet_name]
         active_workbook.remove(sheet_to_delete)
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Sheet '{sheet_name}' deleted successfully")
         return sheet_name
 
@@ -540,7 +2215,8 @@ class ExcelSage:
         ignore_empty_columns: bool = False,
         starting_cell: str = "A1",
         output_format: str = "list",
-    ) -> Union[List[Any], Dict[Any, Any], DataFrame]:
+        chunk_size: Optional[int] = None,
+    ) -> Union[List[Any], Dict[Any, Any], DataFrame, Iterator[Union[List[Any], DataFrame]]]:
         """
         The ``Fetch Sheet Data`` keyword retrieves data from a specified sheet in the active workbook. If no sheet
         name is provided, it defaults to the active sheet. The keyword takes an optional ``output_format`` parameter,
@@ -551,6 +2227,11 @@ class ExcelSage:
 
         If an invalid format is provided, a ``ValueError`` is raised.
 
+        When ``chunk_size`` is given, the keyword returns an iterator of row batches instead of the whole sheet. Each
+        batch holds at most ``chunk_size`` data rows in the requested ``output_format`` and rows are only read from
+        the sheet when the next batch is requested (see ``iter_sheet_data``). ``ignore_empty_columns`` cannot be
+        combined with ``chunk_size``, because empty columns are only known once the whole sheet has been read.
+
         *Examples*
         | ***** Settings *****
         | Library    ExcelSage
@@ -560,10 +2241,105 @@ class ExcelSage:
         |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
         |   ${fecthed_data}     Fetch Sheet Data     output_format=dataframe    starting_cell=C10   ignore_empty_rows=True
         |   ${fetched_data}     Fetch Sheet Data     sheet_name=Sheet1     output_format=dataframe      ignore_empty_columns=True
+        |   ${chunks}     Fetch Sheet Data     sheet_name=Sheet1     output_format=dict     chunk_size=10000
+        |   FOR    ${chunk}    IN    @{chunks}
+        |       Log    ${chunk}
+        |   END
+        """
+        if chunk_size is not None:
+            return self.iter_sheet_data(
+                sheet_name=sheet_name,
+                chunk_size=chunk_size,
+                ignore_empty_rows=ignore_empty_rows,
+                ignore_empty_columns=ignore_empty_columns,
+                starting_cell=starting_cell,
+                output_format=output_format,
+            )
+
+        sheet_name = self.__get_active_sheet_name(sheet_name)
+        self.__argument_type_checker(
+            {
+                "output_format": [output_format, str],
+                "ignore_empty_columns": [ignore_empty_columns, bool],
+                "ignore_empty_rows": [ignore_empty_rows, bool],
+                "starting_cell": [starting_cell, str],
+            }
+        )
+
+        if output_format.lower().strip() not in ["list", "dict", "dataframe"]:
+            raise ValueError(
+                "Invalid output format. Use 'list', 'dict', or 'dataframe'."
+            )
+
+        try:
+            range_boundaries(starting_cell)
+        except ValueError:
+            raise InvalidCellAddressError(starting_cell)
+
+        active_workbook = self.__get_active_workbook()
+        sheet = active_workbook[sheet_name]
+        min_col, min_row = range_boundaries(starting_cell)[:2]
+        max_col, max_row = range_boundaries(self.__get_sheet_dimensions(sheet))[2:]
+        data_list = self.__iter_sheet_values(sheet, min_row, max_row, min_col, max_col)
+
+        new_data = []
+        valid_row_found = False
+
+        for row in data_list:
+            if not valid_row_found:
+                if len(set(row)) == 1 and None in set(row):
+                    continue
+                else:
+                    valid_row_found = True
+            new_data.append(row)
+
+        headers = new_data[0] if new_data else None
+        data = new_data[1:] if len(new_data) > 1 else []
+
+        df = pd.DataFrame(data, columns=headers)
+
+        if ignore_empty_rows:
+            df.dropna(how="all", inplace=True)
+
+        if ignore_empty_columns:
+            df.dropna(axis=1, how="all", inplace=True)
+
+        if output_format == "list":
+            return df.values.tolist()
+        elif output_format == "dict":
+            return df.to_dict(orient="records")
+        elif output_format == "dataframe":
+            return df.reset_index(drop=True)
+
+    @not_keyword
+    def iter_sheet_data(
+        self,
+        sheet_name: Optional[str] = None,
+        chunk_size: int = 10000,
+        ignore_empty_rows: bool = False,
+        ignore_empty_columns: bool = False,
+        starting_cell: str = "A1",
+        output_format: str = "list",
+    ) -> Iterator[Union[List[Any], DataFrame]]:
+        """
+        Lazily yields the data of a sheet in batches of at most ``chunk_size`` rows, so that sheets larger than
+        memory can be processed batch by batch. Rows are read from the sheet while the batches are consumed; leading
+        empty rows are skipped and the first non-empty row is used as header, like in ``Fetch Sheet Data``. In
+        ``mode=read`` the rows are streamed from the file, so memory stays bounded by the batch. In edit mode the
+        whole sheet is already loaded with the workbook and only the batches themselves are bounded.
+
+        Each batch is a list of lists (``list``), a list of dictionaries (``dict``) or a DataFrame (``dataframe``).
+        DataFrame batches are indexed by their position in the sheet data, so ``pd.concat`` of all batches holds the
+        same rows as ``Fetch Sheet Data``; column dtypes are inferred per batch. ``ignore_empty_columns`` is not supported and raises a ``ValueError``.
+
+        Example:
+            for chunk in excel_sage.iter_sheet_data(sheet_name="Sheet1", chunk_size=50000, output_format="dataframe"):
+                process(chunk)
         """
         sheet_name = self.__get_active_sheet_name(sheet_name)
         self.__argument_type_checker(
             {
+                "chunk_size": [chunk_size, int],
                 "output_format": [output_format, str],
                 "ignore_empty_columns": [ignore_empty_columns, bool],
                 "ignore_empty_rows": [ignore_empty_rows, bool],
@@ -571,49 +2347,84 @@ class ExcelSage:
             }
         )
 
-        if output_format.lower().strip() not in ["list", "dict", "dataframe"]:
+        if isinstance(chunk_size, bool) or chunk_size < 1:
+            raise ValueError(f"Invalid chunk size: {chunk_size}. It must be a positive integer.")
+
+        if ignore_empty_columns:
+            raise ValueError(
+                "'ignore_empty_columns' cannot be combined with 'chunk_size', because empty columns are only known "
+                "once the whole sheet has been read."
+            )
+
+        output_format = output_format.lower().strip()
+        if output_format not in ["list", "dict", "dataframe"]:
             raise ValueError(
                 "Invalid output format. Use 'list', 'dict', or 'dataframe'."
             )
 
         try:
-            range_boundaries(starting_cell)
+            min_col, min_row, _, _ = range_boundaries(starting_cell)
         except ValueError:
             raise InvalidCellAddressError(starting_cell)
 
-        active_workbook = self.__get_active_workbook()
-        sheet = active_workbook[sheet_name]
-        data = sheet[starting_cell : sheet.dimensions.split(":")[-1]]
-        data_list = [[cell.value for cell in row] for row in data]
+        sheet = self.__get_active_workbook()[sheet_name]
+        max_col, max_row = range_boundaries(self.__get_sheet_dimensions(sheet))[2:]
 
-        new_data = []
-        valid_row_found = False
+        rows = self.__iter_sheet_values(
+            sheet, min_row, max(max_row, min_row), min_col, max(max_col, min_col)
+        )
+        return self.__generate_sheet_chunks(rows, chunk_size, ignore_empty_rows, output_format)
 
-        for row in data_list:
-            if not valid_row_found:
-                if len(set(row)) == 1 and None in set(row):
+    @not_keyword
+    def __generate_sheet_chunks(
+        self,
+        rows: Iterator[Tuple[Any, ...]],
+        chunk_size: int,
+        ignore_empty_rows: bool,
+        output_format: str,
+    ) -> Iterator[Union[List[Any], DataFrame]]:
+        """Helper generator behind ``iter_sheet_data`` that turns a row iterator into formatted batches."""
+        headers = None
+        batch = []
+        position = 0
+
+        for row in rows:
+            if headers is None:
+                if all(value is None for value in row):
                     continue
-                else:
-                    valid_row_found = True
-            new_data.append(row)
+                headers = row
+                continue
 
-        headers = new_data[0] if new_data else None
-        data = new_data[1:] if len(new_data) > 1 else []
+            if ignore_empty_rows and all(value is None for value in row):
+                continue
 
-        df = pd.DataFrame(data, columns=headers)
+            batch.append(row)
+            if len(batch) == chunk_size:
+                yield self.__format_sheet_chunk(batch, headers, position, output_format)
+                position += len(batch)
+                batch = []
 
-        if ignore_empty_rows:
-            df.dropna(how="all", inplace=True)
+        if batch:
+            yield self.__format_sheet_chunk(batch, headers, position, output_format)
 
-        if ignore_empty_columns:
-            df.dropna(axis=1, how="all", inplace=True)
+    @not_keyword
+    def __format_sheet_chunk(
+        self,
+        batch: List[Tuple[Any, ...]],
+        headers: Tuple[Any, ...],
+        position: int,
+        output_format: str,
+    ) -> Union[List[Any], DataFrame]:
+        """Helper method to convert a batch of sheet rows into the requested output format."""
+        df = pd.DataFrame(
+            batch, columns=headers, index=range(position, position + len(batch))
+        )
 
         if output_format == "list":
             return df.values.tolist()
         elif output_format == "dict":
             return df.to_dict(orient="records")
-        elif output_format == "dataframe":
-            return df.reset_index(drop=True)
+        return df
 
     @keyword
     def rename_sheet(self, old_name: str, new_name: str) -> None:
@@ -634,7 +2445,7 @@ class ExcelSage:
         |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
         |   ${renamed_sheet}     Rename Sheet     old_name=Sheet1     new_name=New_Sheet
         """
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
 
         self.__argument_type_checker(
             {"old_name": [old_name, str], "new_name": [new_name, str]}
@@ -648,7 +2459,7 @@ class ExcelSage:
 
         sheet = active_workbook[old_name]
         sheet.title = new_name
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Sheet '{old_name}' renamed to '{new_name}'")
         return new_name
 
@@ -687,7 +2498,9 @@ class ExcelSage:
             raise InvalidCellAddressError(cell_name)
 
     @keyword
-    def close_workbook(self, alias: Optional[str] = None) -> None:
+    def close_workbook(
+        self, alias: Optional[str] = None, save_if_dirty: bool = False
+    ) -> None:
         """
         The ``Close Workbook`` keyword is responsible for closing a workbook. By default, it closes the currently active workbook.
         If an alias is provided, it closes the workbook with that alias. After closing, the workbook is removed from the open workbooks dictionary.
@@ -695,6 +2508,10 @@ class ExcelSage:
 
         If the closed workbook was the active one, the first remaining workbook (if any) becomes the new active workbook.
 
+        A workbook opened with ``autosave=on_close``, or closed with ``save_if_dirty=True``, writes its pending
+        changes to disk before it is closed. Untouched workbooks are never written. Closing a workbook with an open
+        transaction discards the uncommitted changes.
+
         *Examples*
         | ***** Settings *****
         | Library    ExcelSage
@@ -705,7 +2522,10 @@ class ExcelSage:
         |   Open Workbook     workbook_name=\\path\\to\\excel\\file2.xlsx     alias=target
         |   Close Workbook    # Closes the active workbook
         |   Close Workbook    alias=source    # Closes the workbook with alias 'source'
+        |   Close Workbook    save_if_dirty=True    # Saves pending changes, if any, before closing
         """
+        self.__argument_type_checker({"save_if_dirty": [save_if_dirty, bool]})
+
         if alias is None:
             if self.active_workbook_alias is None:
                 raise WorkbookNotOpenError()
@@ -713,7 +2533,17 @@ class ExcelSage:
         if alias not in self.workbooks:
             raise WorkbookNotOpenError(f"Workbook with alias '{alias}' is not open.")
 
-        self.workbooks[alias]["workbook"].close()
+        entry = self.workbooks[alias]
+        if entry["in_transaction"]:
+            logger.warn(
+                f"Workbook with alias '{alias}' closed with an open transaction. Uncommitted changes are discarded."
+            )
+        elif entry["dirty"] and (save_if_dirty or entry["autosave"] == "on_close"):
+            self.__get_workbook_entry(alias)["workbook"].save(entry["name"])
+            logger.info(f"Pending changes saved to '{entry['name']}' before closing.")
+
+        if entry["workbook"] is not None:
+            entry["workbook"].close()
 
         del self.workbooks[alias]
 
@@ -758,7 +2588,7 @@ class ExcelSage:
         logger.info(f"Switched to workbook with alias '{alias}'")
 
     @keyword
-    def save_workbook(self, alias: Optional[str] = None) -> None:
+    def save_workbook(self, alias: Optional[str] = None, force: bool = False) -> None:
         """
         The ``Save Workbook`` keyword saves a workbook. By default, it saves the currently active workbook.
         If an alias is provided, it saves the workbook with that alias. It first checks if there is a workbook
@@ -766,6 +2596,13 @@ class ExcelSage:
         If a workbook is open, the keyword saves it to the file specified, ensuring that any changes made to the
         workbook are persisted. This keyword does not return anything, as it simply saves the workbook.
 
+        The workbook is only written when it has changes that were not saved yet, so calling ``Save Workbook``
+        defensively on untouched workbooks costs nothing. Set ``force=True`` to write it regardless, for example
+        after modifying the returned workbook object directly.
+
+        Saving a workbook with an open transaction raises a ``WorkbookTransactionError``; use
+        ``Commit Workbook Transaction`` instead.
+
         *Examples*
         | ***** Settings *****
         | Library    ExcelSage
@@ -776,7 +2613,10 @@ class ExcelSage:
         |   Open Workbook     workbook_name=\\path\\to\\excel\\file2.xlsx     alias=target
         |   Save Workbook     # Saves the active workbook
         |   Save Workbook     alias=source    # Saves the workbook with alias 'source'
+        |   Save Workbook     force=True    # Saves the active workbook even without tracked changes
         """
+        self.__argument_type_checker({"force": [force, bool]})
+
         if alias is None:
             if self.active_workbook_alias is None:
                 raise WorkbookNotOpenError()
@@ -784,12 +2624,229 @@ class ExcelSage:
         if alias not in self.workbooks:
             raise WorkbookNotOpenError(f"Workbook with alias '{alias}' is not open.")
 
-        workbook = self.workbooks[alias]["workbook"]
-        workbook_name = self.workbooks[alias]["name"]
+        entry = self.workbooks[alias]
+        if entry["in_transaction"]:
+            raise WorkbookTransactionError(
+                f"Workbook with alias '{alias}' has an open transaction. Commit or roll it back before saving."
+            )
+
+        workbook_name = entry["name"]
 
-        workbook.save(workbook_name)
+        if not entry["dirty"] and not force:
+            logger.info(f"Workbook '{workbook_name}' has no unsaved changes, skipping save.")
+            return
+
+        if entry["read_only"]:
+            raise WorkbookReadOnlyError(workbook_name)
+
+        self.__get_workbook_entry(alias)["workbook"].save(workbook_name)
+        entry["dirty"] = False
         logger.info(f"Workbook '{workbook_name}' saved successfully!")
 
+    @keyword
+    def set_autosave_policy(self, policy: str, alias: Optional[str] = None) -> str:
+        """
+        The ``Set Autosave Policy`` keyword changes when the mutating keywords write a workbook to disk. By default, it
+        applies to the currently active workbook. The allowed policies are ``always``, ``on_commit``, ``on_close`` and
+        ``manual`` (see ``Open Workbook``). Switching back to ``always`` writes any pending changes immediately,
+        unless a transaction is open. The keyword returns the previous policy.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx     alias=source
+        |   ${previous}    Set Autosave Policy    policy=manual
+        |   Set Autosave Policy    policy=on_close    alias=source
+        """
+        self.__validate_autosave_policy(policy)
+        entry = self.__get_workbook_entry(alias)
+
+        previous_policy = entry["autosave"]
+        entry["autosave"] = policy
+
+        if policy == "always" and entry["dirty"] and not entry["in_transaction"]:
+            entry["workbook"].save(entry["name"])
+            entry["dirty"] = False
+
+        logger.info(f"Autosave policy changed from '{previous_policy}' to '{policy}'.")
+        return previous_policy
+
+    @keyword
+    def begin_workbook_transaction(self, alias: Optional[str] = None) -> None:
+        """
+        The ``Begin Workbook Transaction`` keyword starts a transaction on a workbook. By default, it uses the
+        currently active workbook. While the transaction is open, mutating keywords only change the workbook in
+        memory; nothing is written to disk until ``Commit Workbook Transaction`` is called, and
+        ``Rollback Workbook Transaction`` restores the workbook to the state it had when the transaction began.
+
+        This turns a long series of writes into a single save. Transactions cannot be nested, starting a second
+        transaction on the same workbook raises a ``WorkbookTransactionError``.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   Begin Workbook Transaction
+        |   Write To Cell     cell_name=A1     cell_value=Name
+        |   Append Row        row_data=${data}
+        |   Commit Workbook Transaction
+        """
+        entry = self.__get_workbook_entry(alias)
+
+        if entry["read_only"]:
+            raise WorkbookReadOnlyError(entry["name"])
+
+        if entry["in_transaction"]:
+            raise WorkbookTransactionError(
+                f"A transaction is already open on workbook '{entry['name']}'."
+            )
+
+        # The file on disk already holds the pre-transaction state unless there are pending changes.
+        snapshot = None
+        if entry["dirty"]:
+            snapshot = io.BytesIO()
+            entry["workbook"].save(snapshot)
+
+        entry["snapshot"] = snapshot
+        entry["in_transaction"] = True
+        logger.info(f"Transaction started on workbook '{entry['name']}'.")
+
+    @keyword
+    def commit_workbook_transaction(self, alias: Optional[str] = None) -> None:
+        """
+        The ``Commit Workbook Transaction`` keyword closes the open transaction of a workbook and writes all changes
+        made since ``Begin Workbook Transaction`` to disk in a single save. By default, it uses the currently active
+        workbook. With the ``on_close`` and ``manual`` autosave policies the changes are kept in memory and written
+        by ``Close Workbook`` or ``Save Workbook`` respectively.
+
+        If no transaction is open, a ``WorkbookTransactionError`` is raised.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   Begin Workbook Transaction
+        |   Write To Cell     cell_name=A1     cell_value=Name
+        |   Commit Workbook Transaction
+        """
+        entry = self.__get_workbook_entry(alias)
+
+        if not entry["in_transaction"]:
+            raise WorkbookTransactionError(
+                f"No transaction is open on workbook '{entry['name']}'."
+            )
+
+        entry["in_transaction"] = False
+        entry["snapshot"] = None
+
+        if entry["dirty"] and entry["autosave"] in ["always", "on_commit"]:
+            entry["workbook"].save(entry["name"])
+            entry["dirty"] = False
+
+        logger.info(f"Transaction committed on workbook '{entry['name']}'.")
+
+    @keyword
+    def rollback_workbook_transaction(self, alias: Optional[str] = None) -> None:
+        """
+        The ``Rollback Workbook Transaction`` keyword discards every change made since ``Begin Workbook Transaction``
+        and restores the workbook to its state at the start of the transaction. By default, it uses the currently
+        active workbook. Nothing is written to disk.
+
+        If no transaction is open, a ``WorkbookTransactionError`` is raised.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   Begin Workbook Transaction
+        |   Delete Row        row_index=3
+        |   Rollback Workbook Transaction
+        """
+        entry = self.__get_workbook_entry(alias)
+
+        if not entry["in_transaction"]:
+            raise WorkbookTransactionError(
+                f"No transaction is open on workbook '{entry['name']}'."
+            )
+
+        snapshot = entry["snapshot"]
+        if snapshot is not None:
+            snapshot.seek(0)
+            restored_workbook = excel.load_workbook(snapshot, **entry["load_kwargs"])
+        else:
+            restored_workbook = excel.load_workbook(
+                filename=entry["name"], **entry["load_kwargs"]
+            )
+
+        entry["workbook"].close()
+        entry["workbook"] = restored_workbook
+        entry["sheet_cache"].clear()
+        entry["dirty"] = snapshot is not None
+        entry["in_transaction"] = False
+        entry["snapshot"] = None
+
+        if entry is self.workbooks.get(self.active_workbook_alias) and self.active_sheet is not None:
+            sheet_title = self.active_sheet.title
+            self.active_sheet = (
+                restored_workbook[sheet_title]
+                if sheet_title in restored_workbook.sheetnames
+                else None
+            )
+
+        logger.info(f"Transaction rolled back on workbook '{entry['name']}'.")
+
+    @keyword
+    def clear_workbook_cache(self) -> int:
+        """
+        The ``Clear Workbook Cache`` keyword removes every parsed workbook from the process-wide workbook cache used
+        by ``Open Workbook`` with ``cache=True`` and returns the number of removed entries. Workbooks that are
+        currently open stay usable, and the hit, miss and eviction counters are kept.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Test Cases *****
+        | Example
+        |   ${cleared}     Clear Workbook Cache
+        """
+        cleared = _WORKBOOK_CACHE.clear()
+        logger.info(f"Removed {cleared} workbook(s) from the workbook cache.")
+        return cleared
+
+    @keyword
+    def get_workbook_cache_stats(self) -> Dict[str, int]:
+        """
+        The ``Get Workbook Cache Stats`` keyword returns the statistics of the process-wide workbook cache as a
+        dictionary with the keys ``entries``, ``hits``, ``misses``, ``evictions``, ``memory`` and ``memory_limit``.
+        Memory values are in bytes; ``memory`` is the size of the cached workbooks in their pickled form.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\reference.xlsx     mode=read     cache=True
+        |   ${stats}     Get Workbook Cache Stats
+        |   Should Be Equal As Integers     ${stats}[misses]     1
+        """
+        stats = _WORKBOOK_CACHE.stats()
+        logger.info(f"Workbook cache stats: {stats}")
+        return stats
+
     @keyword
     def set_active_sheet(self, sheet_name: str) -> str:
         """
@@ -846,18 +2903,115 @@ class ExcelSage:
         self.__argument_type_checker(
             {"cell_name": [cell_name, str], "cell_value": [cell_value, (str, int, float, bool, type(None))]}
         )
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
 
         try:
             sheet[cell_name] = cell_value
-            active_workbook.save(self.__get_active_workbook_name())
+            self.__save_active_workbook()
             logger.info(
                 f"Written '{cell_value}' to {cell_name} in sheet '{sheet_name}'."
             )
         except ValueError:
             raise InvalidCellAddressError(cell_name)
 
+    @keyword
+    def write_range(
+        self,
+        data: Union[List[List[Any]], DataFrame],
+        starting_cell: str = "A1",
+        sheet_name: Optional[str] = None,
+        include_header: bool = True,
+    ) -> Optional[str]:
+        """
+        The ``Write Range`` keyword writes a block of values into the active workbook in one go, starting at
+        ``starting_cell``. If no ``sheet_name`` is provided, it defaults to the currently active sheet.
+
+        The ``data`` can be a list of rows, where each row is a list of values, or a pandas DataFrame. For a DataFrame
+        the column names are written as the first row when ``include_header`` is ``True``, and missing values are
+        written as empty cells. Existing cells in the range are overwritten but keep their formatting.
+
+        The workbook is saved once after the whole block has been written. The keyword returns the written range,
+        such as ``B2:D10``, or ``None`` when there is nothing to write.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Variables ******
+        | @{row1}     Name     Age
+        | @{row2}     John     30
+        | @{data}     ${row1}     ${row2}
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   ${range}     Write Range     data=${data}     starting_cell=B2     sheet_name=Sheet1
+        """
+        sheet_name = self.__get_active_sheet_name(sheet_name)
+        self.__argument_type_checker(
+            {
+                "data": [data, (list, DataFrame)],
+                "starting_cell": [starting_cell, str],
+                "include_header": [include_header, bool],
+            }
+        )
+
+        try:
+            min_col, min_row = range_boundaries(starting_cell)[:2]
+        except ValueError:
+            raise InvalidCellAddressError(starting_cell)
+
+        if isinstance(data, DataFrame):
+            rows = data.astype(object).where(data.notna(), None).values.tolist()
+            if include_header:
+                rows.insert(0, list(data.columns))
+        else:
+            for index, row in enumerate(data):
+                if not isinstance(row, (list, tuple)):
+                    raise TypeError(
+                        f"Invalid row at index {index} of type '{type(row).__name__}'. Each row in 'data' must be a list."
+                    )
+            rows = data
+
+        if not rows:
+            logger.info(f"No data to write to sheet '{sheet_name}'.")
+            return None
+
+        active_workbook = self.__get_active_workbook(for_write=True)
+        sheet = active_workbook[sheet_name]
+
+        max_row, max_col = self.__write_sheet_values(sheet, rows, min_row, min_col)
+        self.__save_active_workbook()
+
+        written_range = f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max(max_col, min_col))}{max_row}"
+        logger.info(f"Written {len(rows)} rows to {written_range} in sheet '{sheet_name}'.")
+        return written_range
+
+    @not_keyword
+    def write_dataframe(
+        self,
+        df: DataFrame,
+        starting_cell: str = "A1",
+        sheet_name: Optional[str] = None,
+        include_header: bool = True,
+        include_index: bool = False,
+    ) -> Optional[str]:
+        """
+        Writes a pandas DataFrame into the active workbook, starting at ``starting_cell``. It works like
+        ``Write Range``; with ``include_index`` the index is written as the leading column(s).
+
+        This method is meant for use from Python code and is not exposed as a keyword.
+        """
+        self.__argument_type_checker({"df": [df, DataFrame], "include_index": [include_index, bool]})
+
+        if include_index:
+            df = df.reset_index()
+
+        return self.write_range(
+            data=df, starting_cell=starting_cell, sheet_name=sheet_name, include_header=include_header
+        )
+
     @keyword
     def get_column_count(
         self,
@@ -929,6 +3083,9 @@ class ExcelSage:
         If the exclude_header flag is set to True, the keyword reduces the row count by 1 to exclude the header row,
         ensuring that the result is never negative.
 
+        Rows are counted without loading the sheet data, and the result is cached until the sheet is modified, so
+        repeated ``Get Row Count`` calls on an unchanged sheet are free.
+
         *Examples*
         | ***** Settings *****
         | Library    ExcelSage
@@ -952,44 +3109,19 @@ class ExcelSage:
         except ValueError:
             raise InvalidCellAddressError(starting_cell)
 
-        start_col_letter = "".join(filter(str.isalpha, starting_cell))
-        start_row = int("".join(filter(str.isdigit, starting_cell)))
-        start_col_index = column_index_from_string(start_col_letter)
+        start_col_index, start_row = range_boundaries(starting_cell)[:2]
 
         active_workbook = self.__get_active_workbook()
         sheet = active_workbook[sheet_name]
-        headers_range = sheet.iter_rows(
-            min_row=start_row,
-            max_row=start_row,
-            min_col=start_col_index,
-            values_only=True,
+        header_row, row_count = self.__get_cached_sheet_stat(
+            sheet,
+            ("row_count", start_row, start_col_index, ignore_empty_rows),
+            lambda: self.__count_sheet_rows(
+                sheet, start_row, start_col_index, ignore_empty_rows
+            ),
         )
-        headers = next(headers_range)
-
-        data = sheet[starting_cell : sheet.dimensions.split(":")[-1]]
-        data_list = [[cell.value for cell in row] for row in data]
-
-        new_data = []
-        valid_row_found = False
-
-        for row in data_list:
-            if not valid_row_found:
-                if len(set(row)) == 1 and None in set(row):
-                    continue
-                else:
-                    valid_row_found = True
-            new_data.append(row)
-
-        headers = new_data[0] if new_data else None
-        data = new_data[1:] if len(new_data) > 1 else []
-        df = pd.DataFrame(data, columns=headers)
-
-        if ignore_empty_rows:
-            df.dropna(axis=0, how="all", inplace=True)
 
-        row_count = df.shape[0]
-
-        if include_header and headers:
+        if include_header and header_row is not None:
             row_count += 1
 
         logger.info(f"Row count in sheet {sheet_name} is {row_count}.")
@@ -1017,12 +3149,55 @@ class ExcelSage:
         """
         sheet_name = self.__get_active_sheet_name(sheet_name)
         self.__argument_type_checker({"row_data": [row_data, list]})
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
         sheet.append(row_data)
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Row append to sheet {sheet_name}.")
 
+    @keyword
+    def append_rows(self, rows_data: List[List[Any]], sheet_name: Optional[str] = None) -> int:
+        """
+        The ``Append Rows`` keyword appends several rows of data to the specified sheet in the active workbook, below
+        the last used row. If no ``sheet_name`` is provided, it defaults to the currently active sheet.
+
+        Each row in ``rows_data`` must be a list. All rows are written first and the workbook is saved once, which is
+        much faster than calling ``Append Row`` for every row. The keyword returns the number of appended rows.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Variables ******
+        | @{row1}     John     Doe     Maths   100
+        | @{row2}     Mark     Dee     Physics   90
+        | @{data}     ${row1}     ${row2}
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   Append Rows     rows_data=${data}
+        """
+        sheet_name = self.__get_active_sheet_name(sheet_name)
+        self.__argument_type_checker({"rows_data": [rows_data, list]})
+
+        for index, row in enumerate(rows_data):
+            if not isinstance(row, (list, tuple)):
+                raise TypeError(
+                    f"Invalid row at index {index} of type '{type(row).__name__}'. Each row in 'rows_data' must be a list."
+                )
+
+        active_workbook = self.__get_active_workbook(for_write=True)
+        sheet = active_workbook[sheet_name]
+
+        if rows_data:
+            max_row, _ = self.__write_sheet_values(sheet, rows_data, sheet._current_row + 1, 1)
+            sheet._current_row = max_row
+            self.__save_active_workbook()
+
+        logger.info(f"Appended {len(rows_data)} rows to sheet {sheet_name}.")
+        return len(rows_data)
+
     @keyword
     def insert_row(
         self, row_data: List[Any], row_index: int, sheet_name: Optional[str] = None
@@ -1051,13 +3226,13 @@ class ExcelSage:
         if row_index < 1 or row_index > 1048576:
             raise InvalidRowIndexError(row_index)
 
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
         sheet.insert_rows(row_index)
         for col_index, value in enumerate(row_data, start=1):
             sheet.cell(row=row_index, column=col_index, value=value)
 
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Inserted row at index {row_index} in sheet '{sheet_name}'.")
 
     @keyword
@@ -1084,12 +3259,51 @@ class ExcelSage:
         if row_index < 1 or row_index > 1048576:
             raise InvalidRowIndexError(row_index)
 
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
         sheet.delete_rows(row_index)
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Deleted row at index {row_index}.")
 
+    @keyword
+    def delete_rows(
+        self, row_indices: Union[int, str, List[Union[int, str]]], sheet_name: Optional[str] = None
+    ) -> int:
+        """
+        The ``Delete Rows`` keyword deletes several rows from the active workbook's sheet at once.
+        You can optionally specify the sheet name; if not provided, the currently active sheet will be used.
+
+        The ``row_indices`` can hold single row indices and row ranges such as ``5:10``. Every index must be within
+        Excel's allowable range (1 to 1,048,576), otherwise an ``InvalidRowIndexError`` is raised. The indices refer to
+        the sheet as it is before the deletion. The rows below are moved up in a single pass and the workbook is saved
+        once. The keyword returns the number of deleted rows.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Variables ******
+        | @{rows}     3     7     10:20
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   ${deleted}     Delete Rows     row_indices=${rows}
+        """
+        sheet_name = self.__get_active_sheet_name(sheet_name)
+        self.__argument_type_checker({"row_indices": [row_indices, (int, str, list)]})
+        removed = self.__parse_index_ranges(row_indices, "row")
+
+        active_workbook = self.__get_active_workbook(for_write=True)
+        sheet = active_workbook[sheet_name]
+
+        if removed:
+            self.__remove_sheet_lines(sheet, removed, "row")
+            self.__save_active_workbook()
+
+        logger.info(f"Deleted {len(removed)} rows from sheet {sheet_name}.")
+        return len(removed)
+
     @keyword
     def append_column(
         self, col_data: Union[List[Any], Tuple[Any]], sheet_name: Optional[str] = None
@@ -1115,7 +3329,7 @@ class ExcelSage:
         sheet_name = self.__get_active_sheet_name(sheet_name)
         self.__argument_type_checker({"col_data": [col_data, (list, tuple)]})
 
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
 
         if sheet.max_row == 1 and sheet.max_column == 1 and sheet["A1"].value is None:
@@ -1123,12 +3337,9 @@ class ExcelSage:
         else:
             next_column = sheet.max_column + 1
 
-        col_letter = get_column_letter(next_column)
-
-        for row_index, value in enumerate(col_data, start=1):
-            sheet[f"{col_letter}{row_index}"] = value
+        self.__write_sheet_values(sheet, [[value] for value in col_data], 1, next_column)
 
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Column appended to sheet {sheet_name}.")
 
     @keyword
@@ -1162,14 +3373,14 @@ class ExcelSage:
         if col_index < 1 or col_index > 16384:
             raise InvalidColumnIndexError(col_index)
 
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
         sheet.insert_cols(col_index)
 
         for row_index, value in enumerate(col_data, start=1):
             sheet.cell(row=row_index, column=col_index, value=value)
 
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Inserted column at index {col_index}.")
 
     @keyword
@@ -1196,12 +3407,51 @@ class ExcelSage:
         if col_index < 1 or col_index > 16384:
             raise InvalidColumnIndexError(col_index)
 
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
         sheet.delete_cols(col_index)
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Deleted column at index {col_index}.")
 
+    @keyword
+    def delete_columns(
+        self, col_indices: Union[int, str, List[Union[int, str]]], sheet_name: Optional[str] = None
+    ) -> int:
+        """
+        The ``Delete Columns`` keyword deletes several columns from the active workbook's sheet at once.
+        You can optionally specify the sheet name; if not provided, the currently active sheet will be used.
+
+        The ``col_indices`` can hold column indices, column letters and ranges such as ``B:D`` or ``2:4``. Every
+        column must be within Excel's allowable range (1 to 16,384), otherwise an ``InvalidColumnIndexError`` is
+        raised. The columns refer to the sheet as it is before the deletion. The columns on the right are moved left
+        in a single pass and the workbook is saved once. The keyword returns the number of deleted columns.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Variables ******
+        | @{columns}     A     C:E     8
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   ${deleted}     Delete Columns     col_indices=${columns}
+        """
+        sheet_name = self.__get_active_sheet_name(sheet_name)
+        self.__argument_type_checker({"col_indices": [col_indices, (int, str, list)]})
+        removed = self.__parse_index_ranges(col_indices, "column")
+
+        active_workbook = self.__get_active_workbook(for_write=True)
+        sheet = active_workbook[sheet_name]
+
+        if removed:
+            self.__remove_sheet_lines(sheet, removed, "column")
+            self.__save_active_workbook()
+
+        logger.info(f"Deleted {len(removed)} columns from sheet {sheet_name}.")
+        return len(removed)
+
     @keyword
     def get_column_values(
         self,
@@ -1292,11 +3542,8 @@ class ExcelSage:
             else:
                 raise ValueError(f"Invalid column name or letter: '{col}'")
 
-        df = pd.read_excel(
-            self.__get_active_workbook_name(),
-            sheet_name=sheet_name,
-            usecols=headers_to_fetch,
-            header=start_row - 1,
+        df = self.__sheet_to_dataframe(
+            sheet, start_row, start_col_index, headers_to_fetch
         )
 
         if output_format.lower().strip() == "list":
@@ -1350,11 +3597,12 @@ class ExcelSage:
             if row_index < 1 or row_index > 1048576:
                 raise InvalidRowIndexError(row_index)
 
-            row_values = [
-                cell.value
-                for cell in next(sheet.iter_rows(min_row=row_index, max_row=row_index))
-            ]
-            row_data[row_index] = row_values
+            row_values = next(
+                self.__iter_sheet_values(
+                    sheet, row_index, row_index, 1, self.__get_sheet_extent(sheet)[2]
+                )
+            )
+            row_data[row_index] = list(row_values)
 
         if output_format.lower().strip() == "list":
             if len(row_indices) == 1:
@@ -1379,14 +3627,14 @@ class ExcelSage:
         """
         sheet_name = self.__get_active_sheet_name(sheet_name)
         self.__argument_type_checker({"password": [password, str]})
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
 
         if sheet.protection.sheet:
             raise SheetAlreadyProtectedError(sheet_name)
 
         sheet.protection.set_password(password)
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Sheet {sheet_name} is protected successfully.")
 
     @keyword
@@ -1406,7 +3654,7 @@ class ExcelSage:
         """
         sheet_name = self.__get_active_sheet_name(sheet_name)
         self.__argument_type_checker({"password": [password, str]})
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
 
         if not sheet.protection.sheet:
@@ -1415,7 +3663,7 @@ class ExcelSage:
         sheet.protection.set_password(password)
         sheet.protection.sheet = False
 
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Sheet {sheet_name} has been unprotected successfully.")
 
     @keyword
@@ -1438,7 +3686,7 @@ class ExcelSage:
         |   Protect Workbook    password=YourPassword       protect_sheets=False
 
         """
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
 
         self.__argument_type_checker(
             {"password": [password, str], "protect_sheets": [protect_sheets, bool]}
@@ -1470,7 +3718,7 @@ class ExcelSage:
                 sheet.protection.objects = False
                 sheet.protection.scenarios = False
 
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info("Workbook have been successfully protected.")
 
     @keyword
@@ -1492,7 +3740,7 @@ class ExcelSage:
         |   Unprotect Workbook      unprotect_sheets=True
 
         """
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
 
         self.__argument_type_checker({"unprotect_sheets": [unprotect_sheets, bool]})
 
@@ -1507,7 +3755,7 @@ class ExcelSage:
                     sheet.protection.sheet = False
                     logger.info(f"Sheet {sheet.title} unprotected.")
 
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info("Workbook have been successfully unprotected.")
 
     @keyword
@@ -1525,14 +3773,12 @@ class ExcelSage:
         |   ${cleared_sheet_name}     Clear Sheet     sheet_name=Sheet1
         """
         sheet_name = self.__get_active_sheet_name(sheet_name)
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
-        for row in sheet.iter_rows(
-            min_row=1, max_col=sheet.max_column, max_row=sheet.max_row
-        ):
-            for cell in row:
+        for cell in sheet._cells.values():
+            if not isinstance(cell, MergedCell):
                 cell.value = None
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Cleared sheet {sheet_name}.")
         return sheet_name
 
@@ -1550,7 +3796,7 @@ class ExcelSage:
         |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
         |   ${copied_sheet_name}     Copy Sheet      source_sheet_name=Sheet1     new_sheet_name=CopiedSheet
         """
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
 
         self.__argument_type_checker(
             {
@@ -1575,7 +3821,7 @@ class ExcelSage:
         source = active_workbook[source_sheet_name]
         target = active_workbook.copy_worksheet(source)
         target.title = new_sheet_name
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Coppied sheet {source_sheet_name} to {new_sheet_name}.")
         return new_sheet_name
 
@@ -1599,7 +3845,6 @@ class ExcelSage:
         |   ${cell_cordinate}     Find Value     value=John Doe
 
         """
-        all_occurences = []
         sheet_name = self.__get_active_sheet_name(sheet_name)
 
         if occurence.lower().strip() not in ["first", "all"]:
@@ -1607,22 +3852,21 @@ class ExcelSage:
 
         active_workbook = self.__get_active_workbook()
         sheet = active_workbook[sheet_name]
-        for row in sheet.iter_rows():
-            for cell in row:
-                if cell.value == value:
-                    if occurence.lower().strip() == "first":
-                        logger.info(f"Value found in cell {cell.coordinate}.")
-                        return cell.coordinate
-                    elif occurence.lower().strip() == "all":
-                        all_occurences.append(cell.coordinate)
+        positions = self.__find_value_positions(sheet, value)
 
-        else:
-            if all_occurences:
-                logger.info(f"Value found in cell(s) {all_occurences}")
-                return all_occurences
+        if not positions:
             logger.info("Value not found in any cell.")
             return None
 
+        if occurence.lower().strip() == "first":
+            coordinate = f"{get_column_letter(positions[0][1])}{positions[0][0]}"
+            logger.info(f"Value found in cell {coordinate}.")
+            return coordinate
+
+        all_occurences = [f"{get_column_letter(column)}{row}" for row, column in positions]
+        logger.info(f"Value found in cell(s) {all_occurences}")
+        return all_occurences
+
     @keyword
     def find_and_replace(
         self,
@@ -1647,43 +3891,405 @@ class ExcelSage:
         |   ${cell_cordinates}    Find and Replace     old_value=John Doe     new_value=John Smith     sheet_name=Sheet1     occurence=all
         |   ${cell_cordinate}     Find and Replace     old_value=John Doe     new_value=John Smith
         """
-        replaced_cells = []
         sheet_name = self.__get_active_sheet_name(sheet_name)
 
         if occurence.lower().strip() not in ["first", "all"]:
             raise ValueError("Invalid occurence, use either 'first' or 'all'.")
 
+        active_workbook = self.__get_active_workbook(for_write=True)
+        sheet = active_workbook[sheet_name]
+        positions = self.__find_value_positions(sheet, old_value)
+
+        if not positions:
+            logger.info(f"Value '{old_value}' not found in any cell.")
+            return None
+
+        if occurence.lower().strip() == "first":
+            positions = positions[:1]
+
+        index = None if old_value is None else self.__get_value_index(sheet)
+
+        for row, column in positions:
+            sheet.cell(row=row, column=column).value = new_value
+
+        if index is not None:
+            self.__update_value_index(index, old_value, new_value, positions)
+
+        self.__save_active_workbook()
+
+        if index is not None:
+            self.__set_cached_sheet_stat(sheet, ("value_index",), index)
+
+        replaced_cells = [f"{get_column_letter(column)}{row}" for row, column in positions]
+        if occurence.lower().strip() == "first":
+            logger.info(f"Replaced '{old_value}' with '{new_value}' in cell {replaced_cells[0]}.")
+            return replaced_cells[0]
+
+        logger.info(f"Replaced '{old_value}' with '{new_value}' in cells {replaced_cells}.")
+        return replaced_cells
+
+    @keyword
+    def replace_values(
+        self,
+        mapping: Dict[Any, Any],
+        sheet_name: Optional[str] = None,
+        cell_range: Optional[str] = None,
+        columns: Optional[List[Union[int, str]]] = None,
+    ) -> Dict[Any, int]:
+        """
+        The ``Replace Values`` keyword replaces many values at once. Every cell whose value is a key of ``mapping`` gets
+        the value mapped to that key. If no ``sheet_name`` is provided, it defaults to the currently active sheet.
+
+        All substitutions are applied in a single pass over the sheet, each cell is replaced at most once and the
+        workbook is saved once at the end. The search can be limited to a ``cell_range`` such as ``A2:D100`` and/or to
+        ``columns`` given as indices, letters or ranges such as ``B:D``.
+
+        The keyword returns the number of replaced cells for each key of ``mapping``.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Variables ******
+        | &{names}     John=Person 1     Mark=Person 2
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   ${counts}     Replace Values     mapping=${names}     sheet_name=Sheet1     columns=A:B
+        """
+        sheet_name = self.__get_active_sheet_name(sheet_name)
+        self.__argument_type_checker(
+            {
+                "mapping": [mapping, dict],
+                "cell_range": [cell_range, str, None],
+                "columns": [columns, list, None],
+            }
+        )
+
+        min_col, min_row, max_col, max_row = 1, 1, 16384, 1048576
+        if cell_range is not None:
+            try:
+                bounds = range_boundaries(cell_range)
+            except ValueError as e:
+                raise InvalidCellRangeError(e)
+            min_col, min_row, max_col, max_row = (
+                default if bound is None else bound for bound, default in zip(bounds, (1, 1, 16384, 1048576))
+            )
+            if min_row > max_row or min_col > max_col:
+                raise InvalidCellRangeError(
+                    f"Invalid cell range: {cell_range}. The start cell must be smaller than the end cell."
+                )
+        selected_columns = None if columns is None else set(self.__parse_index_ranges(columns, "column"))
+
+        active_workbook = self.__get_active_workbook(for_write=True)
+        sheet = active_workbook[sheet_name]
+
+        keys = {key: key for key in mapping}
+        counts = dict.fromkeys(mapping, 0)
+        for (row, column), cell in sheet._cells.items():
+            value = cell._value
+            if value is None or not (min_row <= row <= max_row and min_col <= column <= max_col):
+                continue
+            if selected_columns is not None and column not in selected_columns:
+                continue
+            key = keys.get(value, keys)
+            if key is not keys:
+                cell.value = mapping[key]
+                counts[key] += 1
+
+        replaced = sum(counts.values())
+        if replaced:
+            self.__save_active_workbook()
+        logger.info(f"Replaced {replaced} cell values in sheet '{sheet_name}'.")
+        return counts
+
+    @keyword
+    def build_sheet_index(self, sheet_name: Optional[str] = None) -> int:
+        """
+        The ``Build Sheet Index`` keyword builds the value index of a sheet ahead of time. ``Find Value`` and
+        ``Find And Replace`` build the index on their first lookup and reuse it until the sheet changes; calling this
+        keyword once up front moves that cost out of the first lookup. If no ``sheet_name`` is provided, it defaults
+        to the currently active sheet.
+
+        The keyword returns the number of distinct values in the index.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   ${value_count}     Build Sheet Index     sheet_name=Sheet1
+        |   ${cell_cordinate}     Find Value     value=John Doe     sheet_name=Sheet1
+        """
+        sheet_name = self.__get_active_sheet_name(sheet_name)
         active_workbook = self.__get_active_workbook()
+        value_count = len(self.__get_value_index(active_workbook[sheet_name]))
+        logger.info(f"Indexed {value_count} distinct values in sheet '{sheet_name}'.")
+        return value_count
+
+    @keyword
+    def find_value_in_workbook(
+        self,
+        value: Any,
+        occurence: str = "first",
+        sheet_names: Optional[List[str]] = None,
+        alias: Optional[str] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        The ``Find Value In Workbook`` keyword searches for a value in every sheet of a workbook, or in the sheets
+        listed in ``sheet_names``. It searches the active workbook unless an ``alias`` is given.
+
+        Each sheet is searched through its value index, built on first use and reused while the sheet is unchanged,
+        so repeated searches only cost the number of matches. The result maps each sheet holding the value to its
+        cell coordinates, in sheet order. With ``occurence=first`` the search stops at the first sheet holding the
+        value and only its first cell is returned. An empty dictionary means the value was not found.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   ${matches}     Find Value In Workbook     value=John Doe     occurence=all
+        |   ${first}     Find Value In Workbook     value=John Doe
+        """
+        occurence, targets = self.__prepare_workbook_search(occurence, [alias], sheet_names)
+        results = self.__search_workbooks(value, occurence, targets)
+        matches = results.get(targets[0][0], {}) if targets else {}
+        logger.info(f"Value found in {len(matches)} sheet(s): {matches}")
+        return matches
+
+    @keyword
+    def find_value_in_workbooks(
+        self,
+        value: Any,
+        occurence: str = "first",
+        aliases: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, List[str]]]:
+        """
+        The ``Find Value In Workbooks`` keyword searches for a value in every sheet of every open workbook, or of the
+        workbooks listed in ``aliases``.
+
+        Each sheet is searched through its value index, as in ``Find Value In Workbook``. The result maps each alias
+        to the sheets holding the value and their cell coordinates, for example
+        ``{'source': {'Sheet1': ['A2', 'C7']}}``. With ``occurence=first`` the search stops at the first sheet, in
+        workbook and sheet order, holding the value and only its first cell is returned. An empty dictionary means
+        the value was not found.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx     alias=source
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file2.xlsx     alias=target
+        |   ${matches}     Find Value In Workbooks     value=John Doe     occurence=all
+        """
+        if aliases is None:
+            if not self.workbooks:
+                raise WorkbookNotOpenError()
+            aliases = list(self.workbooks)
+        self.__argument_type_checker({"aliases": [aliases, list]})
+
+        occurence, targets = self.__prepare_workbook_search(occurence, aliases)
+        matches = self.__search_workbooks(value, occurence, targets)
+        logger.info(f"Value found in {len(matches)} workbook(s): {matches}")
+        return matches
+
+    @keyword
+    def find_cells_matching(
+        self,
+        pattern: Optional[str] = None,
+        match_type: str = "regex",
+        sheet_name: Optional[str] = None,
+        ignore_case: bool = False,
+        min_value: Optional[Union[int, float]] = None,
+        max_value: Optional[Union[int, float]] = None,
+        occurence: str = "all",
+    ) -> Union[str, List[str], None]:
+        """
+        The ``Find Cells Matching`` keyword searches a sheet for cells matching a condition rather than an exact
+        value, and returns the coordinates of the matching cells row by row. If no match is found, it returns
+        ``None``. If no ``sheet_name`` is provided, it defaults to the currently active sheet.
+
+        The ``match_type`` selects the condition:
+        - ``regex``: text cells in which the regular expression ``pattern`` is found.
+        - ``contains``: text cells containing the substring ``pattern``.
+        - ``equals``: text cells equal to ``pattern``; combine with ``ignore_case`` for a case-insensitive match.
+        - ``range``: numeric cells between ``min_value`` and ``max_value``, both inclusive and each optional.
+
+        ``ignore_case`` applies to the text conditions. The sheet is searched column by column with vectorized
+        pandas operations on a snapshot of its values, which is reused until the sheet changes.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   ${cells}     Find Cells Matching     pattern=^ERR-\\d+     sheet_name=Log
+        |   ${cells}     Find Cells Matching     pattern=timeout     match_type=contains     ignore_case=True
+        |   ${cell}     Find Cells Matching     match_type=range     min_value=100     max_value=200     occurence=first
+        """
+        sheet_name = self.__get_active_sheet_name(sheet_name)
+        self.__argument_type_checker(
+            {
+                "pattern": [pattern, str, None],
+                "match_type": [match_type, str],
+                "ignore_case": [ignore_case, bool],
+                "min_value": [min_value, (int, float), None],
+                "max_value": [max_value, (int, float), None],
+                "occurence": [occurence, str],
+            }
+        )
+
+        match_type = match_type.lower().strip()
+        occurence = occurence.lower().strip()
+        if match_type not in ["regex", "contains", "equals", "range"]:
+            raise ValueError(
+                f"Invalid match type: '{match_type}'. Allowed values are ['regex', 'contains', 'equals', 'range']."
+            )
+        if occurence not in ["first", "all"]:
+            raise ValueError("Invalid occurence, use either 'first' or 'all'.")
+
+        if match_type == "range":
+            if min_value is None and max_value is None:
+                raise ValueError("A 'range' match needs 'min_value', 'max_value' or both.")
+        elif pattern is None:
+            raise ValueError(f"A '{match_type}' match needs a 'pattern'.")
+        elif match_type == "regex":
+            try:
+                re.compile(pattern)
+            except re.error as error:
+                raise ValueError(f"Invalid regular expression '{pattern}': {error}.")
+
+        sheet = self.__get_active_workbook()[sheet_name]
+        rows, columns = [], []
+        for column, values in enumerate(self.__get_sheet_columns(sheet), start=1):
+            if match_type == "range":
+                numbers = pd.to_numeric(values.where(values.map(type).isin([int, float])), errors="coerce")
+                mask = numbers.notna()
+                if min_value is not None:
+                    mask &= numbers >= min_value
+                if max_value is not None:
+                    mask &= numbers <= max_value
+            else:
+                text = values.where(values.map(type) == str)
+                if match_type == "equals":
+                    mask = (text.str.lower() == pattern.lower()) if ignore_case else (text == pattern)
+                else:
+                    mask = text.str.contains(pattern, case=not ignore_case, regex=match_type == "regex", na=False)
+
+            matched_rows = np.flatnonzero(mask.to_numpy(dtype=bool)) + 1
+            rows.append(matched_rows)
+            columns.append(np.full(len(matched_rows), column))
+
+        if not rows or not sum(len(matched_rows) for matched_rows in rows):
+            logger.info("No cell matches the condition.")
+            return None
+
+        rows, columns = np.concatenate(rows), np.concatenate(columns)
+        order = np.lexsort((columns, rows))
+        matches = [
+            f"{get_column_letter(column)}{row}" for row, column in zip(rows[order].tolist(), columns[order].tolist())
+        ]
+
+        if occurence == "first":
+            logger.info(f"Match found in cell {matches[0]}.")
+            return matches[0]
+
+        logger.info(f"Matches found in {len(matches)} cell(s).")
+        return matches
+
+    @keyword
+    def format_cell(
+        self,
+        cell_name: str,
+        font_size: Optional[int] = None,
+        font_color: Optional[str] = None,
+        sheet_name: Optional[str] = None,
+        alignment: Optional[dict] = None,
+        wrap_text: Optional[bool] = None,
+        bg_color: Optional[str] = None,
+        cell_width: Optional[Union[int, float]] = None,
+        cell_height: Optional[Union[int, float]] = None,
+        font_name: Optional[str] = None,
+        bold: Optional[bool] = None,
+        italic: Optional[bool] = None,
+        underline: Optional[bool] = None,
+        strike_through: Optional[bool] = None,
+        border: Optional[dict] = None,
+        auto_fit_height: Optional[bool] = None,
+        auto_fit_width: Optional[bool] = None,
+    ) -> None:
+        """
+        The ``Format Cell`` keyword allows formatting of a specified cell in the active workbook. It accepts a variety of formatting options, including font size, color, alignment, background color, borders, and text formatting (bold, italic, underline, etc.). Invalid parameters trigger specific exceptions such as ``InvalidColorError``, ``InvalidAlignmentError``, or ``InvalidBorderStyleError``.
+
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Variables *****
+        | &{alignments}        vertical=center     horizontal=left
+        | &{border}         left=True     right=True     top=False     bottom=True     style=thin     color=#FF0000
+        |
+        | ***** Test Cases *****
+        | Example
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   Format Cell     cell_name=A1     font_size=15    font_color=#FFFF00     alignment=${alignments}     border=${border}
+        |   Format Cell     cell_name=A1     wrap_text=True     font_name=Arial     cell_width=25
+        """
+        sheet_name = self.__get_active_sheet_name(sheet_name)
+        self.__argument_type_checker(
+            {
+                "cell_name": [cell_name, str],
+                "font_size": [font_size, int, None],
+                "font_color": [font_color, str, None],
+                "alignment": [alignment, dict, None],
+                "wrap_text": [wrap_text, bool, None],
+                "bg_color": [bg_color, str, None],
+                "cell_width": [cell_width, (int, float), None],
+                "cell_height": [cell_height, (int, float), None],
+                "font_name": [font_name, str, None],
+                "bold": [bold, bool, None],
+                "italic": [italic, bool, None],
+                "underline": [underline, bool, None],
+                "strike_through": [strike_through, bool, None],
+                "border": [border, dict, None],
+                "auto_fit_height": [auto_fit_height, bool, None],
+                "auto_fit_width": [auto_fit_width, bool, None],
+            }
+        )
+
+        apply_format = self.__prepare_cell_format(
+            font_size, font_color, font_name, bold, italic, underline, strike_through,
+            bg_color, alignment, wrap_text, border,
+        )
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
 
-        for row in sheet.iter_rows():
-            for cell in row:
-                if cell.value == old_value:
-                    if occurence.lower().strip() == "first":
-                        cell.value = new_value
-                        active_workbook.save(self.__get_active_workbook_name())
-                        logger.info(
-                            f"Replaced '{old_value}' with '{new_value}' in cell {cell.coordinate}."
-                        )
-                        return cell.coordinate
-                    elif occurence.lower().strip() == "all":
-                        cell.value = new_value
-                        replaced_cells.append(cell.coordinate)
+        try:
+            cell = sheet[cell_name]
+            apply_format(cell)
+            self.__resize_formatted_cells(
+                sheet, [cell], cell_width, cell_height, auto_fit_width, auto_fit_height
+            )
+            self.__save_active_workbook()
+            logger.info(f"Formatted cell {cell_name}.")
 
-        else:
-            if replaced_cells:
-                active_workbook.save(self.__get_active_workbook_name())
-                logger.info(
-                    f"Replaced '{old_value}' with '{new_value}' in cells {replaced_cells}."
-                )
-                return replaced_cells
-            logger.info(f"Value '{old_value}' not found in any cell.")
-            return None
+        except ValueError:
+            raise InvalidCellAddressError(cell_name)
 
     @keyword
-    def format_cell(
+    def format_range(
         self,
-        cell_name: str,
+        cell_range: Union[str, List[str]],
         font_size: Optional[int] = None,
         font_color: Optional[str] = None,
         sheet_name: Optional[str] = None,
@@ -1700,9 +4306,16 @@ class ExcelSage:
         border: Optional[dict] = None,
         auto_fit_height: Optional[bool] = None,
         auto_fit_width: Optional[bool] = None,
-    ) -> None:
+    ) -> int:
         """
-        The ``Format Cell`` keyword allows formatting of a specified cell in the active workbook. It accepts a variety of formatting options, including font size, color, alignment, background color, borders, and text formatting (bold, italic, underline, etc.). Invalid parameters trigger specific exceptions such as ``InvalidColorError``, ``InvalidAlignmentError``, or ``InvalidBorderStyleError``.
+        The ``Format Range`` keyword applies the formatting options of ``Format Cell`` to every cell of a range such as
+        ``A1:H5000``, or of a list of ranges, in the active workbook. If no ``sheet_name`` is provided, it defaults to
+        the currently active sheet.
+
+        The options are validated once and each style is built once and shared by all cells that had the same style
+        before, instead of being rebuilt for every cell. ``cell_width`` and ``cell_height`` apply to every column and
+        row of the range, and ``auto_fit_width`` and ``auto_fit_height`` fit each column and row to its longest value
+        in the range. The workbook is saved once at the end. The keyword returns the number of formatted cells.
 
         *Examples*
         | ***** Settings *****
@@ -1710,18 +4323,18 @@ class ExcelSage:
         |
         | ***** Variables *****
         | &{alignments}        vertical=center     horizontal=left
-        | &{border}         left=True     right=True     top=False     bottom=True     style=thin     color=#FF0000
+        | @{ranges}         A1:H1     A10:H10
         |
         | ***** Test Cases *****
         | Example
         |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
-        |   Format Cell     cell_name=A1     font_size=15    font_color=#FFFF00     alignment=${alignments}     border=${border}
-        |   Format Cell     cell_name=A1     wrap_text=True     font_name=Arial     cell_width=25
+        |   Format Range     cell_range=A1:H5000     font_name=Arial     alignment=${alignments}
+        |   Format Range     cell_range=${ranges}     bold=True     bg_color=#FFFF00
         """
         sheet_name = self.__get_active_sheet_name(sheet_name)
         self.__argument_type_checker(
             {
-                "cell_name": [cell_name, str],
+                "cell_range": [cell_range, (str, list)],
                 "font_size": [font_size, int, None],
                 "font_color": [font_color, str, None],
                 "alignment": [alignment, dict, None],
@@ -1740,143 +4353,235 @@ class ExcelSage:
             }
         )
 
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
 
-        try:
-            cell = sheet[cell_name]
-            current_font = cell.font
-            cell_value = str(cell.value) if cell.value else ""
-            col_letter = get_column_letter(cell.column)
-            row_num = "".join(filter(str.isdigit, cell_name))
-
-            font_args = {
-                "name": font_name if font_name else current_font.name,
-                "bold": bold if bold is not None else current_font.bold,
-                "italic": italic if italic is not None else current_font.italic,
-                "underline": "single" if underline else current_font.underline,
-                "size": font_size if font_size else current_font.size,
-                "color": current_font.color,
-                "strike": strike_through
-                if strike_through is not None
-                else current_font.strike,
-            }
+        bounds = []
+        for single_range in [cell_range] if isinstance(cell_range, str) else cell_range:
+            try:
+                min_col, min_row, max_col, max_row = range_boundaries(single_range)
+            except (ValueError, TypeError) as e:
+                raise InvalidCellRangeError(e)
+            extent = self.__get_sheet_extent(sheet)
+            min_col, min_row = min_col or 1, min_row or 1
+            max_col, max_row = max_col or extent[2], max_row or extent[3]
+            if min_row > max_row or min_col > max_col:
+                raise InvalidCellRangeError(
+                    f"Invalid cell range: {single_range}. The start cell must be smaller than the end cell."
+                )
+            bounds.append((min_col, min_row, max_col, max_row))
+
+        apply_format = self.__prepare_cell_format(
+            font_size, font_color, font_name, bold, italic, underline, strike_through,
+            bg_color, alignment, wrap_text, border,
+        )
 
-            if font_color is not None:
-                if not re.match(r"^#[0-9A-Fa-f]{6}$", font_color):
-                    raise InvalidColorError(color_type="font", color=font_color)
+        cells = []
+        for min_col, min_row, max_col, max_row in bounds:
+            for row in range(min_row, max_row + 1):
+                for column in range(min_col, max_col + 1):
+                    cell = sheet.cell(row=row, column=column)
+                    apply_format(cell)
+                    cells.append(cell)
 
-                if font_color.startswith("#"):
-                    font_color = "FF" + font_color[1:]
-                font_args["color"] = font_color
+        self.__resize_formatted_cells(sheet, cells, cell_width, cell_height, auto_fit_width, auto_fit_height)
+        self.__save_active_workbook()
+        logger.info(f"Formatted {len(cells)} cells in sheet '{sheet_name}'.")
+        return len(cells)
 
-            cell.font = Font(**font_args)
+    @not_keyword
+    def __prepare_cell_format(
+        self,
+        font_size: Optional[int],
+        font_color: Optional[str],
+        font_name: Optional[str],
+        bold: Optional[bool],
+        italic: Optional[bool],
+        underline: Optional[bool],
+        strike_through: Optional[bool],
+        bg_color: Optional[str],
+        alignment: Optional[dict],
+        wrap_text: Optional[bool],
+        border: Optional[dict],
+    ) -> Callable[[Any], None]:
+        """
+        Helper method to validate the formatting options of ``Format Cell`` and ``Format Range`` once and return a
+        function that applies them to a cell. The fill and border are built here and shared by all cells. The font
+        and alignment keep parts of the current cell style, so they are built for the first cell of each distinct
+        style and later cells with that style reuse the result.
+        """
+        if font_color is not None:
+            if not re.match(r"^#[0-9A-Fa-f]{6}$", font_color):
+                raise InvalidColorError(color_type="font", color=font_color)
+            font_color = "FF" + font_color[1:]
+
+        fill = None
+        if bg_color is not None:
+            if not re.match(r"^#[0-9A-Fa-f]{6}$", bg_color):
+                raise InvalidColorError(color_type="background", color=bg_color)
+            bg_color = "FF" + bg_color[1:]
+            fill = PatternFill(start_color=bg_color, end_color=bg_color, fill_type="solid")
+
+        vertical_align = horizontal_align = None
+        if alignment:
+            vertical_align = alignment.get("vertical")
+            horizontal_align = alignment.get("horizontal")
+
+            if vertical_align and vertical_align not in self.VALID_VERTICAL_ALIGNMENTS:
+                raise InvalidAlignmentError(
+                    alignment_type="vertical",
+                    alignment_value=vertical_align,
+                    allowed_values=self.VALID_VERTICAL_ALIGNMENTS,
+                )
+            if horizontal_align and horizontal_align not in self.VALID_HORIZONTAL_ALIGNMENTS:
+                raise InvalidAlignmentError(
+                    alignment_type="horizontal",
+                    alignment_value=horizontal_align,
+                    allowed_values=self.VALID_HORIZONTAL_ALIGNMENTS,
+                )
 
-            # Apply background color
-            if bg_color is not None:
-                if not re.match(r"^#[0-9A-Fa-f]{6}$", bg_color):
-                    raise InvalidColorError(color_type="background", color=bg_color)
+        cell_border = None
+        if border is not None:
+            border_style = border.get("style", "thin")
+            border_color = border.get("color", "#000000")
 
-                if bg_color.startswith("#"):
-                    bg_color = "FF" + bg_color[1:]
-                cell.fill = PatternFill(
-                    start_color=bg_color, end_color=bg_color, fill_type="solid"
+            if border_style not in self.VALID_BORDER_STYLES:
+                raise InvalidBorderStyleError(
+                    border_style=border_style,
+                    allowed_styles=self.VALID_BORDER_STYLES,
                 )
 
-            # Apply alignment and wrap text
-            if alignment or wrap_text is not None:
-                if alignment:
-                    vertical_align = alignment.get("vertical")
-                    horizontal_align = alignment.get("horizontal")
-
-                    if (
-                        vertical_align
-                        and vertical_align not in self.VALID_VERTICAL_ALIGNMENTS
-                    ):
-                        raise InvalidAlignmentError(
-                            alignment_type="vertical",
-                            alignment_value=vertical_align,
-                            allowed_values=self.VALID_VERTICAL_ALIGNMENTS,
-                        )
-                    if (
-                        horizontal_align
-                        and horizontal_align not in self.VALID_HORIZONTAL_ALIGNMENTS
-                    ):
-                        raise InvalidAlignmentError(
-                            alignment_type="horizontal",
-                            alignment_value=horizontal_align,
-                            allowed_values=self.VALID_HORIZONTAL_ALIGNMENTS,
-                        )
+            if not re.match(r"^#[0-9A-Fa-f]{6}$", border_color):
+                raise InvalidColorError(color_type="border", color=border_color)
 
-                align_args = {
-                    "horizontal": horizontal_align if horizontal_align else None,
-                    "vertical": vertical_align if vertical_align else None,
-                    "wrap_text": wrap_text
-                    if wrap_text is not None
-                    else cell.alignment.wrap_text,
-                }
-                cell.alignment = Alignment(**align_args)
-
-            # Set column width and row height
-            if cell_width is not None:
-                sheet.column_dimensions[col_letter].width = cell_width
-            if cell_height is not None:
-                sheet.row_dimensions[cell.row].height = cell_height
-
-            # Apply borders
-            if border is not None:
-                border_sides = {}
-                border_style = border.get("style", "thin")
-                border_color = border.get("color", "#000000")
-
-                if border_style not in self.VALID_BORDER_STYLES:
-                    raise InvalidBorderStyleError(
-                        border_style=border_style,
-                        allowed_styles=self.VALID_BORDER_STYLES,
-                    )
+            side = Side(border_style=border_style, color="FF" + border_color[1:])
+            cell_border = Border(
+                **{name: side for name in ["left", "right", "top", "bottom"] if border.get(name)}
+            )
 
-                if not re.match(r"^#[0-9A-Fa-f]{6}$", border_color):
-                    raise InvalidColorError(color_type="border", color=border_color)
+        styles = {}
 
-                # Convert color to ARGB
-                if border_color.startswith("#"):
-                    border_color = "FF" + border_color[1:]
+        def apply(cell: Any) -> None:
+            formatted_style = styles.get(cell._style)
+            if formatted_style is not None:
+                cell._style = copy(formatted_style)
+                return
 
-                # Define sides based on the border dictionary
-                if border.get("left"):
-                    border_sides["left"] = Side(
-                        border_style=border_style, color=border_color
-                    )
-                if border.get("right"):
-                    border_sides["right"] = Side(
-                        border_style=border_style, color=border_color
-                    )
-                if border.get("top"):
-                    border_sides["top"] = Side(
-                        border_style=border_style, color=border_color
-                    )
-                if border.get("bottom"):
-                    border_sides["bottom"] = Side(
-                        border_style=border_style, color=border_color
-                    )
+            original_style = copy(cell._style)
+            current_font = cell.font
+            cell.font = Font(
+                name=font_name if font_name else current_font.name,
+                bold=bold if bold is not None else current_font.bold,
+                italic=italic if italic is not None else current_font.italic,
+                underline="single" if underline else current_font.underline,
+                size=font_size if font_size else current_font.size,
+                color=font_color if font_color is not None else current_font.color,
+                strike=strike_through if strike_through is not None else current_font.strike,
+            )
+
+            if fill is not None:
+                cell.fill = fill
+
+            if alignment or wrap_text is not None:
+                cell.alignment = Alignment(
+                    horizontal=horizontal_align if horizontal_align else None,
+                    vertical=vertical_align if vertical_align else None,
+                    wrap_text=wrap_text if wrap_text is not None else cell.alignment.wrap_text,
+                )
+
+            if cell_border is not None:
+                cell.border = cell_border
+
+            styles[original_style] = copy(cell._style)
 
-                cell.border = Border(**border_sides)
+        return apply
+
+    @not_keyword
+    def __resize_formatted_cells(
+        self,
+        sheet: excel.worksheet.worksheet.Worksheet,
+        cells: List[Any],
+        cell_width: Optional[Union[int, float]],
+        cell_height: Optional[Union[int, float]],
+        auto_fit_width: Optional[bool],
+        auto_fit_height: Optional[bool],
+    ) -> None:
+        """
+        Helper method to set the column widths and row heights of formatted cells, either to the given sizes or fitted
+        to the longest value of each column and the tallest value of each row.
+        """
+        widths = {}
+        heights = {}
+        for cell in cells:
+            col_letter = get_column_letter(cell.column)
+            cell_value = str(cell.value) if cell.value else ""
 
             if auto_fit_width:
-                max_length = max(len(cell_value), len(col_letter))
-                column_width = max_length + 2
-                sheet.column_dimensions[col_letter].width = column_width
+                column_width = max(len(cell_value), len(col_letter)) + 2
+                widths[col_letter] = max(widths.get(col_letter, 0), column_width)
+            elif cell_width is not None:
+                widths[col_letter] = cell_width
 
             if auto_fit_height:
-                max_line_count = cell_value.count("\n") + 1
-                row_height = max(15, max_line_count * 15)
-                sheet.row_dimensions[int(row_num)].height = row_height
+                row_height = max(15, (cell_value.count("\n") + 1) * 15)
+                heights[cell.row] = max(heights.get(cell.row, 0), row_height)
+            elif cell_height is not None:
+                heights[cell.row] = cell_height
 
-            active_workbook.save(self.__get_active_workbook_name())
-            logger.info(f"Formatted cell {cell_name}.")
+        for col_letter, width in widths.items():
+            sheet.column_dimensions[col_letter].width = width
+        for row, height in heights.items():
+            sheet.row_dimensions[row].height = height
 
-        except ValueError:
-            raise InvalidCellAddressError(cell_name)
+    @not_keyword
+    def __read_excel_files(
+        self, file_list: List[str], max_workers: Optional[int] = None
+    ) -> List[List[Tuple[str, Union[DataFrame, Exception]]]]:
+        """
+        Helper method to parse every sheet of the given files, each file exactly once, in file order. Several files
+        are parsed concurrently in worker processes, since parsing is CPU bound and threads would share one
+        interpreter lock.
+        """
+        workers = min(len(file_list), max_workers or os.cpu_count() or 1)
+        if workers == 1:
+            return [_read_excel_sheets(file_path) for file_path in file_list]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_read_excel_sheets, file_list))
+
+    @not_keyword
+    def __concat_frames(self, frames: List[DataFrame]) -> DataFrame:
+        """Helper method to stack DataFrames in one concatenation, rather than growing a result frame by frame."""
+        if not frames:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True, sort=False)
+
+    @not_keyword
+    def __write_frames_streaming(
+        self, output_filename: str, sheets: Dict[str, List[Tuple[DataFrame, Iterator[DataFrame]]]]
+    ) -> None:
+        """
+        Helper method to write each list of streamed parts, pairs of an empty header frame and an iterator over the
+        rows in DataFrames, to its own sheet of a write-only workbook. The parts of a sheet are stacked the way
+        ``pd.concat`` would, with the columns in order of first appearance, but their rows go to disk chunk by chunk
+        rather than being concatenated first. Missing values become empty cells.
+        """
+        workbook = Workbook(write_only=True)
+        for sheet_name, parts in sheets.items():
+            sheet = workbook.create_sheet(title=sheet_name)
+            columns = list(dict.fromkeys(column for header, _ in parts for column in header.columns))
+            if not columns:
+                continue
+            sheet.append(columns)
+            for _, chunks in parts:
+                for chunk in chunks:
+                    chunk = chunk.reindex(columns=columns)
+                    chunk = chunk.astype(object).where(chunk.notna(), None)
+                    for row in chunk.itertuples(index=False, name=None):
+                        sheet.append(row)
+        workbook.save(output_filename)
 
     @keyword
     def merge_excels(
@@ -1885,6 +4590,8 @@ class ExcelSage:
         output_filename: str,
         merge_type: str = "multiple_sheets",
         skip_bad_rows: bool = False,
+        max_workers: Optional[int] = None,
+        write_only: bool = False,
     ) -> None:
         """
         The ``Merge Excels`` keyword provides functionality to merge multiple Excel files into a single output file, supporting three different merge strategies and handling potential row issues with an optional flag.
@@ -1903,6 +4610,16 @@ class ExcelSage:
             The function handles cases where some files may not have as many sheets, logging a warning and skipping those sheets.
             The optional ``skip_bad_rows`` flag allows the keyword to skip problematic rows if set to ``True``.
 
+        Each input file is opened and parsed exactly once, and the files are read concurrently on a pool of at most
+        ``max_workers`` processes (by default one per CPU, never more than the number of files). Every output sheet
+        is then built with a single concatenation of its parts and the output file is written once.
+
+        With ``write_only=True`` neither the inputs nor the output are held in memory. The ``.xlsx`` and ``.xlsm``
+        inputs are streamed from read-only workbooks in chunks of rows, one file after the other and
+        ``max_workers`` aside, into openpyxl write-only worksheets, so memory stays flat however large the merged
+        data is. Each sheet is read twice, first to settle the type of every column as ``pd.read_excel`` would;
+        other file formats are still parsed whole. Header cells are written without pandas' bold header style.
+
         *Examples*
         | ***** Settings *****
         | Library    ExcelSage
@@ -1915,6 +4632,8 @@ class ExcelSage:
         | Example
         |   Merge Excels     file_list=${files}     output_filename=${output_file}    merge_type=sheet_wise     skip_bad_rows=True
         |   Merge Excels     file_list=${files}     output_filename=${output_file}    merge_type=multiple_sheets
+        |   Merge Excels     file_list=${files}     output_filename=${output_file}    merge_type=single_sheet    max_workers=4
+        |   Merge Excels     file_list=${files}     output_filename=${output_file}    merge_type=single_sheet    write_only=True
         """
         self.__argument_type_checker(
             {
@@ -1922,6 +4641,8 @@ class ExcelSage:
                 "output_filename": [output_filename, str],
                 "merge_type": [merge_type, str],
                 "skip_bad_rows": [skip_bad_rows, bool],
+                "max_workers": [max_workers, int, None],
+                "write_only": [write_only, bool],
             }
         )
         if not file_list:
@@ -1933,83 +4654,80 @@ class ExcelSage:
                 "Invalid merge type. Use 'multiple_sheets', 'single_sheet', or 'sheet_wise'."
             )
 
-        writer = pd.ExcelWriter(output_filename, engine="openpyxl")
+        if max_workers is not None and (isinstance(max_workers, bool) or max_workers < 1):
+            raise ValueError(f"Invalid max workers: {max_workers}. It must be a positive integer.")
+        for file_path in file_list:
+            if not os.path.exists(file_path):
+                raise ExcelFileNotFoundError(file_path)
+
+        if write_only:
+            workbooks = [_stream_excel_sheets(file_path, _MERGE_CHUNK_MEMORY) for file_path in file_list]
+        else:
+            workbooks = self.__read_excel_files(file_list, max_workers)
+        merged_sheets = {}
 
         if merge_type == "multiple_sheets":
             # Case 1: Multiple Excel files with multiple sheets merged into a single Excel with all those sheets
-            for file_path in file_list:
-                if not os.path.exists(file_path):
-                    raise ExcelFileNotFoundError(file_path)
-
-                with pd.ExcelFile(file_path) as excel_file:
-                    for sheet_name in excel_file.sheet_names:
-                        df = pd.read_excel(file_path, sheet_name=sheet_name)
-                        unique_sheet_name = (
-                            f"{sheet_name}_{Path(os.path.basename(file_path)).stem}"
-                        )
-                        unique_sheet_name = re.sub(
-                            r"[:/\\?*\[\]]", "_", unique_sheet_name
-                        )[:31]
-                        df.to_excel(writer, sheet_name=unique_sheet_name, index=False)
+            for file_path, sheets in zip(file_list, workbooks):
+                for sheet_name, df in sheets:
+                    if isinstance(df, Exception):
+                        raise df
+                    unique_sheet_name = (
+                        f"{sheet_name}_{Path(os.path.basename(file_path)).stem}"
+                    )
+                    unique_sheet_name = re.sub(
+                        r"[:/\\?*\[\]]", "_", unique_sheet_name
+                    )[:31]
+                    merged_sheets[unique_sheet_name] = [df]
 
         elif merge_type == "single_sheet":
             # Case 2: Multiple Excel files with multiple sheets merged into a single sheet
-            merged_df = pd.DataFrame()
-            for file_path in file_list:
-                if not os.path.exists(file_path):
-                    raise ExcelFileNotFoundError(file_path)
-
-                with pd.ExcelFile(file_path) as excel_file:
-                    for sheet_name in excel_file.sheet_names:
-                        try:
-                            df = pd.read_excel(file_path, sheet_name=sheet_name)
-                            merged_df = pd.concat(
-                                [merged_df, df], ignore_index=True, sort=False
+            frames = []
+            for file_path, sheets in zip(file_list, workbooks):
+                for sheet_name, df in sheets:
+                    if isinstance(df, Exception):
+                        if skip_bad_rows:
+                            print(
+                                f"Skipping rows with issues in {sheet_name} from {file_path}"
                             )
-                        except Exception as e:
-                            if skip_bad_rows:
-                                print(
-                                    f"Skipping rows with issues in {sheet_name} from {file_path}"
-                                )
-                            else:
-                                raise e
+                        else:
+                            raise df
+                    else:
+                        frames.append(df)
 
-            merged_df.to_excel(writer, sheet_name="Merged_Sheet", index=False)
+            merged_sheets["Merged_Sheet"] = frames
 
         elif merge_type == "sheet_wise":
             # Case 3: Merging Excel files sheet-wise
-            for file_path in file_list:
-                if not os.path.exists(file_path):
-                    raise ExcelFileNotFoundError(file_path)
-
-            max_sheets = max([len(pd.ExcelFile(f).sheet_names) for f in file_list])
+            max_sheets = max(len(sheets) for sheets in workbooks)
 
             for i in range(max_sheets):
-                merged_df = pd.DataFrame()
-                for file_path in file_list:
-                    with pd.ExcelFile(file_path) as excel_file:
-                        try:
-                            sheet_name = excel_file.sheet_names[i]
-                            df = pd.read_excel(file_path, sheet_name=sheet_name)
-                            merged_df = pd.concat(
-                                [merged_df, df], ignore_index=True, sort=False
-                            )
-                        except IndexError:
-                            warnings.warn(
-                                f"File {file_path} does not have sheet {i + 1}. Skipping.",
-                                category=UserWarning,
+                frames = []
+                for file_path, sheets in zip(file_list, workbooks):
+                    if i >= len(sheets):
+                        warnings.warn(
+                            f"File {file_path} does not have sheet {i + 1}. Skipping.",
+                            category=UserWarning,
+                        )
+                    elif isinstance(sheets[i][1], Exception):
+                        if skip_bad_rows:
+                            logger.warn(
+                                f"Skipping rows with issues in sheet {i + 1} from {file_path}"
                             )
-                        except Exception as e:
-                            if skip_bad_rows:
-                                logger.warn(
-                                    f"Skipping rows with issues in sheet {i + 1} from {file_path}"
-                                )
-                            else:
-                                raise e
+                        else:
+                            raise sheets[i][1]
+                    else:
+                        frames.append(sheets[i][1])
 
-                merged_df.to_excel(writer, sheet_name=f"Sheet_{i + 1}", index=False)
+                merged_sheets[f"Sheet_{i + 1}"] = frames
 
-        writer.close()
+        if write_only:
+            self.__write_frames_streaming(output_filename, merged_sheets)
+        else:
+            writer = pd.ExcelWriter(output_filename, engine="openpyxl")
+            for sheet_name, frames in merged_sheets.items():
+                self.__concat_frames(frames).to_excel(writer, sheet_name=sheet_name, index=False)
+            writer.close()
         logger.info(f"Merged Excel created: {output_filename}")
 
     @keyword
@@ -2027,7 +4745,7 @@ class ExcelSage:
         """
         sheet_name = self.__get_active_sheet_name(sheet_name)
         self.__argument_type_checker({"cell_range": [cell_range, str]})
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
 
         try:
@@ -2041,7 +4759,7 @@ class ExcelSage:
             )
 
         sheet.merge_cells(cell_range)
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Merged cells in range {cell_range}.")
 
     @keyword
@@ -2059,7 +4777,7 @@ class ExcelSage:
         """
         sheet_name = self.__get_active_sheet_name(sheet_name)
         self.__argument_type_checker({"cell_range": [cell_range, str]})
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
 
         try:
@@ -2073,7 +4791,7 @@ class ExcelSage:
             )
 
         sheet.unmerge_cells(cell_range)
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(f"Unmerged cells in range {cell_range}.")
 
     @keyword
@@ -2118,7 +4836,7 @@ class ExcelSage:
         start_row = int("".join(filter(str.isdigit, starting_cell)))
         start_col_index = column_index_from_string(start_col_letter)
 
-        active_workbook = self.__get_active_workbook()
+        active_workbook = self.__get_active_workbook(for_write=True)
         sheet = active_workbook[sheet_name]
         headers_range = sheet.iter_rows(
             min_row=start_row,
@@ -2149,12 +4867,7 @@ class ExcelSage:
                 f"Invalid column name or letter: '{column_name_or_letter}'"
             )
 
-        df = pd.read_excel(
-            self.__get_active_workbook_name(),
-            sheet_name=sheet_name,
-            usecols=first_row,
-            header=start_row - 1,
-        )
+        df = self.__sheet_to_dataframe(sheet, start_row, start_col_index)
 
         df_sorted = df.sort_values(by=header_to_fetch, ascending=asc)
         for row_idx, row in enumerate(
@@ -2163,7 +4876,7 @@ class ExcelSage:
             for col_idx, value in enumerate(row, start=start_col_index):
                 sheet.cell(row=row_idx, column=col_idx, value=value)
 
-        active_workbook.save(self.__get_active_workbook_name())
+        self.__save_active_workbook()
         logger.info(
             f"Sorted column '{column_name_or_letter}' and saved changes to '{sheet_name}'."
         )
@@ -2194,6 +4907,14 @@ class ExcelSage:
         When `delete=True`, the duplicate rows are removed from the sheet (keeping the first occurrence) and saved to a file.
         In this case, `output_filename` is mandatory to avoid modifying the source file directly.
         The function returns the number of rows deleted (int) instead of the duplicate data.
+        With ``output_format=row_numbers`` the keyword returns the sheet row numbers of the duplicate rows instead.
+
+        Duplicates are detected by streaming the rows and keeping a compact hash per distinct key, with an exact
+        comparison only for rows whose hashes repeat, so a sheet opened with ``mode=read`` is never held in memory
+        as a whole.
+        The rows are removed from the loaded sheet in a single pass and the result is written once. Afterwards the
+        output file is the active workbook, registered under its file name. Unsaved changes of the source workbook
+        are part of the output; the source alias holds its file as saved and loads it again on next use.
 
         The `overwrite_if_exists` parameter controls whether an existing output file can be overwritten.
         If `overwrite_if_exists=False` (default) and the output file already exists, a `FileAlreadyExistsError` will be raised.
@@ -2254,9 +4975,10 @@ class ExcelSage:
             "list",
             "dict",
             "dataframe",
+            "row_numbers",
         ]:
             raise ValueError(
-                "Invalid output format. Use 'list', 'dict', or 'dataframe'."
+                "Invalid output format. Use 'list', 'dict', 'dataframe', or 'row_numbers'."
             )
 
         try:
@@ -2265,171 +4987,46 @@ class ExcelSage:
             raise InvalidCellAddressError(starting_cell)
 
         start_row = int("".join(filter(str.isdigit, starting_cell)))
-        header_row = start_row - 1
-
-        if column_names_or_letters:
-            if isinstance(column_names_or_letters, str):
-                column_names_or_letters = [column_names_or_letters]
 
-            start_col_letter = "".join(filter(str.isalpha, starting_cell))
-            start_col_index = column_index_from_string(start_col_letter)
+        start_col_letter = "".join(filter(str.isalpha, starting_cell))
+        start_col_index = column_index_from_string(start_col_letter)
 
-            active_workbook = self.__get_active_workbook()
-            sheet = active_workbook[sheet_name]
-            headers_range = sheet.iter_rows(
-                min_row=start_row,
-                max_row=start_row,
-                min_col=start_col_index,
-                values_only=True,
-            )
-            first_row = next(headers_range)
-
-            headers_to_fetch = []
-            for col in column_names_or_letters:
-                if isinstance(col, str) and col in first_row:
-                    headers_to_fetch.append(col)
-                elif col.isalpha() and len(col) < 4:
-                    col_index = column_index_from_string(col)
-                    if col_index - 1 < len(first_row):
-                        header = first_row[col_index - 1]
-                        for col in first_row:
-                            if not isinstance(col, str):
-                                raise ValueError(
-                                    f"{sheet_name} does not have a valid string header: '{col}' found."
-                                )
-                            headers_to_fetch.append(header)
-                    else:
-                        raise ValueError(
-                            f"Column letter '{col}' is out of bounds for the provided sheet."
-                        )
-                else:
-                    raise ValueError(f"Invalid column name or letter: '{col}'")
+        active_workbook = self.__get_active_workbook()
+        sheet = active_workbook[sheet_name]
 
-            df = pd.read_excel(
-                self.__get_active_workbook_name(),
-                sheet_name=sheet_name,
-                usecols=first_row,
-                header=header_row,
-            )
-            duplicates = df[df.duplicated(subset=headers_to_fetch, keep=False)]
-        else:
-            start_col_letter = "".join(filter(str.isalpha, starting_cell))
-            start_col_index = column_index_from_string(start_col_letter)
-
-            active_workbook = self.__get_active_workbook()
-            sheet = active_workbook[sheet_name]
-            headers_range = sheet.iter_rows(
-                min_row=start_row,
-                max_row=start_row,
-                min_col=start_col_index,
-                values_only=True,
-            )
-            first_row = next(headers_range)
+        # Read only columns from starting_cell onwards
+        max_col = self.__get_sheet_extent(sheet)[2]
+        header_values = next(
+            self.__iter_sheet_values(sheet, start_row, start_row, start_col_index, max(max_col, start_col_index))
+        )
 
-            # Read only columns from starting_cell onwards
-            df = pd.read_excel(
-                self.__get_active_workbook_name(),
-                sheet_name=sheet_name,
-                usecols=first_row,
-                header=header_row,
+        key_headers = None
+        if column_names_or_letters:
+            if isinstance(column_names_or_letters, str):
+                column_names_or_letters = [column_names_or_letters]
+            key_headers = self.__get_headers_to_fetch(header_values, column_names_or_letters, sheet_name)
+
+        names = self.__get_table_column_names(header_values, start_col_index)
+        key_offsets = None if key_headers is None else sorted({names.index(name) for name in key_headers})
+        duplicate_rows = []
+        if names:
+            duplicate_rows = self.__find_duplicate_rows(
+                sheet,
+                start_row + 1,
+                start_col_index,
+                start_col_index + len(names) - 1,
+                key_offsets,
+                include_first=not delete,
             )
-            duplicates = df[df.duplicated(keep=False)]
 
         if delete:
-            start_col_letter = "".join(filter(str.isalpha, starting_cell))
-            start_row_num = int("".join(filter(str.isdigit, starting_cell)))
-            start_col_index = column_index_from_string(start_col_letter)
-
-            if column_names_or_letters:
-                df_full = df.copy()
-                df_unique = df_full.drop_duplicates(
-                    subset=headers_to_fetch, keep="first"
-                )
-                original_columns = df_full.columns.tolist()
-            else:
-                df_full = df.copy()
-                df_unique = df_full.drop_duplicates(keep="first")
-                original_columns = df_full.columns.tolist()
+            self.__write_without_rows(sheet_name, duplicate_rows, output_filename)
+            return len(duplicate_rows)
 
-            rows_deleted = len(df_full) - len(df_unique)
+        if output_format.lower().strip() == "row_numbers":
+            return duplicate_rows
 
-            workbook_path = (
-                output_filename
-                if output_filename
-                else self.__get_active_workbook_name()
-            )
-            source_path = self.__get_active_workbook_name()
-
-            if (
-                self.active_workbook_alias
-                and self.active_workbook_alias in self.workbooks
-            ):
-                self.workbooks[self.active_workbook_alias]["workbook"].close()
-
-            source_wb = excel.load_workbook(source_path)
-            source_ws = source_wb[sheet_name]
-
-            max_row = source_ws.max_row
-            max_col = source_ws.max_column
-
-            original_num_cols = len(original_columns)
-            end_col_index = start_col_index + original_num_cols - 1
-
-            data_start_row = start_row_num + 1
-
-            original_max_data_row = data_start_row + len(df_full) - 1
-            if max_row >= data_start_row:
-                clear_to_row = max(original_max_data_row, max_row)
-                for row in range(data_start_row, clear_to_row + 1):
-                    for col in range(
-                        start_col_index, min(end_col_index + 1, max_col + 1)
-                    ):
-                        cell = source_ws.cell(row=row, column=col)
-                        cell.value = None
-
-            if original_num_cols > 0:
-                for col_idx, header_value in enumerate(original_columns):
-                    target_col = start_col_index + col_idx
-                    source_ws.cell(
-                        row=start_row_num, column=target_col, value=header_value
-                    )
-
-            data_to_write = df_unique.values.tolist()
-            for row_idx, row_data in enumerate(data_to_write, start=data_start_row):
-                for col_idx, value in enumerate(row_data):
-                    target_col = start_col_index + col_idx
-                    source_ws.cell(row=row_idx, column=target_col, value=value)
-
-            last_written_row = data_start_row + len(data_to_write) - 1
-            original_last_data_row = data_start_row + len(df_full) - 1
-
-            if original_last_data_row > last_written_row:
-                rows_to_delete = original_last_data_row - last_written_row
-                source_ws.delete_rows(last_written_row + 1, rows_to_delete)
-
-            source_wb.save(workbook_path)
-            source_wb.close()
-
-            if output_filename:
-                loaded_workbook = excel.load_workbook(workbook_path)
-                if workbook_path not in self.workbooks:
-                    self.workbooks[workbook_path] = {
-                        "workbook": loaded_workbook,
-                        "name": workbook_path,
-                    }
-                    self.active_workbook_alias = workbook_path
-            else:
-                loaded_workbook = excel.load_workbook(workbook_path)
-                if (
-                    self.active_workbook_alias
-                    and self.active_workbook_alias in self.workbooks
-                ):
-                    self.workbooks[self.active_workbook_alias]["workbook"] = (
-                        loaded_workbook
-                    )
-                    self.workbooks[self.active_workbook_alias]["name"] = workbook_path
-
-            return rows_deleted
+        duplicates = self.__sheet_to_dataframe(sheet, start_row, start_col_index, row_numbers=duplicate_rows)
 
         if output_format.lower().strip() == "list":
             return duplicates.values.tolist()
@@ -2438,6 +5035,49 @@ class ExcelSage:
         elif output_format.lower().strip() == "dataframe":
             return duplicates.reset_index(drop=True)
 
+    @not_keyword
+    def __write_without_rows(
+        self,
+        sheet_name: str,
+        removed_rows: List[int],
+        output_filename: str,
+        columns: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """
+        Helper method to write the active workbook without the given rows of a sheet to ``output_filename`` and make
+        the result the active workbook, registered under its file name. With ``columns``, a pair of first and last
+        column indices, only the cells within those columns are removed and shifted up.
+
+        The rows are deleted from the loaded worksheet in a single pass and the result is saved once, without copying
+        or reloading the workbook. The loaded workbook, unsaved changes included, then belongs to the output; the
+        source alias loads its file again on next use. A source opened in read mode is loaded once in edit mode
+        instead and left as it is.
+        """
+        source_alias = self.active_workbook_alias
+        entry = self.__get_workbook_entry()
+
+        if entry["read_only"]:
+            workbook = excel.load_workbook(entry["name"])
+        else:
+            workbook = entry["workbook"]
+            if source_alias != output_filename:
+                if entry["dirty"]:
+                    logger.info(f"Unsaved changes of workbook '{source_alias}' are written to '{output_filename}'.")
+                self.__release_workbook(entry)
+
+        if output_filename in self.workbooks and output_filename != source_alias:
+            self.close_workbook(alias=output_filename)
+
+        if removed_rows:
+            self.__remove_sheet_lines(workbook[sheet_name], removed_rows, "row", columns)
+        workbook.save(output_filename)
+        self.__register_workbook(output_filename, workbook, output_filename)
+        self.active_workbook_alias = output_filename
+
+        if self.active_sheet is not None:
+            sheet_title = self.active_sheet.title
+            self.active_sheet = workbook[sheet_title] if sheet_title in workbook.sheetnames else None
+
     @keyword
     def remove_empty_rows(
         self,
@@ -2456,6 +5096,12 @@ class ExcelSage:
 
         The function returns the number of rows removed.
 
+        A cell holding ``None`` or an empty string is empty. The rows are checked in a single pass, however long the
+        sheet is, and the remaining rows of the table are shifted up in place, so cells outside the table columns
+        keep their position. The result is written once. Afterwards the output file is the active workbook,
+        registered under its file name. Unsaved changes of the source workbook are part of the output; the source
+        alias holds its file as saved and loads it again on next use.
+
         The `output_filename` parameter is mandatory to avoid modifying the source file directly.
         The `overwrite_if_exists` parameter controls whether an existing output file can be overwritten.
         If `overwrite_if_exists=False` (default) and the output file already exists, a `FileAlreadyExistsError` will be raised.
@@ -2499,231 +5145,45 @@ class ExcelSage:
             raise InvalidCellAddressError(starting_cell)
 
         start_row = int("".join(filter(str.isdigit, starting_cell)))
-        header_row = start_row - 1
 
+        start_col_letter = "".join(filter(str.isalpha, starting_cell))
+        start_col_index = column_index_from_string(start_col_letter)
+
+        active_workbook = self.__get_active_workbook()
+        sheet = active_workbook[sheet_name]
+
+        max_col = self.__get_sheet_extent(sheet)[2]
+        header_values = next(
+            self.__iter_sheet_values(sheet, start_row, start_row, start_col_index, max(max_col, start_col_index))
+        )
+
+        headers_to_fetch = None
         if column_names_or_letters:
             if isinstance(column_names_or_letters, str):
                 column_names_or_letters = [column_names_or_letters]
+            headers_to_fetch = self.__get_headers_to_fetch(header_values, column_names_or_letters, sheet_name)
 
-            start_col_letter = "".join(filter(str.isalpha, starting_cell))
-            start_col_index = column_index_from_string(start_col_letter)
-
-            active_workbook = self.__get_active_workbook()
-            sheet = active_workbook[sheet_name]
-            headers_range = sheet.iter_rows(
-                min_row=start_row,
-                max_row=start_row,
-                min_col=start_col_index,
-                values_only=True,
-            )
-            first_row = next(headers_range)
-
-            headers_to_fetch = []
-            for col in column_names_or_letters:
-                if isinstance(col, str) and col in first_row:
-                    headers_to_fetch.append(col)
-                elif col.isalpha() and len(col) < 4:
-                    col_index = column_index_from_string(col)
-                    if col_index - 1 < len(first_row):
-                        header = first_row[col_index - 1]
-                        for col in first_row:
-                            if not isinstance(col, str):
-                                raise ValueError(
-                                    f"{sheet_name} does not have a valid string header: '{col}' found."
-                                )
-                            headers_to_fetch.append(header)
-                    else:
-                        raise ValueError(
-                            f"Column letter '{col}' is out of bounds for the provided sheet."
-                        )
-                else:
-                    raise ValueError(f"Invalid column name or letter: '{col}'")
+        names = self.__get_table_column_names(header_values, start_col_index)
+        end_col_index = start_col_index + len(names) - 1
 
-            df = pd.read_excel(
-                self.__get_active_workbook_name(),
-                sheet_name=sheet_name,
-                usecols=first_row,
-                header=header_row,
+        empty_rows = []
+        if names:
+            check_offsets = (
+                range(len(names))
+                if headers_to_fetch is None
+                else sorted({names.index(name) for name in headers_to_fetch})
             )
-            df = df.replace("", pd.NA)
-            df_filtered = df.dropna(subset=headers_to_fetch, how="all")
-            original_columns = df.columns.tolist()
-        else:
-            start_col_letter = "".join(filter(str.isalpha, starting_cell))
-            start_col_index = column_index_from_string(start_col_letter)
-
-            active_workbook = self.__get_active_workbook()
-            sheet = active_workbook[sheet_name]
-            max_col = sheet.max_column
-            headers_range = sheet.iter_rows(
-                min_row=start_row,
-                max_row=start_row,
-                min_col=start_col_index,
-                max_col=min(max_col, start_col_index + 100),
-                values_only=True,
-            )
-            first_row = list(next(headers_range))
-            while first_row and first_row[-1] is None:
-                first_row.pop()
-
-            first_row_filtered = [col for col in first_row if col is not None]
-
-            max_row = sheet.max_row
-            actual_last_data_row = start_row
-            for row_idx in range(
-                start_row + 1, min(max_row + 1, start_row + 10000)
-            ):  # Limit search
-                for col_idx in range(start_col_index, start_col_index + len(first_row)):
-                    cell = sheet.cell(row=row_idx, column=col_idx)
-                    if cell.value is not None and str(cell.value).strip() != "":
-                        actual_last_data_row = row_idx
-                        break
-
-            read_up_to = actual_last_data_row
-            if actual_last_data_row < max_row:
-                next_row = actual_last_data_row + 1
-                has_any_data_anywhere = False
-                for col_idx in range(1, min(sheet.max_column + 1, 100)):
-                    cell = sheet.cell(row=next_row, column=col_idx)
-                    if cell.value is not None and str(cell.value).strip() != "":
-                        has_any_data_anywhere = True
-                        break
-
-                if has_any_data_anywhere or (
-                    next_row == actual_last_data_row + 1
-                    and max_row == actual_last_data_row + 1
-                ):
-                    read_up_to = next_row
-
-            max_row = read_up_to
-            if not first_row_filtered:
-                num_cols = len(first_row)
-                data_rows = []
-                for row in sheet.iter_rows(
-                    min_row=start_row + 1,
-                    max_row=max_row,
-                    min_col=start_col_index,
-                    max_col=start_col_index + num_cols - 1,
-                    values_only=True,
-                ):
-                    data_rows.append(list(row))
-
-                df = pd.DataFrame(data_rows, columns=first_row[:num_cols])
-            else:
-                num_cols = len(first_row_filtered)
-                col_name_to_idx = {}
-                for idx, val in enumerate(first_row):
-                    if val is not None and val in first_row_filtered:
-                        col_name_to_idx[val] = start_col_index + idx
-
-                data_rows = []
-                for row in sheet.iter_rows(
-                    min_row=start_row + 1,
-                    max_row=max_row,
-                    min_col=start_col_index,
-                    max_col=start_col_index + len(first_row) - 1,
-                    values_only=True,
-                ):
-                    row_data = list(row)
-                    filtered_row = []
-                    for col_name in first_row_filtered:
-                        col_idx = col_name_to_idx[col_name] - start_col_index
-                        if col_idx < len(row_data):
-                            filtered_row.append(row_data[col_idx])
-                        else:
-                            filtered_row.append(None)
-                    data_rows.append(filtered_row)
-
-                df = pd.DataFrame(data_rows, columns=first_row_filtered)
-
-            df = df.replace("", pd.NA)
-            df_filtered = df.dropna(axis=0, how="all")
-            original_columns = df.columns.tolist()
-
-        rows_removed = len(df) - len(df_filtered)
+            empty_rows = self.__find_empty_rows(sheet, start_row + 1, start_col_index, end_col_index, check_offsets)
 
-        workbook_path = output_filename
-        source_path = self.__get_active_workbook_name()
-
-        if rows_removed == 0:
-            if (
-                self.active_workbook_alias
-                and self.active_workbook_alias in self.workbooks
-            ):
-                self.workbooks[self.active_workbook_alias]["workbook"].close()
-
-            source_wb = excel.load_workbook(source_path)
-            source_wb.save(workbook_path)
-            source_wb.close()
-
-            loaded_workbook = excel.load_workbook(workbook_path)
-            if workbook_path not in self.workbooks:
-                self.workbooks[workbook_path] = {
-                    "workbook": loaded_workbook,
-                    "name": workbook_path,
-                }
-                self.active_workbook_alias = workbook_path
+        self.__write_without_rows(
+            sheet_name, empty_rows, output_filename, columns=(start_col_index, end_col_index)
+        )
 
+        if not empty_rows:
             logger.info(f"No empty rows found in sheet '{sheet_name}'.")
-            return 0
-
-        if self.active_workbook_alias and self.active_workbook_alias in self.workbooks:
-            self.workbooks[self.active_workbook_alias]["workbook"].close()
-
-        source_wb = excel.load_workbook(source_path)
-        source_ws = source_wb[sheet_name]
-
-        max_row = source_ws.max_row
-        max_col = source_ws.max_column
-
-        start_col_letter = "".join(filter(str.isalpha, starting_cell))
-        start_row_num = int("".join(filter(str.isdigit, starting_cell)))
-        start_col_index = column_index_from_string(start_col_letter)
-
-        original_num_cols = len(original_columns)
-        end_col_index = start_col_index + original_num_cols - 1
-
-        data_start_row = start_row_num + 1
-
-        original_max_data_row = data_start_row + len(df) - 1
-        if max_row >= data_start_row:
-            clear_to_row = max(original_max_data_row, max_row)
-            for row in range(data_start_row, clear_to_row + 1):
-                for col in range(start_col_index, min(end_col_index + 1, max_col + 1)):
-                    cell = source_ws.cell(row=row, column=col)
-                    cell.value = None
-
-        if original_num_cols > 0:
-            for col_idx, header_value in enumerate(original_columns):
-                target_col = start_col_index + col_idx
-                source_ws.cell(row=start_row_num, column=target_col, value=header_value)
-
-        data_to_write = df_filtered.values.tolist()
-        for row_idx, row_data in enumerate(data_to_write, start=data_start_row):
-            for col_idx, value in enumerate(row_data):
-                target_col = start_col_index + col_idx
-                source_ws.cell(row=row_idx, column=target_col, value=value)
-
-        last_written_row = data_start_row + len(data_to_write) - 1
-        original_last_data_row = data_start_row + len(df) - 1
-
-        if original_last_data_row > last_written_row:
-            rows_to_delete = original_last_data_row - last_written_row
-            source_ws.delete_rows(last_written_row + 1, rows_to_delete)
-
-        source_wb.save(workbook_path)
-        source_wb.close()
-
-        loaded_workbook = excel.load_workbook(workbook_path)
-        if workbook_path not in self.workbooks:
-            self.workbooks[workbook_path] = {
-                "workbook": loaded_workbook,
-                "name": workbook_path,
-            }
-            self.active_workbook_alias = workbook_path
-
-        logger.info(f"Removed {rows_removed} empty row(s) from sheet '{sheet_name}'.")
-        return rows_removed
+        else:
+            logger.info(f"Removed {len(empty_rows)} empty row(s) from sheet '{sheet_name}'.")
+        return len(empty_rows)
 
     @keyword
     def compare_excels(
@@ -2732,11 +5192,32 @@ class ExcelSage:
         target_excel: str,
         source_excel_config: Optional[dict] = None,
         target_excel_config: Optional[dict] = None,
-    ) -> DataFrame:
+        key_columns: Optional[Union[str, List[str]]] = None,
+        memory_limit: Optional[int] = None,
+    ) -> Union[DataFrame, Dict[str, DataFrame]]:
         """
         The ``Compare Excels`` keyword compares two Excel sheets and identifies differences in the data.
         The comparison is based on the values of the specified columns, and the output includes rows that are unique to either of the two sheets. It handles the comparison intelligently, providing options to configure which sheet, starting cell, and columns should be compared for each Excel file.
 
+        With ``key_columns`` the rows of both sheets are matched on the values of those columns instead, so
+        reordered rows still line up, and the keyword returns a dictionary of three DataFrames:
+        - ``added``: the target rows whose key is not in the source.
+        - ``removed``: the source rows whose key is not in the target.
+        - ``changed``: one row per changed cell of the matched rows, with the key values, the ``Column`` name and the ``Source`` and ``Target`` values. Two empty cells count as equal.
+        The rows are matched in a single vectorized join, and the keys must be unique in each sheet.
+
+        Before parsing any cells the keyword checks whether both sheets are known to be identical: the files have
+        the same SHA-256 digest, or the sheet XML, shared strings and styles inside the two xlsx files hash the same,
+        and both configs read the same header cell and columns. In that case only the headers are read and an empty
+        result is returned right away; key uniqueness is not checked then.
+
+        For sheets too large to load, ``memory_limit`` sets a memory budget in megabytes and compares them out of
+        core: both sheets are streamed in row chunks and partitioned by the hash of the key columns (or of whole
+        rows) into temporary spill files, which are then compared bucket by bucket. Each sheet is read twice, first
+        to settle the type of every column over the whole sheet, so the result is the same as without the limit,
+        dtypes included. The differences found are still returned in memory. Out-of-core comparison reads
+        ``.xlsx`` and ``.xlsm`` files only.
+
         *Examples*
         | ***** Settings *****
         | Library    ExcelSage
@@ -2749,6 +5230,9 @@ class ExcelSage:
         | Example
         |   ${differences}    Compare Excels    source_excel=\\path\\to\\excel\\source\\file.xlsx    target_excel=\\path\\to\\excel\\target\\file.xlsx    source_excel_config=${source_config}     target_excel_config=${target_config}
         |   ${differences}    Compare Excels    source_excel=\\path\\to\\excel\\source\\file.xlsx    target_excel=\\path\\to\\excel\\target\\file.xlsx
+        |   ${differences}    Compare Excels    source_excel=\\path\\to\\excel\\source\\file.xlsx    target_excel=\\path\\to\\excel\\target\\file.xlsx    key_columns=Id
+        |   Log    ${differences}[changed]
+        |   ${differences}    Compare Excels    source_excel=\\path\\to\\excel\\source\\file.xlsx    target_excel=\\path\\to\\excel\\target\\file.xlsx    key_columns=Id    memory_limit=512
         """
         self.__argument_type_checker(
             {
@@ -2756,82 +5240,210 @@ class ExcelSage:
                 "target_excel": [target_excel, str],
                 "source_excel_config": [source_excel_config, dict, None],
                 "target_excel_config": [source_excel_config, dict, None],
+                "key_columns": [key_columns, (str, list), None],
+                "memory_limit": [memory_limit, int, None],
             }
         )
+        if memory_limit is not None and (isinstance(memory_limit, bool) or memory_limit < 1):
+            raise ValueError(f"Invalid memory limit: {memory_limit}. It must be a positive integer.")
+
+        if isinstance(key_columns, str):
+            key_columns = [key_columns]
+
+        differences = _compare_sheets(
+            source_excel,
+            source_excel_config,
+            target_excel,
+            target_excel_config,
+            key_columns,
+            memory_limit * 1024 * 1024 if memory_limit is not None else None,
+        )
 
-        def load_excel(file_name: str, config: Optional[dict] = None) -> DataFrame:
-            if not os.path.exists(file_name):
-                raise ExcelFileNotFoundError(file_name)
-
-            sheet_name = config.get("sheet_name", 0) if config else 0
-            starting_cell = config.get("starting_cell", "A1") if config else "A1"
-            columns = config.get("columns", None) if config else None
-
-            try:
-                range_boundaries(starting_cell)
-            except ValueError:
-                raise InvalidCellAddressError(starting_cell)
+        if key_columns is None:
+            if differences.empty:
+                logger.info("No differences found between the two Excel sheets.")
+            else:
+                logger.info(f"Differences found between the two Excel sheets.\n{differences}")
 
-            start_row = int("".join(filter(str.isdigit, starting_cell)))
-            df = pd.read_excel(file_name, sheet_name=sheet_name, header=start_row - 1)
+            return differences
 
-            if columns is not None:
-                missing_columns = [col for col in columns if col not in df.columns]
-                if missing_columns:
-                    raise InvalidColumnNameError(sheet_name, missing_columns)
-                df = df[columns]
+        logger.info(
+            f"Compared the two Excel sheets on {key_columns}: {len(differences['added'])} row(s) added, "
+            f"{len(differences['removed'])} row(s) removed, {len(differences['changed'])} cell(s) changed."
+        )
+        return differences
 
-            return df
+    @not_keyword
+    def __summarize_sheet_diff(
+        self, differences: Union[DataFrame, Dict[str, DataFrame]], key_columns: Optional[List[Any]]
+    ) -> Dict[str, Any]:
+        """Helper method to count the added, removed and changed rows of a ``Compare Excels`` result."""
+        if key_columns is None:
+            origin = differences[differences.columns[-1]]
+            rows_added = int((origin == "Target").sum())
+            rows_removed = int((origin == "Source").sum())
+            rows_changed = None
+        else:
+            rows_added = len(differences["added"])
+            rows_removed = len(differences["removed"])
+            rows_changed = len(differences["changed"][key_columns].drop_duplicates())
 
-        source_df = load_excel(source_excel, source_excel_config)
-        target_df = load_excel(target_excel, target_excel_config)
+        return {
+            "status": "identical" if rows_added == rows_removed == (rows_changed or 0) == 0 else "different",
+            "rows_added": rows_added,
+            "rows_removed": rows_removed,
+            "rows_changed": rows_changed,
+        }
 
-        source_columns = set(source_df.columns.tolist())
-        target_columns = set(target_df.columns.tolist())
+    @keyword
+    def compare_workbooks(
+        self,
+        source_excel: str,
+        target_excel: str,
+        pair_by: str = "name",
+        key_columns: Optional[Union[str, List[str], Dict[str, Union[str, List[str]]]]] = None,
+        starting_cell: str = "A1",
+        include_details: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        The ``Compare Workbooks`` keyword compares every sheet of two Excel files in one call. Sheets are paired by
+        ``name`` (default) or by ``position``, and each pair is compared the way ``Compare Excels`` compares two
+        sheets, with the header at ``starting_cell``.
 
-        if source_columns != target_columns:
-            missing_in_source = (
-                target_columns - source_columns
-                if len(target_columns - source_columns) != 0
-                else None
-            )
-            missing_in_target = (
-                source_columns - target_columns
-                if len(source_columns - target_columns) != 0
-                else None
-            )
-            error_message = f"Column mismatch found in excel files.\nMissing in source: {missing_in_source}\nMissing in target: {missing_in_target}"
-            raise ColumnMismatchError(error_message)
+        ``key_columns`` matches rows on key columns, either the same columns for every sheet or a dictionary from
+        source sheet name to its key columns; sheets without an entry are compared by whole rows.
 
-        excel_column_name = "Excel_Source"
-        if "Excel_Source" in source_df.columns or "Excel_Source" in target_df.columns:
-            excel_column_name = "__Excel_Source__"
+        The keyword returns one summary per sheet pair, in source sheet order followed by the sheets found only in
+        the target. Each summary holds the ``source_sheet`` and ``target_sheet`` names, a ``status`` of
+        ``identical``, ``different``, ``missing_in_source`` or ``missing_in_target``, and the ``rows_added``,
+        ``rows_removed`` and ``rows_changed`` counts. Changed rows are only counted with key columns; in whole-row
+        comparisons a changed row shows up as removed and added. With ``include_details=True`` each summary also
+        carries the ``differences`` returned by ``Compare Excels``.
 
-        source_df[excel_column_name] = "Source"
-        target_df[excel_column_name] = "Target"
+        The sheet names are read from the file structure without parsing any cells, and sheets known to be
+        identical are not parsed either. The sheet pairs are compared concurrently on a pool of at most
+        ``max_workers`` processes (by default one per CPU).
 
-        diff_df = pd.concat([source_df, target_df]).drop_duplicates(
-            subset=source_df.columns.difference([excel_column_name]), keep=False
+        *Examples*
+        | ***** Settings *****
+        | Library    ExcelSage
+        |
+        | ***** Variables *****
+        | &{keys}    Orders=Order Id    Customers=Customer Id
+        |
+        | ***** Test Cases *****
+        | Example
+        |   ${summary}    Compare Workbooks    source_excel=\\path\\to\\excel\\source\\file.xlsx    target_excel=\\path\\to\\excel\\target\\file.xlsx
+        |   Should Be Equal    ${summary}[0][status]    identical
+        |   ${summary}    Compare Workbooks    source_excel=\\path\\to\\excel\\source\\file.xlsx    target_excel=\\path\\to\\excel\\target\\file.xlsx    pair_by=position    key_columns=${keys}    include_details=True
+        """
+        self.__argument_type_checker(
+            {
+                "source_excel": [source_excel, str],
+                "target_excel": [target_excel, str],
+                "pair_by": [pair_by, str],
+                "key_columns": [key_columns, (str, list, dict), None],
+                "starting_cell": [starting_cell, str],
+                "include_details": [include_details, bool],
+                "max_workers": [max_workers, int, None],
+            }
         )
+        if pair_by not in ["name", "position"]:
+            raise ValueError("Invalid pair by value. Use 'name' or 'position'.")
+        if max_workers is not None and (isinstance(max_workers, bool) or max_workers < 1):
+            raise ValueError(f"Invalid max workers: {max_workers}. It must be a positive integer.")
+        try:
+            range_boundaries(starting_cell)
+        except ValueError:
+            raise InvalidCellAddressError(starting_cell)
+        for file_name in (source_excel, target_excel):
+            if not os.path.exists(file_name):
+                raise ExcelFileNotFoundError(file_name)
+
+        source_sheets = _worksheet_names(source_excel)
+        target_sheets = _worksheet_names(target_excel)
+        if pair_by == "name":
+            pairs = [(name, name if name in target_sheets else None) for name in source_sheets]
+            pairs += [(None, name) for name in target_sheets if name not in source_sheets]
+        else:
+            pairs = [
+                (
+                    source_sheets[index] if index < len(source_sheets) else None,
+                    target_sheets[index] if index < len(target_sheets) else None,
+                )
+                for index in range(max(len(source_sheets), len(target_sheets)))
+            ]
 
-        if diff_df.empty:
-            logger.info("No differences found between the two Excel sheets.")
+        def sheet_keys(sheet_name: str) -> Optional[List[Any]]:
+            keys = key_columns.get(sheet_name) if isinstance(key_columns, dict) else key_columns
+            return [keys] if isinstance(keys, str) else keys
+
+        tasks = [
+            (
+                source_excel,
+                {"sheet_name": source_sheet, "starting_cell": starting_cell},
+                target_excel,
+                {"sheet_name": target_sheet, "starting_cell": starting_cell},
+                sheet_keys(source_sheet),
+            )
+            for source_sheet, target_sheet in pairs
+            if source_sheet is not None and target_sheet is not None
+        ]
+        workers = min(len(tasks), max_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            results = [_compare_sheets(*task) for task in tasks]
         else:
-            logger.info(f"Differences found between the two Excel sheets.\n{diff_df}")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_compare_sheets, *zip(*tasks)))
+        results = iter(results)
+
+        summaries = []
+        for source_sheet, target_sheet in pairs:
+            summary = {"source_sheet": source_sheet, "target_sheet": target_sheet}
+            if source_sheet is None or target_sheet is None:
+                summary.update(
+                    status="missing_in_source" if source_sheet is None else "missing_in_target",
+                    rows_added=None,
+                    rows_removed=None,
+                    rows_changed=None,
+                )
+            else:
+                differences = next(results)
+                summary.update(self.__summarize_sheet_diff(differences, sheet_keys(source_sheet)))
+                if include_details:
+                    summary["differences"] = differences
+            summaries.append(summary)
+            logger.info(
+                f"Sheet '{source_sheet}' / '{target_sheet}': {summary['status']}, {summary['rows_added']} row(s) "
+                f"added, {summary['rows_removed']} removed, {summary['rows_changed']} changed."
+            )
 
-        return diff_df
+        return summaries
 
     @keyword
     def export_to_csv(
         self,
-        filename: str,
-        sheet_name: str,
-        output_filename: str,
+        filename: Optional[str] = None,
+        sheet_name: Optional[str] = None,
+        output_filename: Optional[str] = None,
         separator: str = ",",
         overwrite_if_exists: bool = False,
-    ) -> str:
+        max_workers: Optional[int] = None,
+    ) -> Union[str, List[str]]:
         """
-        The `Export To CSV` keyword reads the data from a specified sheet in an Excel file and exports it to a CSV file.
+        The `Export To CSV` keyword exports the data of a sheet to a CSV file. The rows are streamed from the
+        worksheet straight into the CSV file, so memory use stays constant however large the sheet is.
+
+        With ``filename`` the sheet is read from that Excel file through a read-only workbook. Without it, the sheet
+        is taken from the active workbook as it is in memory, including changes not saved yet. ``sheet_name``
+        defaults to the first sheet of the file, or to the active sheet of the active workbook.
+
+        With ``sheet_name=*`` every sheet is exported to its own file, named after ``output_filename`` with the
+        sheet name appended (``report.csv`` gives ``report_Sheet1.csv``, ``report_Sheet2.csv``, ...), and the list
+        of files is returned. With ``filename`` the sheets are exported concurrently on a pool of at most
+        ``max_workers`` processes, each reading the file on its own. The sheets of the active workbook are exported
+        one after another, since the workbook in memory cannot be shared with other processes.
 
         *Note*
         Separator must be a string of length 1
@@ -2843,24 +5455,75 @@ class ExcelSage:
         | ***** Test Cases *****
         | Example
         |   Export To CSV     filename=\\path\\to\\excel\\file.xlsx    sheet_name=Sheet1    output_filename=\\path\\to\\csv\\file.csv    separator=;
+        |   Open Workbook     workbook_name=\\path\\to\\excel\\file.xlsx
+        |   ${files}    Export To CSV     sheet_name=*    output_filename=\\path\\to\\csv\\report.csv
         """
         self.__argument_type_checker(
             {
-                "filename": [filename, str],
+                "filename": [filename, str, None],
+                "sheet_name": [sheet_name, str, None],
                 "output_filename": [output_filename, str],
                 "overwrite_if_exists": [overwrite_if_exists, bool],
                 "separator": [separator, str],
+                "max_workers": [max_workers, int, None],
             }
         )
-        if not os.path.exists(filename):
-            raise ExcelFileNotFoundError(filename)
+        if max_workers is not None and (isinstance(max_workers, bool) or max_workers < 1):
+            raise ValueError(f"Invalid max workers: {max_workers}. It must be a positive integer.")
 
-        if os.path.exists(output_filename) and not overwrite_if_exists:
-            raise FileAlreadyExistsError(output_filename)
+        if filename is None:
+            workbook = self.__get_active_workbook()
+            sheet_names = workbook.sheetnames if sheet_name == "*" else [self.__get_active_sheet_name(sheet_name)]
+        else:
+            if not os.path.exists(filename):
+                raise ExcelFileNotFoundError(filename)
+            file_sheets = _worksheet_names(filename)
+            if sheet_name == "*":
+                sheet_names = file_sheets
+            elif sheet_name is None:
+                sheet_names = file_sheets[:1]
+            elif sheet_name in file_sheets:
+                sheet_names = [sheet_name]
+            else:
+                raise SheetDoesntExistsError(sheet_name)
+
+        if sheet_name == "*":
+            output_path = Path(output_filename)
+            output_files = [
+                str(output_path.with_name(f"{output_path.stem}_{name}{output_path.suffix}")) for name in sheet_names
+            ]
+        else:
+            output_files = [output_filename]
+        for output_file in output_files:
+            if os.path.exists(output_file) and not overwrite_if_exists:
+                raise FileAlreadyExistsError(output_file)
+
+        workers = min(len(sheet_names), max_workers or os.cpu_count() or 1)
+        if filename is None:
+            row_counts = [
+                _write_sheet_csv(workbook[name], output_file, separator)
+                for name, output_file in zip(sheet_names, output_files)
+            ]
+        elif workers <= 1:
+            row_counts = [
+                _export_csv_file(filename, name, output_file, separator)
+                for name, output_file in zip(sheet_names, output_files)
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                row_counts = list(
+                    executor.map(
+                        _export_csv_file,
+                        [filename] * len(sheet_names),
+                        sheet_names,
+                        output_files,
+                        [separator] * len(sheet_names),
+                    )
+                )
 
-        df = pd.read_excel(filename, sheet_name=sheet_name)
-        df.to_csv(output_filename, index=False, sep=separator)
-        return output_filename
+        for name, output_file, row_count in zip(sheet_names, output_files, row_counts):
+            logger.info(f"Exported {row_count} row(s) of sheet '{name}' to '{output_file}'.")
+        return output_files if sheet_name == "*" else output_files[0]
 
     @keyword
     def get_column_headers(
@@ -3001,7 +5664,7 @@ class ExcelSage:
 
         active_workbook = self.__get_active_workbook()
         sheet = active_workbook[sheet_name]
-        actual_count = sheet.max_row
+        actual_count = self.__get_sheet_extent(sheet)[3]
 
         default_message = (
             f"Expected {expected_count} rows in sheet '{sheet_name}', but found {actual_count}."
@@ -3037,7 +5700,7 @@ class ExcelSage:
 
         active_workbook = self.__get_active_workbook()
         sheet = active_workbook[sheet_name]
-        actual_count = sheet.max_column
+        actual_count = self.__get_sheet_extent(sheet)[2]
 
         default_message = (
             f"Expected {expected_count} columns in sheet '{sheet_name}', but found {actual_count}."
@@ -3166,15 +5829,16 @@ class ExcelSage:
 
         active_workbook = self.__get_active_workbook()
         sheet = active_workbook[sheet_name]
-        column_values = self.__get_column_values_by_name_or_letter(
-            sheet, column_name_or_letter
+        column_index = self.__get_column_index_by_name_or_letter(sheet, column_name_or_letter)
+        duplicate_rows = self.__find_duplicate_rows(
+            sheet, 2, column_index, column_index, trim_empty_rows=False
         )
 
         default_message = (
             f"Expected column '{column_name_or_letter}' in sheet '{sheet_name}' to have no duplicates, but duplicates were found."
         )
         BuiltIn().should_be_true(
-            len(column_values) == len(set(column_values)),
+            not duplicate_rows,
             message or default_message,
         )
 
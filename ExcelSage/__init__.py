@@ -21,6 +21,8 @@ from .ExcelSage import (
     InvalidColorError,
     InvalidAlignmentError,
     InvalidBorderStyleError,
+    WorkbookTransactionError,
+    WorkbookReadOnlyError,
 )
 
 __all__ = [
@@ -46,5 +48,7 @@ __all__ = [
     "InvalidColorError",
     "InvalidAlignmentError",
     "InvalidBorderStyleError",
+    "WorkbookTransactionError",
+    "WorkbookReadOnlyError",
 ]
 
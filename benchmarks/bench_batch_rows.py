@@ -0,0 +1,56 @@
+"""
+Compares deleting 200 scattered rows from a 20,000 x 10 worksheet one at a time with a single Delete Rows call.
+
+Run from the project root:
+
+    python benchmarks/bench_batch_rows.py [rows] [columns] [deleted rows]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook  # noqa: E402
+
+from ExcelSage import ExcelSage  # noqa: E402
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<45} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main(rows: int = 20_000, columns: int = 10, deleted: int = 200) -> None:
+    workbook_path = os.path.join(tempfile.mkdtemp(), "bench_batch_rows.xlsx")
+    Workbook().save(workbook_path)
+    data = [[row * columns + column for column in range(columns)] for row in range(rows)]
+    row_indices = sorted(random.Random(0).sample(range(1, rows + 1), deleted))
+
+    excel_sage = ExcelSage()
+    excel_sage.open_workbook(workbook_name=workbook_path, alias="batch", autosave="manual")
+    excel_sage.open_workbook(workbook_name=workbook_path, alias="single", autosave="manual")
+
+    print(f"Deleting {deleted:,} of {rows:,} rows x {columns} columns (in memory)")
+    excel_sage.switch_workbook(alias="single")
+    excel_sage.append_rows(rows_data=data)
+    timed(
+        "Delete Row per index (bottom up)",
+        lambda: [excel_sage.delete_row(row_index=index) for index in reversed(row_indices)],
+    )
+    excel_sage.switch_workbook(alias="batch")
+    timed("Append Rows", lambda: excel_sage.append_rows(rows_data=data))
+    timed("Delete Rows", lambda: excel_sage.delete_rows(row_indices=row_indices))
+
+    while excel_sage.workbooks:
+        excel_sage.close_workbook()
+    os.remove(workbook_path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:4]))
@@ -0,0 +1,69 @@
+"""
+Compares Compare Excels on two identical 100,000 x 4 sheets, once as byte-identical files and once as files that
+only differ in another sheet, with parsing both sheets in full as the previous implementation did.
+
+Run from the project root:
+
+    python benchmarks/bench_compare_fingerprint.py [rows]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook  # noqa: E402
+
+from ExcelSage import ExcelSage  # noqa: E402
+from ExcelSage.ExcelSage import _diff_rows, _load_compare_frame  # noqa: E402
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<45} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main(rows: int = 100_000) -> None:
+    directory = tempfile.mkdtemp()
+    source_path = os.path.join(directory, "source.xlsx")
+    copy_path = os.path.join(directory, "copy.xlsx")
+    target_path = os.path.join(directory, "target.xlsx")
+
+    workbook = Workbook()
+    workbook.active.title = "Data"
+    workbook["Data"].append(["Id", "Account", "Amount", "Memo"])
+    for row in range(rows):
+        workbook["Data"].append([row, f"ACC-{row % 5000:05d}", row * 1.5, f"Entry {row}"])
+    workbook.create_sheet("Run").append(["Started", 1])
+    workbook.save(source_path)
+    shutil.copy(source_path, copy_path)
+    workbook["Run"]["B1"] = 2
+    workbook.save(target_path)
+
+    excel_sage = ExcelSage()
+
+    print(f"Comparing identical sheets of {rows:,} rows")
+    timed(
+        "Full parse and diff (previous)",
+        lambda: _diff_rows(_load_compare_frame(source_path), _load_compare_frame(copy_path)),
+    )
+    timed(
+        "Compare Excels (byte-identical files)",
+        lambda: excel_sage.compare_excels(source_excel=source_path, target_excel=copy_path),
+    )
+    timed(
+        "Compare Excels (same sheet XML)",
+        lambda: excel_sage.compare_excels(source_excel=source_path, target_excel=target_path),
+    )
+
+    for path in (source_path, copy_path, target_path):
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
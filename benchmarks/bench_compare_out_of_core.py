@@ -0,0 +1,67 @@
+"""
+Compares the peak memory and time of Compare Excels on two 200,000 x 5 sheets loaded whole with the out-of-core
+comparison under a 32 MB memory limit. Each run happens in a fresh process, whose peak resident set size is reported
+next to that of a process that only imported the library.
+
+Run from the project root:
+
+    python benchmarks/bench_compare_out_of_core.py [rows] [memory_limit]
+"""
+
+import datetime
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook  # noqa: E402
+
+from ExcelSage import ExcelSage  # noqa: E402
+
+
+def run(queue, kwargs):
+    start = time.perf_counter()
+    if kwargs is not None:
+        ExcelSage().compare_excels(**kwargs)
+    queue.put((time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+
+
+def measured(label, kwargs):
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run, args=(queue, kwargs))
+    process.start()
+    elapsed, peak = queue.get()
+    process.join()
+    print(f"{label:<45} {elapsed:8.3f}s {peak:10.1f} MiB")
+
+
+def main(rows: int = 200_000, memory_limit: int = 32) -> None:
+    directory = tempfile.mkdtemp()
+    source_path = os.path.join(directory, "source.xlsx")
+    target_path = os.path.join(directory, "target.xlsx")
+    for path, delta in ((source_path, 0), (target_path, 1)):
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(["Id", "Region", "Amount", "Note", "Date"])
+        for row in range(rows):
+            amount = row * 1.5 + (delta if row % 100 == 0 else 0)
+            date = datetime.datetime(2020, 1, 1) + datetime.timedelta(days=row % 1000)
+            sheet.append([row, f"Region {row % 20}", amount, f"Row {row}", date])
+        workbook.save(path)
+
+    print(f"Comparing two sheets of {rows:,} rows x 5 columns on Id")
+    measured("Import only", None)
+    compare = {"source_excel": source_path, "target_excel": target_path, "key_columns": "Id"}
+    measured("Compare Excels (in memory)", compare)
+    measured(f"Compare Excels (memory_limit={memory_limit})", {**compare, "memory_limit": memory_limit})
+
+    os.remove(source_path)
+    os.remove(target_path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,79 @@
+"""
+Compares validating a 10-sheet report with one Compare Excels call per sheet against a single Compare Workbooks call.
+Each sheet holds 10,000 x 4 rows and two sheets of the target differ; the other sheets are rewritten unchanged.
+
+Run from the project root:
+
+    python benchmarks/bench_compare_workbooks.py [sheets] [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook  # noqa: E402
+
+from ExcelSage import ExcelSage  # noqa: E402
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<45} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main(sheets: int = 10, rows: int = 10_000) -> None:
+    directory = tempfile.mkdtemp()
+    source_path = os.path.join(directory, "source.xlsx")
+    target_path = os.path.join(directory, "target.xlsx")
+
+    for path, changed in ((source_path, ()), (target_path, (2, 7))):
+        workbook = Workbook()
+        workbook.remove(workbook.active)
+        for index in range(sheets):
+            sheet = workbook.create_sheet(title=f"Report {index + 1}")
+            sheet.append(["Id", "Region", "Amount", "Note"])
+            for row in range(rows):
+                amount = row * 1.5 + (1 if index in changed and row % 100 == 0 else 0)
+                sheet.append([row, f"Region {row % 20}", amount, f"Row {row}"])
+        workbook.save(path)
+
+    excel_sage = ExcelSage()
+    sheet_names = [f"Report {index + 1}" for index in range(sheets)]
+
+    print(f"Comparing {sheets} sheets of {rows:,} rows")
+    timed(
+        "Compare Excels per sheet (key_columns=Id)",
+        lambda: [
+            excel_sage.compare_excels(
+                source_excel=source_path,
+                target_excel=target_path,
+                source_excel_config={"sheet_name": name},
+                target_excel_config={"sheet_name": name},
+                key_columns="Id",
+            )
+            for name in sheet_names
+        ],
+    )
+    timed(
+        "Compare Workbooks (max_workers=1)",
+        lambda: excel_sage.compare_workbooks(
+            source_excel=source_path, target_excel=target_path, key_columns="Id", max_workers=1
+        ),
+    )
+    summaries = timed(
+        "Compare Workbooks (process pool)",
+        lambda: excel_sage.compare_workbooks(source_excel=source_path, target_excel=target_path, key_columns="Id"),
+    )
+    print([summary["status"] for summary in summaries].count("different"), "sheets differ")
+
+    os.remove(source_path)
+    os.remove(target_path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,63 @@
+"""
+Compares the time and peak traced memory of Create Workbook writing 50,000 x 10 generated rows with a regular
+workbook and reload, and streamed through a write-only worksheet without the reload. Memory is traced on a second,
+untimed run.
+
+Run from the project root:
+
+    python benchmarks/bench_create_workbook.py [rows] [columns]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ExcelSage import ExcelSage  # noqa: E402
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<45} {elapsed:8.3f}s {peak / 1024 / 1024:10.1f} MiB peak")
+
+
+def main(rows: int = 50_000, columns: int = 10) -> None:
+    workbook_path = os.path.join(tempfile.mkdtemp(), "bench_create_workbook.xlsx")
+
+    def generate_rows():
+        for row in range(rows):
+            yield [row * columns + column for column in range(columns)]
+
+    excel_sage = ExcelSage()
+
+    print(f"Creating {rows:,} rows x {columns} columns")
+    def create_default():
+        excel_sage.create_workbook(workbook_name=workbook_path, sheet_data=generate_rows(), overwrite_if_exists=True)
+        excel_sage.close_workbook()
+
+    timed("Create Workbook (default)", create_default)
+    timed(
+        "Create Workbook (write_only, no reload)",
+        lambda: excel_sage.create_workbook(
+            workbook_name=workbook_path,
+            sheet_data=generate_rows(),
+            overwrite_if_exists=True,
+            write_only=True,
+            load_after_create=False,
+        ),
+    )
+
+    os.remove(workbook_path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,93 @@
+"""
+Compares the peak memory and time of exporting a 200,000 x 5 sheet to CSV with ``pd.read_excel`` and
+``DataFrame.to_csv`` (the previous approach) with the streaming Export To CSV, from the file and from the open
+workbook. Each run happens in a freshly spawned process, whose peak resident set size (Linux only) is reported next
+to that of a process that only imported the library.
+
+Run from the project root:
+
+    python benchmarks/bench_export_to_csv.py [rows]
+"""
+
+import datetime
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+from openpyxl import Workbook  # noqa: E402
+
+from ExcelSage import ExcelSage  # noqa: E402
+
+
+def export_previous(workbook_path, output_path):
+    pd.read_excel(workbook_path, sheet_name="Data").to_csv(output_path, index=False)
+
+
+def export_from_file(workbook_path, output_path):
+    ExcelSage().export_to_csv(
+        filename=workbook_path, sheet_name="Data", output_filename=output_path, overwrite_if_exists=True
+    )
+
+
+def export_from_open_workbook(workbook_path, output_path):
+    excel_sage = ExcelSage()
+    excel_sage.open_workbook(workbook_name=workbook_path, mode="read")
+    excel_sage.export_to_csv(output_filename=output_path, overwrite_if_exists=True)
+    excel_sage.close_workbook()
+
+
+def peak_memory():
+    # VmHWM starts over in a spawned process, unlike ru_maxrss which survives the exec of the interpreter.
+    with open("/proc/self/status") as status:
+        return next(int(line.split()[1]) for line in status if line.startswith("VmHWM")) / 1024
+
+
+def run(queue, func, args):
+    start = time.perf_counter()
+    if func is not None:
+        func(*args)
+    queue.put((time.perf_counter() - start, peak_memory()))
+
+
+def measured(label, func, *args):
+    # Spawned rather than forked, so the memory of the workbook built by the parent does not count.
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=run, args=(queue, func, args))
+    process.start()
+    elapsed, peak = queue.get()
+    process.join()
+    print(f"{label:<45} {elapsed:8.3f}s {peak:10.1f} MiB")
+
+
+def main(rows: int = 200_000) -> None:
+    directory = tempfile.mkdtemp()
+    workbook_path = os.path.join(directory, "export.xlsx")
+    output_path = os.path.join(directory, "export.csv")
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Data"
+    sheet.append(["Id", "Region", "Amount", "Note", "Date"])
+    for row in range(rows):
+        date = datetime.datetime(2020, 1, 1) + datetime.timedelta(days=row % 1000)
+        sheet.append([row, f"Region {row % 20}", row * 1.5, f"Row {row}", date])
+    workbook.save(workbook_path)
+    workbook.close()
+
+    print(f"Exporting {rows:,} rows x 5 columns to CSV")
+    measured("Import only", None)
+    measured("read_excel + to_csv", export_previous, workbook_path, output_path)
+    measured("Export To CSV (filename)", export_from_file, workbook_path, output_path)
+    measured("Export To CSV (open workbook, read mode)", export_from_open_workbook, workbook_path, output_path)
+
+    os.remove(workbook_path)
+    os.remove(output_path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
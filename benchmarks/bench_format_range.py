@@ -0,0 +1,55 @@
+"""
+Compares formatting a 10,000 cell region cell by cell with a single Format Range call.
+
+Run from the project root:
+
+    python benchmarks/bench_format_range.py [rows] [columns]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl.utils import get_column_letter  # noqa: E402
+
+from ExcelSage import ExcelSage  # noqa: E402
+
+FORMAT = {"font_color": "#FF0000", "bold": True, "bg_color": "#FFFF00", "border": {"bottom": True}}
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<45} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main(rows: int = 1_250, columns: int = 8) -> None:
+    workbook_path = os.path.join(tempfile.mkdtemp(), "bench_format_range.xlsx")
+    data = [[row * columns + column for column in range(columns)] for row in range(rows)]
+
+    excel_sage = ExcelSage()
+    excel_sage.create_workbook(workbook_name=workbook_path, sheet_data=data)
+    excel_sage.set_autosave_policy(policy="manual")
+    last_cell = f"{get_column_letter(columns)}{rows}"
+
+    print(f"Formatting {rows * columns:,} cells (in memory)")
+    timed(
+        "Format Cell per cell",
+        lambda: [
+            excel_sage.format_cell(cell_name=f"{get_column_letter(column)}{row}", **FORMAT)
+            for row in range(1, rows + 1)
+            for column in range(1, columns + 1)
+        ],
+    )
+    timed("Format Range", lambda: excel_sage.format_range(cell_range=f"A1:{last_cell}", **FORMAT))
+
+    excel_sage.close_workbook()
+    os.remove(workbook_path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
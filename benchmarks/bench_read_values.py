@@ -0,0 +1,95 @@
+"""
+Compares the ways of reading cell values from a loaded 100,000 x 20 worksheet.
+
+Run from the project root:
+
+    python benchmarks/bench_read_values.py [rows] [columns]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook  # noqa: E402
+from openpyxl.utils import get_column_letter  # noqa: E402
+
+from ExcelSage import ExcelSage  # noqa: E402
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<45} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main(rows: int = 100_000, columns: int = 20) -> None:
+    workbook_path = os.path.join(tempfile.mkdtemp(), "bench_read_values.xlsx")
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append([f"Column {index}" for index in range(1, columns + 1)])
+    for row in range(rows):
+        sheet.append([row * columns + column for column in range(columns)])
+    workbook.save(workbook_path)
+
+    excel_sage = ExcelSage()
+    workbook = excel_sage.open_workbook(workbook_name=workbook_path)
+    sheet = workbook.active
+    last_cell = f"{get_column_letter(columns)}{rows + 1}"
+
+    print(f"Reading {rows:,} rows x {columns} columns")
+    timed(
+        "sheet[A1:...] with cell.value",
+        lambda: [[cell.value for cell in row] for row in sheet["A1":last_cell]],
+    )
+    timed(
+        "iter_rows(values_only=True)",
+        lambda: list(sheet.iter_rows(values_only=True)),
+    )
+    timed(
+        "Fetch Sheet Data (list)",
+        lambda: excel_sage.fetch_sheet_data(output_format="list"),
+    )
+    timed(
+        "Get Row Count",
+        lambda: excel_sage.get_row_count(),
+    )
+    timed(
+        "Get Row Count (cached, unchanged sheet)",
+        lambda: excel_sage.get_row_count(),
+    )
+    timed(
+        "Get Row Count (ignore_empty_rows=True)",
+        lambda: excel_sage.get_row_count(ignore_empty_rows=True),
+    )
+    timed(
+        "Row Count Should Be",
+        lambda: excel_sage.row_count_should_be(expected_count=rows + 1),
+    )
+    timed(
+        "Get Row Values (last row)",
+        lambda: excel_sage.get_row_values(row_indices=rows + 1),
+    )
+    timed(
+        "Find Value x 100 (first call builds the index)",
+        lambda: [excel_sage.find_value(value=index * 997, occurence="all") for index in range(100)],
+    )
+    timed(
+        "Find Cells Matching (range, snapshot built)",
+        lambda: excel_sage.find_cells_matching(match_type="range", min_value=1000, max_value=2000),
+    )
+    timed(
+        "Find Cells Matching (regex, snapshot reused)",
+        lambda: excel_sage.find_cells_matching(pattern="^Column 1[0-9]$"),
+    )
+
+    excel_sage.close_workbook()
+    os.remove(workbook_path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,65 @@
+"""
+Times Remove Empty Rows on a 1,000,000 x 3 worksheet where every tenth data row is empty.
+
+The sheet is filled in memory and saved first, so the timing covers the scan, the compaction and the single save of
+the output.
+
+Run from the project root:
+
+    python benchmarks/bench_remove_empty_rows.py [rows] [columns]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook  # noqa: E402
+
+from ExcelSage import ExcelSage  # noqa: E402
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<45} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main(rows: int = 1_000_000, columns: int = 3) -> None:
+    directory = tempfile.mkdtemp()
+    workbook_path = os.path.join(directory, "bench_remove_empty_rows.xlsx")
+    output_path = os.path.join(directory, "bench_remove_empty_rows_output.xlsx")
+    Workbook().save(workbook_path)
+
+    excel_sage = ExcelSage()
+    excel_sage.open_workbook(workbook_name=workbook_path, autosave="manual")
+
+    print(f"Removing empty rows from {rows:,} rows x {columns} columns")
+    timed(
+        "Append Rows",
+        lambda: excel_sage.append_rows(
+            rows_data=[[f"Column {column}" for column in range(1, columns + 1)]]
+            + [
+                [None] * columns if row % 10 == 0 else [row * columns + column for column in range(columns)]
+                for row in range(1, rows)
+            ]
+        ),
+    )
+    timed("Save Workbook (source)", lambda: excel_sage.save_workbook())
+    removed = timed(
+        "Remove Empty Rows (scan, compact, save)",
+        lambda: excel_sage.remove_empty_rows(output_filename=output_path),
+    )
+    print(f"{removed:,} empty rows removed")
+
+    while excel_sage.workbooks:
+        excel_sage.close_workbook()
+    os.remove(workbook_path)
+    os.remove(output_path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,53 @@
+"""
+Compares writing a 50,000 x 10 block cell by cell with a single Write Range call.
+
+Run from the project root:
+
+    python benchmarks/bench_write_range.py [rows] [columns]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook  # noqa: E402
+from openpyxl.utils import get_column_letter  # noqa: E402
+
+from ExcelSage import ExcelSage  # noqa: E402
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<45} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main(rows: int = 50_000, columns: int = 10) -> None:
+    workbook_path = os.path.join(tempfile.mkdtemp(), "bench_write_range.xlsx")
+    Workbook().save(workbook_path)
+    data = [[row * columns + column for column in range(columns)] for row in range(rows)]
+
+    def write_cell_by_cell():
+        sheet = Workbook().active
+        for row_index, row in enumerate(data, start=1):
+            for column_index, value in enumerate(row, start=1):
+                sheet[f"{get_column_letter(column_index)}{row_index}"] = value
+
+    excel_sage = ExcelSage()
+    excel_sage.open_workbook(workbook_name=workbook_path, autosave="manual")
+
+    print(f"Writing {rows:,} rows x {columns} columns (in memory)")
+    timed("sheet['A1'] = value per cell", write_cell_by_cell)
+    timed("Write Range", lambda: excel_sage.write_range(data=data))
+    timed("Save Workbook", lambda: excel_sage.save_workbook())
+
+    excel_sage.close_workbook()
+    os.remove(workbook_path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -21,6 +21,8 @@ from ExcelSage import (
     InvalidColorError,
     InvalidAlignmentError,
     InvalidBorderStyleError,
+    WorkbookTransactionError,
+    WorkbookReadOnlyError,
 )
 from assertpy import assert_that
 from openpyxl import Workbook
@@ -115,6 +117,33 @@ def test_create_workbook_success(setup_teardown):
     assert_that(workbook).is_instance_of(Workbook)
 
 
+def test_create_workbook_write_only_without_loading(setup_teardown):
+    rows = ([f"Name {index}", index] for index in range(1000))
+    workbook = exl.create_workbook(
+        workbook_name=NEW_EXCEL_FILE_PATH,
+        sheet_data=rows,
+        overwrite_if_exists=True,
+        write_only=True,
+        load_after_create=False,
+    )
+    assert_that(workbook).is_none()
+    assert_that(exl.workbooks).is_empty()
+
+    sheet = excel.load_workbook(NEW_EXCEL_FILE_PATH).active
+    assert_that(sheet.title).is_equal_to("Sheet")
+    assert_that(sheet.max_row).is_equal_to(1000)
+    assert_that([cell.value for cell in sheet[1000]]).is_equal_to(["Name 999", 999])
+
+    workbook = exl.create_workbook(
+        workbook_name=NEW_EXCEL_FILE_PATH,
+        sheet_data=[["Name", "Age"], ["Dee", 26]],
+        overwrite_if_exists=True,
+        write_only=True,
+    )
+    assert_that(workbook).is_instance_of(Workbook)
+    assert_that(exl.get_cell_value(cell_name="A2")).is_equal_to("Dee")
+
+
 def test_create_workbook_file_already_exists(setup_teardown):
     with pytest.raises(FileAlreadyExistsError) as exc_info:
         exl.create_workbook(workbook_name=NEW_EXCEL_FILE_PATH)
@@ -270,6 +299,69 @@ def test_fetch_sheet_data_success(setup_teardown):
     assert_that(isinstance(sheet_data, DataFrame)).is_true()
 
 
+def test_fetch_sheet_data_in_chunks(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
+    expected = exl.fetch_sheet_data(
+        sheet_name="Offset_table", output_format="dataframe", ignore_empty_rows=True
+    )
+
+    chunks = list(
+        exl.fetch_sheet_data(
+            sheet_name="Offset_table",
+            output_format="dataframe",
+            ignore_empty_rows=True,
+            chunk_size=20,
+        )
+    )
+    assert_that([len(chunk) for chunk in chunks]).is_equal_to([20, 20, 11])
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected, check_dtype=False)
+
+    list_chunks = list(
+        exl.iter_sheet_data(sheet_name="Sheet1", chunk_size=15, output_format="list")
+    )
+    assert_that(sum(list_chunks, [])).is_equal_to(
+        exl.fetch_sheet_data(sheet_name="Sheet1", output_format="list")
+    )
+
+    dict_chunks = exl.iter_sheet_data(sheet_name="Sheet1", chunk_size=100, output_format="dict")
+    assert_that(next(dict_chunks)[0]["First Name"]).is_equal_to("Lester")
+
+
+def test_iter_sheet_data_reads_rows_lazily(setup_teardown):
+    workbook = exl.open_workbook(workbook_name=EXCEL_FILE_PATH, autosave="manual")
+    chunks = exl.iter_sheet_data(sheet_name="Sheet1", chunk_size=10, output_format="list")
+    next(chunks)
+
+    workbook["Sheet1"]["A40"].value = "Late"
+    assert_that(sum(chunks, [])[28][0]).is_equal_to("Late")
+
+    sheet = workbook.create_sheet("Reversed")
+    for row in range(5, 0, -1):
+        for column in range(3, 0, -1):
+            sheet.cell(row=row, column=column, value=row * 10 + column)
+    chunks = exl.iter_sheet_data(sheet_name="Reversed", chunk_size=3, output_format="list")
+    assert_that(sum(chunks, [])).is_equal_to([[21, 22, 23], [31, 32, 33], [41, 42, 43], [51, 52, 53]])
+
+
+def test_fetch_sheet_data_chunks_invalid_arguments(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
+
+    with pytest.raises(ValueError) as exc_info:
+        exl.fetch_sheet_data(sheet_name="Sheet1", ignore_empty_columns=True, chunk_size=10)
+
+    assert_that(str(exc_info.value)).is_equal_to(
+        "'ignore_empty_columns' cannot be combined with 'chunk_size', because empty columns are only known "
+        "once the whole sheet has been read."
+    )
+
+    with pytest.raises(ValueError) as exc_info:
+        exl.iter_sheet_data(sheet_name="Sheet1", chunk_size=0)
+
+    assert_that(str(exc_info.value)).is_equal_to(
+        "Invalid chunk size: 0. It must be a positive integer."
+    )
+
+
 def test_fetch_sheet_data_invalid_cell_address(setup_teardown):
     with pytest.raises(InvalidCellAddressError) as exc_info:
         exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
@@ -598,6 +690,245 @@ def test_save_workbook_invalid_alias(setup_teardown):
     )
 
 
+def test_workbook_transaction_commit(setup_teardown):
+    test_file = copy_test_excel_file(
+        destination_file=os.path.join(DATA_DIR, "test_transaction_commit.xlsx")
+    )
+
+    try:
+        exl.open_workbook(workbook_name=test_file)
+        exl.begin_workbook_transaction()
+        exl.write_to_cell(cell_name="A1", cell_value="Txn Name", sheet_name="Sheet1")
+        exl.append_row(row_data=["Txn", "Row"], sheet_name="Sheet1")
+
+        workbook = excel.load_workbook(filename=test_file)
+        assert_that(workbook["Sheet1"]["A1"].value).is_equal_to("First Name")
+        workbook.close()
+
+        exl.commit_workbook_transaction()
+
+        workbook = excel.load_workbook(filename=test_file)
+        sheet = workbook["Sheet1"]
+        assert_that(sheet["A1"].value).is_equal_to("Txn Name")
+        assert_that(sheet.cell(row=sheet.max_row, column=1).value).is_equal_to("Txn")
+        workbook.close()
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+
+def test_workbook_transaction_rollback(setup_teardown):
+    test_file = copy_test_excel_file(
+        destination_file=os.path.join(DATA_DIR, "test_transaction_rollback.xlsx")
+    )
+
+    try:
+        exl.open_workbook(workbook_name=test_file, autosave="manual")
+        exl.write_to_cell(cell_name="A1", cell_value="Pending", sheet_name="Sheet1")
+
+        exl.begin_workbook_transaction()
+        exl.write_to_cell(cell_name="A2", cell_value="Discarded", sheet_name="Sheet1")
+        exl.delete_sheet(sheet_name="Offset_table")
+        exl.rollback_workbook_transaction()
+
+        assert_that(exl.get_cell_value(cell_name="A1", sheet_name="Sheet1")).is_equal_to("Pending")
+        assert_that(exl.get_cell_value(cell_name="A2", sheet_name="Sheet1")).is_equal_to("Lester")
+        assert_that(exl.get_sheets()).contains("Offset_table")
+
+        workbook = excel.load_workbook(filename=test_file)
+        assert_that(workbook["Sheet1"]["A1"].value).is_equal_to("First Name")
+        workbook.close()
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+
+def test_workbook_transaction_errors(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
+
+    with pytest.raises(WorkbookTransactionError) as exc_info:
+        exl.commit_workbook_transaction()
+    assert_that(str(exc_info.value)).contains("No transaction is open")
+
+    exl.begin_workbook_transaction()
+    with pytest.raises(WorkbookTransactionError) as exc_info:
+        exl.begin_workbook_transaction()
+    assert_that(str(exc_info.value)).contains("already open")
+
+    with pytest.raises(WorkbookTransactionError):
+        exl.save_workbook()
+
+    exl.rollback_workbook_transaction()
+
+
+def test_autosave_on_close(setup_teardown):
+    test_file = copy_test_excel_file(
+        destination_file=os.path.join(DATA_DIR, "test_autosave_on_close.xlsx")
+    )
+
+    try:
+        exl.open_workbook(workbook_name=test_file, autosave="on_close")
+        exl.write_to_cell(cell_name="A1", cell_value="Closed", sheet_name="Sheet1")
+
+        workbook = excel.load_workbook(filename=test_file)
+        assert_that(workbook["Sheet1"]["A1"].value).is_equal_to("First Name")
+        workbook.close()
+
+        exl.close_workbook()
+
+        workbook = excel.load_workbook(filename=test_file)
+        assert_that(workbook["Sheet1"]["A1"].value).is_equal_to("Closed")
+        workbook.close()
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+
+def test_save_workbook_skips_untouched_workbook(setup_teardown):
+    test_file = copy_test_excel_file(
+        destination_file=os.path.join(DATA_DIR, "test_save_untouched.xlsx")
+    )
+
+    try:
+        exl.open_workbook(workbook_name=test_file)
+        modified_time = os.path.getmtime(test_file)
+        os.utime(test_file, (modified_time - 100, modified_time - 100))
+
+        exl.save_workbook()
+        assert_that(os.path.getmtime(test_file)).is_equal_to(modified_time - 100)
+
+        exl.save_workbook(force=True)
+        assert_that(os.path.getmtime(test_file)).is_greater_than(modified_time - 100)
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+
+def test_close_workbook_save_if_dirty(setup_teardown):
+    test_file = copy_test_excel_file(
+        destination_file=os.path.join(DATA_DIR, "test_close_save_if_dirty.xlsx")
+    )
+
+    try:
+        exl.open_workbook(workbook_name=test_file, autosave="manual")
+        exl.write_to_cell(cell_name="A1", cell_value="Dirty", sheet_name="Sheet1")
+        exl.write_to_cell(cell_name="A2", cell_value="Dirty", sheet_name="Sheet1")
+
+        entry = exl.workbooks[exl.active_workbook_alias]
+        assert_that(entry["dirty"]).is_true()
+        assert_that(entry["mutations"]).is_equal_to(2)
+
+        exl.close_workbook(save_if_dirty=True)
+
+        workbook = excel.load_workbook(filename=test_file)
+        assert_that(workbook["Sheet1"]["A1"].value).is_equal_to("Dirty")
+        workbook.close()
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+
+def test_open_workbook_read_mode(setup_teardown):
+    workbook = exl.open_workbook(workbook_name=EXCEL_FILE_PATH, mode="read")
+    assert_that(workbook.read_only).is_true()
+
+    assert_that(exl.get_cell_value(cell_name="A1", sheet_name="Sheet1")).is_equal_to("First Name")
+    assert_that(exl.fetch_sheet_data(sheet_name="Sheet1")).is_length(50)
+    assert_that(exl.get_row_count(sheet_name="Sheet1")).is_equal_to(50)
+    assert_that(exl.get_row_values(row_indices=2, sheet_name="Sheet1")[0]).is_equal_to("Lester")
+    exl.column_should_contain(column_name_or_letter="First Name", expected_value="Lester", sheet_name="Sheet1")
+
+    with pytest.raises(WorkbookReadOnlyError):
+        exl.write_to_cell(cell_name="A1", cell_value="Changed", sheet_name="Sheet1")
+
+    with pytest.raises(WorkbookReadOnlyError):
+        exl.add_sheet(sheet_name="NewSheet")
+
+    exl.save_workbook()
+
+
+def test_open_workbook_invalid_mode(setup_teardown):
+    with pytest.raises(ValueError) as exc_info:
+        exl.open_workbook(workbook_name=EXCEL_FILE_PATH, mode="append")
+
+    assert_that(str(exc_info.value)).is_equal_to(
+        "Invalid open mode: 'append'. Allowed values are ['edit', 'read']."
+    )
+
+
+def test_open_workbook_from_cache(setup_teardown):
+    test_file = copy_test_excel_file(
+        destination_file=os.path.join(DATA_DIR, "test_workbook_cache.xlsx")
+    )
+
+    try:
+        exl.clear_workbook_cache()
+        stats_before = exl.get_workbook_cache_stats()
+
+        first = exl.open_workbook(workbook_name=test_file, alias="first", mode="read", cache=True)
+        first["Sheet1"]["A1"].value = "Changed directly"
+        second = exl.open_workbook(workbook_name=test_file, alias="second", mode="read", cache=True)
+        assert_that(second).is_not_same_as(first)
+        assert_that(second["Sheet1"]["A1"].value).is_equal_to("First Name")
+        assert_that(exl.get_cell_value(cell_name="A1", sheet_name="Sheet1")).is_equal_to("Changed directly")
+
+        with pytest.raises(WorkbookReadOnlyError):
+            exl.write_to_cell(cell_name="A1", cell_value="Changed", sheet_name="Sheet1")
+
+        stats = exl.get_workbook_cache_stats()
+        assert_that(stats["hits"] - stats_before["hits"]).is_equal_to(1)
+        assert_that(stats["misses"] - stats_before["misses"]).is_equal_to(1)
+        assert_that(stats["entries"]).is_equal_to(1)
+
+        exl.close_workbook(alias="first")
+        exl.close_workbook(alias="second")
+
+        modified_time = os.path.getmtime(test_file)
+        os.utime(test_file, (modified_time + 10, modified_time + 10))
+        third = exl.open_workbook(workbook_name=test_file, alias="third", mode="read", cache=True)
+        assert_that(third).is_not_same_as(first)
+        assert_that(exl.get_workbook_cache_stats()["entries"]).is_equal_to(1)
+
+        assert_that(exl.clear_workbook_cache()).is_equal_to(1)
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+
+def test_workbook_cache_limit_is_only_raised(setup_teardown):
+    memory_limit = exl.get_workbook_cache_stats()["memory_limit"]
+    ExcelSage(workbook_cache_limit=memory_limit // (1024 * 1024) + 1)
+    raised_limit = exl.get_workbook_cache_stats()["memory_limit"]
+    assert_that(raised_limit).is_equal_to(memory_limit + 1024 * 1024)
+
+    ExcelSage(workbook_cache_limit=1)
+    assert_that(exl.get_workbook_cache_stats()["memory_limit"]).is_equal_to(raised_limit)
+
+
+def test_open_workbook_cache_requires_read_mode(setup_teardown):
+    with pytest.raises(ValueError) as exc_info:
+        exl.open_workbook(workbook_name=EXCEL_FILE_PATH, cache=True)
+
+    assert_that(str(exc_info.value)).is_equal_to(
+        "Only workbooks opened with mode=read can be served from the workbook cache."
+    )
+
+
+def test_autosave_invalid_policy(setup_teardown):
+    with pytest.raises(ValueError) as exc_info:
+        exl.open_workbook(workbook_name=EXCEL_FILE_PATH, autosave="sometimes")
+
+    assert_that(str(exc_info.value)).is_equal_to(
+        "Invalid autosave policy: 'sometimes'. Allowed values are ['always', 'on_commit', 'on_close', 'manual']."
+    )
+
+
 def test_set_active_sheet_success(setup_teardown):
     exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
     active_sheet = exl.set_active_sheet(sheet_name="Offset_table")
@@ -650,6 +981,62 @@ def test_write_to_cell_invalid_cell_address(setup_teardown):
     )
 
 
+def test_write_range_success(setup_teardown):
+    file_path = copy_test_excel_file(os.path.join(DATA_DIR, "write_range.xlsx"))
+    exl.open_workbook(workbook_name=file_path)
+    written_range = exl.write_range(
+        data=[["Name", "Age"], ["John", 30], ("Mark", None)],
+        starting_cell="AA2",
+        sheet_name="Sheet1",
+    )
+    assert_that(written_range).is_equal_to("AA2:AB4")
+
+    df = DataFrame({"City": ["Oslo", None], "Zip": [150.0, float("nan")]}, index=["a", "b"])
+    written_range = exl.write_dataframe(df, starting_cell="AD2", sheet_name="Sheet1", include_index=True)
+    assert_that(written_range).is_equal_to("AD2:AF4")
+    exl.close_workbook()
+
+    workbook = excel.load_workbook(filename=file_path)
+    sheet = workbook["Sheet1"]
+    values = [list(row) for row in sheet.iter_rows(min_row=2, max_row=4, min_col=27, max_col=32, values_only=True)]
+    workbook.close()
+    assert_that(values).is_equal_to(
+        [
+            ["Name", "Age", None, "index", "City", "Zip"],
+            ["John", 30, None, "a", "Oslo", 150],
+            ["Mark", None, None, "b", None, None],
+        ]
+    )
+
+
+def test_write_range_then_append_row(setup_teardown):
+    exl.create_workbook(
+        workbook_name=os.path.join(DATA_DIR, "write_range_append.xlsx"),
+        sheet_data=[["h1", "h2"], [1, 2]],
+        overwrite_if_exists=True,
+    )
+    exl.write_range(data=[[3, 4], [5, 6]], starting_cell="A3")
+    exl.append_row(row_data=[7, 8])
+
+    assert_that(exl.fetch_sheet_data(output_format="list")).is_equal_to([[1, 2], [3, 4], [5, 6], [7, 8]])
+
+
+def test_write_range_invalid_arguments(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
+
+    with pytest.raises(TypeError) as exc_info:
+        exl.write_range(data=[["Name"], "John"], sheet_name="Sheet1")
+    assert_that(str(exc_info.value)).is_equal_to(
+        "Invalid row at index 1 of type 'str'. Each row in 'data' must be a list."
+    )
+
+    with pytest.raises(InvalidCellAddressError):
+        exl.write_range(data=[["Name"]], starting_cell=INVALID_CELL_ADDRESS, sheet_name="Sheet1")
+
+    with pytest.raises(InvalidRowIndexError):
+        exl.write_range(data=[["Name"], ["John"]], starting_cell="A1048576", sheet_name="Sheet1")
+
+
 def test_get_column_count_success(setup_teardown):
     exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
     column_count = exl.get_column_count(
@@ -670,6 +1057,21 @@ def test_get_column_count_invalid_cell_address(setup_teardown):
     )
 
 
+def test_get_row_count_cache_invalidation(setup_teardown):
+    workbook = exl.open_workbook(workbook_name=EXCEL_FILE_PATH, autosave="manual")
+
+    assert_that(exl.get_row_count(sheet_name="Sheet1")).is_equal_to(50)
+    assert_that(exl.get_row_count(sheet_name="Sheet1")).is_equal_to(50)
+
+    exl.append_row(row_data=["New", "Row"], sheet_name="Sheet1")
+    assert_that(exl.get_row_count(sheet_name="Sheet1")).is_equal_to(51)
+    exl.row_count_should_be(expected_count=52, sheet_name="Sheet1")
+
+    workbook["Sheet1"]["A60"] = "Direct edit"
+    assert_that(exl.get_row_count(sheet_name="Sheet1")).is_equal_to(59)
+    assert_that(exl.get_row_count(sheet_name="Sheet1", ignore_empty_rows=True)).is_equal_to(52)
+
+
 def test_get_row_count_success(setup_teardown):
     exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
     row_count = exl.get_row_count(
@@ -782,6 +1184,32 @@ def test_delete_row_invalid_row_index(setup_teardown):
     )
 
 
+def test_append_rows_and_delete_rows_success(setup_teardown):
+    file_path = os.path.join(DATA_DIR, "batch_rows.xlsx")
+    exl.create_workbook(workbook_name=file_path, sheet_data=[["Id", "Value"]], overwrite_if_exists=True)
+    appended = exl.append_rows(rows_data=[[index, f"value{index}"] for index in range(1, 11)])
+    assert_that(appended).is_equal_to(10)
+
+    deleted = exl.delete_rows(row_indices=[3, "5:7", 11, 7])
+    assert_that(deleted).is_equal_to(5)
+    exl.close_workbook()
+
+    workbook = excel.load_workbook(filename=file_path)
+    values = [list(row) for row in workbook.active.iter_rows(values_only=True)]
+    workbook.close()
+    assert_that(values).is_equal_to(
+        [["Id", "Value"], [1, "value1"], [3, "value3"], [7, "value7"], [8, "value8"], [9, "value9"]]
+    )
+
+
+def test_delete_rows_invalid_row_index(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
+    with pytest.raises(InvalidRowIndexError):
+        exl.delete_rows(row_indices=[2, f"3:{INVALID_ROW_INDEX}"])
+    with pytest.raises(InvalidRowIndexError):
+        exl.delete_rows(row_indices="A")
+
+
 def test_append_column_success(setup_teardown):
     data = ["New Column", "data1", "data2", "data3", "data4", "data5"]
     exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
@@ -803,6 +1231,20 @@ def test_append_column_success(setup_teardown):
     workbook.close()
 
 
+def test_append_column_then_append_row(setup_teardown):
+    exl.create_workbook(
+        workbook_name=os.path.join(DATA_DIR, "append_column_row.xlsx"),
+        sheet_data=[["h1"], [1]],
+        overwrite_if_exists=True,
+    )
+    exl.append_column(col_data=["h2", 2, 3, 4])
+    exl.append_row(row_data=["x", "y"])
+
+    assert_that(exl.fetch_sheet_data(output_format="list")).is_equal_to(
+        [[1, 2], [None, 3], [None, 4], ["x", "y"]]
+    )
+
+
 def test_insert_column_success(setup_teardown):
     data = ["New Column", "data1", "data2", "data3", "data4", "data5"]
     exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
@@ -868,6 +1310,31 @@ def test_delete_column_invalid_column_index(setup_teardown):
     )
 
 
+def test_delete_columns_success(setup_teardown):
+    file_path = os.path.join(DATA_DIR, "batch_columns.xlsx")
+    exl.create_workbook(
+        workbook_name=file_path, sheet_data=[["A", "B", "C", "D", "E", "F"], [1, 2, 3, 4, 5, 6]], overwrite_if_exists=True
+    )
+    deleted = exl.delete_columns(col_indices=["a", "C:D", 6])
+    assert_that(deleted).is_equal_to(4)
+    exl.close_workbook()
+
+    workbook = excel.load_workbook(filename=file_path)
+    values = [list(row) for row in workbook.active.iter_rows(values_only=True)]
+    workbook.close()
+    assert_that(values).is_equal_to([["B", "E"], [2, 5]])
+
+
+def test_delete_columns_invalid_column_index(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
+    with pytest.raises(InvalidColumnIndexError) as exc_info:
+        exl.delete_columns(col_indices=["B", INVALID_COLUMN_INDEX], sheet_name="Sheet1")
+
+    assert_that(str(exc_info.value)).is_equal_to(
+        f"Column index {INVALID_COLUMN_INDEX} is invalid or out of bounds. The valid range is 1 to 16384."
+    )
+
+
 @pytest.mark.parametrize(
     "column_name, expected_length, expected_values, output_format",
     [
@@ -964,6 +1431,49 @@ def test_get_column_values_success(
             assert_that(sublist).is_length(expected_length)
 
 
+def test_get_column_values_reads_unsaved_changes(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH, autosave="manual")
+    exl.write_to_cell(cell_name="D7", cell_value="Unsaved", sheet_name="Offset_table")
+
+    column_values = exl.get_column_values(
+        column_names_or_letters="First Name",
+        sheet_name="Offset_table",
+        starting_cell="D6",
+    )
+
+    assert_that(column_values).is_length(51)
+    assert_that(column_values[0]).is_equal_to("Unsaved")
+
+
+def test_get_column_values_match_read_excel_with_blanks(setup_teardown):
+    file_path = os.path.join(DATA_DIR, "blanks.xlsx")
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["Id", "Score", "Name", "Empty"])
+    sheet.append([1, 10, "a", None])
+    sheet.append([2, None, "b", None])
+    sheet.append([3, 12.5, None, None])
+    sheet.append([4, 13, "#N/A", None])
+    narrow_sheet = workbook.create_sheet("Narrow")
+    for value in ["Code", 1, None, "x", None, 2]:
+        narrow_sheet.append([value])
+    workbook.save(file_path)
+
+    exl.open_workbook(workbook_name=file_path)
+    column_values = exl.get_column_values(
+        column_names_or_letters=["Id", "Score", "Name", "Empty"],
+        output_format="dataframe",
+    )
+
+    pd.testing.assert_frame_equal(column_values, pd.read_excel(file_path))
+    assert_that(str(column_values["Score"].dtype)).is_equal_to("float64")
+
+    column_values = exl.get_column_values(
+        column_names_or_letters="Code", sheet_name="Narrow", output_format="dataframe"
+    )
+    pd.testing.assert_frame_equal(column_values, pd.read_excel(file_path, sheet_name="Narrow"))
+
+
 def test_get_column_values_invalid_output_format(setup_teardown):
     with pytest.raises(ValueError) as exc_info:
         exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
@@ -1087,6 +1597,17 @@ def test_get_row_values_success(
             assert_that(sublist).is_length(expected_length)
 
 
+def test_get_row_values_does_not_grow_sheet(setup_teardown):
+    workbook = exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
+    dimensions = workbook["Sheet1"].dimensions
+
+    row_value = exl.get_row_values(sheet_name="Sheet1", row_indices=500)
+
+    assert_that(row_value).is_length(8)
+    assert_that(all(value is None for value in row_value)).is_true()
+    assert_that(workbook["Sheet1"].dimensions).is_equal_to(dimensions)
+
+
 def test_get_row_values_invalid_output_format(setup_teardown):
     with pytest.raises(ValueError) as exc_info:
         exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
@@ -1328,6 +1849,30 @@ def test_clear_sheet_success(setup_teardown):
     workbook.close()
 
 
+def test_clear_sheet_with_merged_cells(setup_teardown):
+    test_file = copy_test_excel_file(
+        destination_file=os.path.join(DATA_DIR, "test_clear_merged.xlsx")
+    )
+
+    try:
+        exl.open_workbook(workbook_name=test_file)
+        exl.merge_cells(cell_range="A1:B1", sheet_name="Sheet1")
+        exl.clear_sheet(sheet_name="Sheet1")
+
+        workbook = excel.load_workbook(filename=test_file)
+        values = [
+            value
+            for row in workbook["Sheet1"].iter_rows(values_only=True)
+            for value in row
+        ]
+        assert_that(all(value is None for value in values)).is_true()
+        workbook.close()
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+
 def test_copy_sheet_success(setup_teardown):
     exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
     exl.copy_sheet(source_sheet_name="Sheet1", new_sheet_name="Copied_sheet")
@@ -1408,63 +1953,181 @@ def test_find_value_success(setup_teardown, value, occurence, expected_value):
         assert_that(cell).is_equal_to(expected_value[1])
 
 
-def test_find_value_invalid_occurence(setup_teardown):
-    with pytest.raises(ValueError) as exc_info:
-        exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
-        exl.find_value(
-            sheet_name="Sheet1", value="value", occurence="invalid_occurence"
-        )
+def test_find_value_invalid_occurence(setup_teardown):
+    with pytest.raises(ValueError) as exc_info:
+        exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
+        exl.find_value(
+            sheet_name="Sheet1", value="value", occurence="invalid_occurence"
+        )
+
+    assert_that(str(exc_info.value)).is_equal_to(
+        "Invalid occurence, use either 'first' or 'all'."
+    )
+
+
+@pytest.mark.parametrize(
+    "occurence, expected_value",
+    [
+        ("first", ("str", "A14")),
+        ("all", ("list", ["A18", "A19"])),
+        ("first", (None, None)),
+    ],
+)
+def test_find_and_replace_success(setup_teardown, occurence, expected_value):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
+    cell = exl.find_and_replace(
+        sheet_name="Sheet1", old_value="Marcel", new_value="Mark", occurence=occurence
+    )
+
+    if expected_value[0] is None:
+        assert_that(cell).is_none()
+    else:
+        assert_that(isinstance(cell, eval(expected_value[0]))).is_true()
+        assert_that(cell).is_equal_to(expected_value[1])
+
+    workbook = excel.load_workbook(filename=EXCEL_FILE_PATH)
+    sheet = workbook["Sheet1"]
+
+    if isinstance(cell, list):
+        for i in cell:
+            assert_that(sheet[i].value).is_equal_to("Mark")
+    elif isinstance(cell, str):
+        assert_that(sheet[cell].value).is_equal_to("Mark")
+
+    workbook.close()
+
+
+def test_find_and_replace_value_invalid_occurence(setup_teardown):
+    with pytest.raises(ValueError) as exc_info:
+        exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
+        exl.find_and_replace(
+            sheet_name="Sheet1",
+            old_value="Marcel",
+            new_value="Mark",
+            occurence="invalid_occurence",
+        )
+
+    assert_that(str(exc_info.value)).is_equal_to(
+        "Invalid occurence, use either 'first' or 'all'."
+    )
+
+
+def test_find_value_index_follows_changes(setup_teardown):
+    file_path = os.path.join(DATA_DIR, "value_index.xlsx")
+    exl.create_workbook(
+        workbook_name=file_path, sheet_data=[["Id", "Name"], [1, "John"], [2, "Mark"], [3, "John"]], overwrite_if_exists=True
+    )
+    assert_that(exl.build_sheet_index()).is_equal_to(7)
+    assert_that(exl.find_value(value="John", occurence="all")).is_equal_to(["B2", "B4"])
+
+    assert_that(exl.find_and_replace(old_value="John", new_value="Mark")).is_equal_to("B2")
+    assert_that(exl.find_value(value="John", occurence="all")).is_equal_to(["B4"])
+    assert_that(exl.find_value(value="Mark", occurence="all")).is_equal_to(["B2", "B3"])
+
+    exl.write_to_cell(cell_name="C1", cell_value="John")
+    assert_that(exl.find_value(value="John", occurence="all")).is_equal_to(["C1", "B4"])
+    assert_that(exl.find_value(value=None)).is_equal_to("C2")
+
+
+def test_find_and_replace_after_direct_edit(setup_teardown):
+    file_path = os.path.join(DATA_DIR, "value_index_direct_edit.xlsx")
+    workbook = exl.create_workbook(
+        workbook_name=file_path, sheet_data=[["Id", "Name"], [1, "a"], [2, "b"], [3, "a"]], overwrite_if_exists=True
+    )
+    assert_that(exl.find_value(value="a", occurence="all")).is_equal_to(["B2", "B4"])
+
+    workbook.active["B2"].value = "zz"
+    workbook.active["B3"].value = "a"
+    assert_that(exl.find_value(value="a", occurence="all")).is_equal_to(["B3", "B4"])
+
+    workbook.active["B4"].value = "zz"
+    assert_that(exl.find_and_replace(old_value="a", new_value="Q", occurence="all")).is_equal_to(["B3"])
+    assert_that([cell.value for cell in workbook.active["B"]]).is_equal_to(["Name", "zz", "Q", "zz"])
+
+
+def test_replace_values_success(setup_teardown):
+    file_path = os.path.join(DATA_DIR, "replace_values.xlsx")
+    exl.create_workbook(
+        workbook_name=file_path,
+        sheet_data=[["Name", "Manager"], ["John", "Mark"], ["Mark", "John"], ["Dee", "John"]],
+        overwrite_if_exists=True,
+    )
+    counts = exl.replace_values(mapping={"John": "Mark", "Mark": "Person 2", "Sam": "Person 3"}, cell_range="A2:B4")
+    assert_that(counts).is_equal_to({"John": 3, "Mark": 2, "Sam": 0})
+
+    counts = exl.replace_values(mapping={"Person 2": "Person 1"}, columns=["A"])
+    assert_that(counts).is_equal_to({"Person 2": 1})
+    exl.close_workbook()
+
+    workbook = excel.load_workbook(filename=file_path)
+    values = [list(row) for row in workbook.active.iter_rows(values_only=True)]
+    workbook.close()
+    assert_that(values).is_equal_to(
+        [["Name", "Manager"], ["Mark", "Person 2"], ["Person 1", "Mark"], ["Dee", "Mark"]]
+    )
+
+
+def test_replace_values_invalid_cell_range(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
+    with pytest.raises(InvalidCellRangeError) as exc_info:
+        exl.replace_values(mapping={"John": "Mark"}, cell_range="D4:A1")
+
+    assert_that(str(exc_info.value)).is_equal_to(
+        "Invalid cell range: D4:A1. The start cell must be smaller than the end cell."
+    )
+
+
+def test_find_value_in_workbooks_success(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH, alias="source")
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH, alias="copy", mode="read")
+
+    all_matches = exl.find_value_in_workbooks(value="Pia", occurence="all")
+    expected = {"Sheet1": ["B5"], "Offset_table": ["E49"], "Invalid_header": ["B5"]}
+    assert_that(all_matches).is_equal_to({"source": expected, "copy": expected})
+
+    assert_that(exl.find_value_in_workbooks(value="Pia")).is_equal_to({"source": {"Sheet1": ["B5"]}})
+    assert_that(
+        exl.find_value_in_workbook(value="Pia", sheet_names=["Offset_table"], alias="copy")
+    ).is_equal_to({"Offset_table": ["E49"]})
+    assert_that(exl.find_value_in_workbook(value="Not present", occurence="all")).is_empty()
+
+
+def test_find_value_in_workbook_invalid_arguments(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
 
-    assert_that(str(exc_info.value)).is_equal_to(
-        "Invalid occurence, use either 'first' or 'all'."
-    )
+    with pytest.raises(SheetDoesntExistsError):
+        exl.find_value_in_workbook(value="Pia", sheet_names=["Missing"])
+
+    with pytest.raises(ValueError) as exc_info:
+        exl.find_value_in_workbook(value="Pia", occurence="some")
+    assert_that(str(exc_info.value)).is_equal_to("Invalid occurence, use either 'first' or 'all'.")
 
 
 @pytest.mark.parametrize(
-    "occurence, expected_value",
+    "arguments, expected",
     [
-        ("first", ("str", "A14")),
-        ("all", ("list", ["A18", "A19"])),
-        ("first", (None, None)),
+        ({"pattern": "^Pi"}, ["B5"]),
+        ({"pattern": "pia", "match_type": "equals", "ignore_case": True}, ["B5"]),
+        ({"pattern": "pia", "match_type": "contains"}, None),
+        ({"match_type": "range", "min_value": 30, "max_value": 31}, ["D12", "D13"]),
+        ({"match_type": "range", "min_value": 30, "max_value": 31, "occurence": "first"}, "D12"),
     ],
 )
-def test_find_and_replace_success(setup_teardown, occurence, expected_value):
+def test_find_cells_matching_success(setup_teardown, arguments, expected):
     exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
-    cell = exl.find_and_replace(
-        sheet_name="Sheet1", old_value="Marcel", new_value="Mark", occurence=occurence
-    )
-
-    if expected_value[0] is None:
-        assert_that(cell).is_none()
-    else:
-        assert_that(isinstance(cell, eval(expected_value[0]))).is_true()
-        assert_that(cell).is_equal_to(expected_value[1])
-
-    workbook = excel.load_workbook(filename=EXCEL_FILE_PATH)
-    sheet = workbook["Sheet1"]
-
-    if isinstance(cell, list):
-        for i in cell:
-            assert_that(sheet[i].value).is_equal_to("Mark")
-    elif isinstance(cell, str):
-        assert_that(sheet[cell].value).is_equal_to("Mark")
+    assert_that(exl.find_cells_matching(sheet_name="Sheet1", **arguments)).is_equal_to(expected)
 
-    workbook.close()
 
+def test_find_cells_matching_invalid_arguments(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
 
-def test_find_and_replace_value_invalid_occurence(setup_teardown):
     with pytest.raises(ValueError) as exc_info:
-        exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
-        exl.find_and_replace(
-            sheet_name="Sheet1",
-            old_value="Marcel",
-            new_value="Mark",
-            occurence="invalid_occurence",
-        )
+        exl.find_cells_matching(pattern="(")
+    assert_that(str(exc_info.value)).starts_with("Invalid regular expression '('")
 
-    assert_that(str(exc_info.value)).is_equal_to(
-        "Invalid occurence, use either 'first' or 'all'."
-    )
+    with pytest.raises(ValueError) as exc_info:
+        exl.find_cells_matching(match_type="range")
+    assert_that(str(exc_info.value)).is_equal_to("A 'range' match needs 'min_value', 'max_value' or both.")
 
 
 def test_format_cell_success(setup_teardown):
@@ -1569,6 +2232,46 @@ def test_format_cell_success(setup_teardown):
     workbook.close()
 
 
+def test_format_range_success(setup_teardown):
+    file_path = copy_test_excel_file(os.path.join(DATA_DIR, "format_range.xlsx"))
+    exl.open_workbook(workbook_name=file_path)
+    formatted = exl.format_range(
+        cell_range=["A1:C2", "E5"],
+        sheet_name="Sheet1",
+        font_color="#FF0000",
+        bold=True,
+        bg_color="#FFFF00",
+        border={"bottom": True, "style": "thin"},
+        auto_fit_width=True,
+    )
+    assert_that(formatted).is_equal_to(7)
+    exl.close_workbook()
+
+    workbook = excel.load_workbook(filename=file_path)
+    sheet = workbook["Sheet1"]
+    for cell_name in ["A1", "B2", "C1", "E5"]:
+        cell = sheet[cell_name]
+        assert_that(cell.font.b).is_true()
+        assert_that(cell.font.color.rgb).is_equal_to("FFFF0000")
+        assert_that(cell.fill.start_color.rgb).is_equal_to("FFFFFF00")
+        assert_that(cell.border.bottom.style).is_equal_to("thin")
+    assert_that(sheet["D1"].font.b).is_false()
+    assert_that(sheet.column_dimensions["A"].width).is_equal_to(
+        max(len(str(sheet["A1"].value)), len(str(sheet["A2"].value))) + 2
+    )
+    workbook.close()
+
+
+def test_format_range_invalid_arguments(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
+
+    with pytest.raises(InvalidCellRangeError):
+        exl.format_range(cell_range="C3:A1", bold=True)
+
+    with pytest.raises(InvalidColorError):
+        exl.format_range(cell_range="A1:B2", font_color="red")
+
+
 def test_format_cell_invalid_cell_address(setup_teardown):
     with pytest.raises(InvalidCellAddressError) as exc_info:
         exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
@@ -1779,6 +2482,80 @@ def test_export_to_csv_with_custom_separator(setup_teardown):
         os.remove(csv_file_dash)
 
 
+def test_export_to_csv_matches_pandas(setup_teardown):
+    for sheet_name in ["Sheet1", "Offset_table", "Invalid_header"]:
+        output_filename = exl.export_to_csv(
+            filename=EXCEL_FILE_PATH,
+            output_filename=CSV_FILE_PATH,
+            sheet_name=sheet_name,
+            overwrite_if_exists=True,
+        )
+        expected = pd.read_excel(EXCEL_FILE_PATH, sheet_name=sheet_name).to_csv(index=False)
+
+        with open(output_filename, "r", encoding="utf-8", newline="") as f:
+            assert_that(f.read().replace("\r\n", "\n")).is_equal_to(expected)
+
+
+def test_export_to_csv_blank_header(setup_teardown):
+    file_path = os.path.join(DATA_DIR, "blank_header.xlsx")
+    exl.create_workbook(
+        workbook_name=file_path, sheet_data=[[None], ["a"], [None], ["b"]], overwrite_if_exists=True
+    )
+
+    exl.export_to_csv(output_filename=CSV_FILE_PATH, overwrite_if_exists=True)
+
+    with open(CSV_FILE_PATH, "r", encoding="utf-8", newline="") as f:
+        assert_that(f.read().replace("\r\n", "\n")).is_equal_to(pd.read_excel(file_path).to_csv(index=False))
+
+
+def test_export_to_csv_from_open_workbook(setup_teardown):
+    exl.open_workbook(workbook_name=EXCEL_FILE_PATH, autosave="manual")
+    exl.write_to_cell(cell_name="A2", cell_value="Changed", sheet_name="Sheet1")
+
+    output_filename = exl.export_to_csv(output_filename=CSV_FILE_PATH, overwrite_if_exists=True)
+
+    assert_that(output_filename).is_equal_to(CSV_FILE_PATH)
+    assert_that(pd.read_csv(CSV_FILE_PATH)["First Name"][0]).is_equal_to("Changed")
+
+    exl.export_to_csv(filename=EXCEL_FILE_PATH, output_filename=CSV_FILE_PATH, overwrite_if_exists=True)
+    assert_that(pd.read_csv(CSV_FILE_PATH)["First Name"][0]).is_not_equal_to("Changed")
+
+    with pytest.raises(SheetDoesntExistsError):
+        exl.export_to_csv(output_filename=CSV_FILE_PATH, sheet_name="Missing", overwrite_if_exists=True)
+
+
+def test_export_to_csv_all_sheets(setup_teardown):
+    output_filename = os.path.join(DATA_DIR, "sheets.csv")
+    expected_files = [
+        os.path.join(DATA_DIR, f"sheets_{sheet_name}.csv") for sheet_name in ["Sheet1", "Offset_table", "Invalid_header"]
+    ]
+
+    output_files = exl.export_to_csv(
+        filename=EXCEL_FILE_PATH, sheet_name="*", output_filename=output_filename, max_workers=2
+    )
+    assert_that(output_files).is_equal_to(expected_files)
+
+    with pytest.raises(FileAlreadyExistsError):
+        exl.export_to_csv(filename=EXCEL_FILE_PATH, sheet_name="*", output_filename=output_filename)
+
+    workbook = exl.open_workbook(workbook_name=EXCEL_FILE_PATH, autosave="manual")
+    exl.write_to_cell(cell_name="A1", cell_value="Renamed", sheet_name="Invalid_header")
+    exl.write_to_cell(cell_name="Z200", cell_value="Far away", sheet_name="Offset_table")
+    cell_counts = [len(sheet._cells) for sheet in workbook.worksheets]
+    output_files = exl.export_to_csv(sheet_name="*", output_filename=output_filename, overwrite_if_exists=True)
+    assert_that([len(sheet._cells) for sheet in workbook.worksheets]).is_equal_to(cell_counts)
+    assert_that(output_files).is_equal_to(expected_files)
+    assert_that(pd.read_csv(output_files[2]).columns[0]).is_equal_to("Renamed")
+    assert_that(pd.read_csv(output_files[0]).shape).is_equal_to(pd.read_excel(EXCEL_FILE_PATH).shape)
+
+    with pytest.raises(ValueError) as exc_info:
+        exl.export_to_csv(sheet_name="*", output_filename=output_filename, max_workers=0)
+    assert_that(str(exc_info.value)).is_equal_to("Invalid max workers: 0. It must be a positive integer.")
+
+    for output_file in output_files:
+        os.remove(output_file)
+
+
 def test_merge_excels_multi_sheet_success(setup_teardown):
     NEW_FILE = copy_test_excel_file(
         destination_file=os.path.join(DATA_DIR, "sample2.xlsx")
@@ -2028,6 +2805,86 @@ def test_merge_excels_sheet_wise_file_not_found(setup_teardown):
     )
 
 
+def test_merge_excels_invalid_max_workers(setup_teardown):
+    with pytest.raises(ValueError) as exc_info:
+        exl.merge_excels(
+            file_list=[EXCEL_FILE_PATH],
+            output_filename=os.path.join(DATA_DIR, "merged_file5.xlsx"),
+            max_workers=0,
+        )
+
+    assert_that(str(exc_info.value)).is_equal_to(
+        "Invalid max workers: 0. It must be a positive integer."
+    )
+
+
+def test_merge_excels_in_process_matches_worker_pool(setup_teardown):
+    NEW_FILE = copy_test_excel_file(
+        destination_file=os.path.join(DATA_DIR, "sample2.xlsx")
+    )
+    outputs = {
+        max_workers: os.path.join(DATA_DIR, f"merged_file_sheet_wise_{max_workers}.xlsx")
+        for max_workers in (1, 2)
+    }
+    for max_workers, output_file in outputs.items():
+        exl.merge_excels(
+            file_list=[EXCEL_FILE_PATH, NEW_FILE],
+            output_filename=output_file,
+            merge_type="sheet_wise",
+            max_workers=max_workers,
+        )
+
+    merged = [pd.read_excel(output_file, sheet_name=None) for output_file in outputs.values()]
+    assert_that(list(merged[0])).is_equal_to(["Sheet_1", "Sheet_2", "Sheet_3"])
+    for sheet_name, df in merged[0].items():
+        pd.testing.assert_frame_equal(df, merged[1][sheet_name])
+
+
+def test_merge_excels_write_only_matches_default(setup_teardown):
+    files = []
+    for index, data in enumerate(
+        [
+            [["Name", "Age"], ["Mark", 25], ["John", None]],
+            [["Name", "City"], ["Dee", "Berlin"]],
+        ]
+    ):
+        files.append(os.path.join(DATA_DIR, f"write_only_workbook{index}.xlsx"))
+        exl.create_workbook(
+            workbook_name=files[-1], sheet_data=data, overwrite_if_exists=True, load_after_create=False
+        )
+
+    outputs = [
+        os.path.join(DATA_DIR, "merged_file_default.xlsx"),
+        os.path.join(DATA_DIR, "merged_file_write_only.xlsx"),
+    ]
+    for output_file, write_only in zip(outputs, (False, True)):
+        exl.merge_excels(
+            file_list=files,
+            output_filename=output_file,
+            merge_type="single_sheet",
+            write_only=write_only,
+        )
+
+    default, streamed = (pd.read_excel(output_file, sheet_name=None) for output_file in outputs)
+    assert_that(list(streamed)).is_equal_to(["Merged_Sheet"])
+    pd.testing.assert_frame_equal(streamed["Merged_Sheet"], default["Merged_Sheet"])
+    assert_that(streamed["Merged_Sheet"].columns.tolist()).is_equal_to(["Name", "Age", "City"])
+
+    sample_copy = copy_test_excel_file(destination_file=os.path.join(DATA_DIR, "write_only_sample.xlsx"))
+    for output_file, write_only in zip(outputs, (False, True)):
+        exl.merge_excels(
+            file_list=[EXCEL_FILE_PATH, sample_copy],
+            output_filename=output_file,
+            merge_type="sheet_wise",
+            write_only=write_only,
+        )
+
+    default, streamed = (pd.read_excel(output_file, sheet_name=None) for output_file in outputs)
+    assert_that(list(streamed)).is_equal_to(["Sheet_1", "Sheet_2", "Sheet_3"])
+    for sheet_name, df in default.items():
+        pd.testing.assert_frame_equal(streamed[sheet_name], df)
+
+
 def test_merge_excels_sheet_wise_index_error(setup_teardown):
     data = {
         os.path.join(DATA_DIR, "sheet_wise_workbook1.xlsx"): {
@@ -2578,6 +3435,35 @@ def test_find_duplicates_success(
         assert_that(counts == expected_value).is_true()
 
 
+def test_find_duplicates_row_numbers(setup_teardown):
+    file_path = os.path.join(DATA_DIR, "duplicate_rows.xlsx")
+    exl.create_workbook(
+        workbook_name=file_path,
+        sheet_data=[["Code", "Name"], [-1, "John"], [-2, "Mark"], [-1, "Dee"], [None, None], [-2, "Mark"], [None, None]],
+        overwrite_if_exists=True,
+    )
+    assert_that(exl.find_duplicates(output_format="row_numbers")).is_equal_to([3, 6])
+    assert_that(
+        exl.find_duplicates(column_names_or_letters="Code", output_format="row_numbers")
+    ).is_equal_to([2, 3, 4, 6])
+    assert_that(exl.find_duplicates(column_names_or_letters="Code", output_format="list")).is_equal_to(
+        [[-1, "John"], [-2, "Mark"], [-1, "Dee"], [-2, "Mark"]]
+    )
+
+
+def test_find_duplicates_dtypes_follow_whole_columns(setup_teardown):
+    file_path = os.path.join(DATA_DIR, "duplicate_dtypes.xlsx")
+    exl.create_workbook(
+        workbook_name=file_path,
+        sheet_data=[["Id", "Score"], [1, 10], [None, 20], [1, 10], [3, None]],
+        overwrite_if_exists=True,
+    )
+
+    assert_that(exl.find_duplicates(output_format="list")).is_equal_to([[1.0, 10.0], [1.0, 10.0]])
+    duplicates = exl.find_duplicates(output_format="dataframe")
+    assert_that(duplicates.dtypes.tolist()).is_equal_to(pd.read_excel(file_path).dtypes.tolist())
+
+
 def test_find_duplicates_invalid_column_name(setup_teardown):
     with pytest.raises(ValueError) as exc_info:
         exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
@@ -2755,6 +3641,37 @@ def test_find_duplicates_delete_without_columns(setup_teardown):
             os.remove(output_file)
 
 
+def test_find_duplicates_delete_hands_unsaved_changes_to_output(setup_teardown):
+    source_file = os.path.join(DATA_DIR, "dedup_source.xlsx")
+    output_file = os.path.join(DATA_DIR, "dedup_output.xlsx")
+    exl.create_workbook(
+        workbook_name=source_file,
+        sheet_data=[["Id", "Name"], [1, "John"], [2, "Mark"], [1, "John"], [3, "Dee"], [2, "Mark"]],
+        overwrite_if_exists=True,
+        alias="source",
+    )
+    exl.set_autosave_policy(policy="manual")
+    exl.write_to_cell(cell_name="C1", cell_value="Unsaved")
+
+    rows_deleted = exl.find_duplicates(delete=True, output_filename=output_file, overwrite_if_exists=True)
+    assert_that(rows_deleted).is_equal_to(2)
+    assert_that(exl.fetch_sheet_data(output_format="list")).is_equal_to(
+        [[1, "John", None], [2, "Mark", None], [3, "Dee", None]]
+    )
+    assert_that(exl.get_cell_value(cell_name="C1")).is_equal_to("Unsaved")
+
+    exl.switch_workbook(alias="source")
+    assert_that(exl.get_row_count()).is_equal_to(5)
+    assert_that(exl.get_cell_value(cell_name="C1")).is_none()
+
+    exl.open_workbook(workbook_name=source_file, alias="read_source", mode="read")
+    rows_deleted = exl.find_duplicates(
+        column_names_or_letters="Id", delete=True, output_filename=output_file, overwrite_if_exists=True
+    )
+    assert_that(rows_deleted).is_equal_to(2)
+    assert_that(exl.get_row_count()).is_equal_to(3)
+
+
 def test_find_duplicates_delete_with_multiple_columns(setup_teardown):
     test_file = copy_test_excel_file(
         destination_file=os.path.join(DATA_DIR, "test_delete_duplicates_multi.xlsx")
@@ -3086,6 +4003,210 @@ def test_compare_excels_success(setup_teardown):
     assert_that(df_sorted.equals(expected_df_sorted)).is_true()
 
 
+def test_compare_excels_key_columns(setup_teardown):
+    source_file = os.path.join(DATA_DIR, "compare_source.xlsx")
+    target_file = os.path.join(DATA_DIR, "compare_target.xlsx")
+    exl.create_workbook(
+        workbook_name=source_file,
+        sheet_data=[["Id", "Name", "Amount"], [1, "Mark", 10], [2, "John", None], [3, "Dee", 30], [4, "Alex", 30]],
+        overwrite_if_exists=True,
+        load_after_create=False,
+    )
+    exl.create_workbook(
+        workbook_name=target_file,
+        sheet_data=[["Id", "Name", "Amount"], [4, "Alex", 45], [5, "Sam", 50], [2, "John", None], [1, "Marc", 11]],
+        overwrite_if_exists=True,
+        load_after_create=False,
+    )
+
+    differences = exl.compare_excels(source_excel=source_file, target_excel=target_file, key_columns="Id")
+
+    assert_that(differences["added"].values.tolist()).is_equal_to([[5, "Sam", 50]])
+    assert_that(differences["removed"].values.tolist()).is_equal_to([[3, "Dee", 30]])
+    assert_that(differences["changed"].values.tolist()).is_equal_to(
+        [[1, "Name", "Mark", "Marc"], [1, "Amount", 10, 11], [4, "Amount", 30, 45]]
+    )
+    assert_that(differences["changed"].columns.tolist()).is_equal_to(["Id", "Column", "Source", "Target"])
+
+    with pytest.raises(ValueError) as exc_info:
+        exl.compare_excels(source_excel=source_file, target_excel=target_file, key_columns="Amount")
+    assert_that(str(exc_info.value)).is_equal_to(
+        "Key columns ['Amount'] do not identify the rows of the source sheet uniquely."
+    )
+
+    with pytest.raises(InvalidColumnNameError) as exc_info:
+        exl.compare_excels(source_excel=source_file, target_excel=target_file, key_columns=["Code"])
+    assert_that(str(exc_info.value)).is_equal_to(
+        "Invalid columns. Columns not found: ['Code'] in sheet '0'."
+    )
+
+
+def test_compare_excels_memory_limit(setup_teardown):
+    source_file = os.path.join(DATA_DIR, "compare_chunked_source.xlsx")
+    target_file = os.path.join(DATA_DIR, "compare_chunked_target.xlsx")
+    source_rows = [["Id", "Name", "Amount"]] + [[row, f"Name {row % 50}", row * 1.5] for row in range(6000)]
+    target_rows = [row[:] for row in source_rows]
+    target_rows[10][2] = 0
+    target_rows[4000][1] = "Renamed"
+    target_rows[2000] = [None, None, None]
+    target_rows.append([9999, "New", 1])
+    target_rows.reverse()
+    target_rows.insert(0, target_rows.pop())
+    for file_name, rows in ((source_file, source_rows), (target_file, target_rows)):
+        exl.create_workbook(
+            workbook_name=file_name, sheet_data=rows, overwrite_if_exists=True, load_after_create=False
+        )
+
+    differences = exl.compare_excels(source_excel=source_file, target_excel=target_file)
+    chunked = exl.compare_excels(source_excel=source_file, target_excel=target_file, memory_limit=1)
+    pd.testing.assert_frame_equal(chunked, differences)
+    assert_that(len(chunked)).is_equal_to(7)
+
+    differences = exl.compare_excels(source_excel=source_file, target_excel=target_file, key_columns="Id")
+    chunked = exl.compare_excels(
+        source_excel=source_file, target_excel=target_file, key_columns="Id", memory_limit=1
+    )
+    for name in ("added", "removed", "changed"):
+        pd.testing.assert_frame_equal(chunked[name], differences[name])
+    assert_that(chunked["changed"].values.tolist()).is_equal_to(
+        [[9, "Amount", 13.5, 0.0], [3999, "Name", "Name 49", "Renamed"]]
+    )
+    assert_that(chunked["removed"]["Id"].tolist()).is_equal_to([1999])
+
+    with pytest.raises(ValueError) as exc_info:
+        exl.compare_excels(source_excel=source_file, target_excel=target_file, memory_limit=0)
+    assert_that(str(exc_info.value)).is_equal_to("Invalid memory limit: 0. It must be a positive integer.")
+
+
+def test_compare_excels_memory_limit_mixed_types(setup_teardown):
+    source_file = os.path.join(DATA_DIR, "compare_mixed_source.xlsx")
+    target_file = os.path.join(DATA_DIR, "compare_mixed_target.xlsx")
+    source_rows = [["Id", "Code", "Amount"]] + [[row, f"{row:04d}", row] for row in range(1, 2001)]
+    source_rows.append([2001, "abc", None])
+    target_rows = [source_rows[0], [0, "0000", 0]] + [row[:] for row in source_rows[1:]]
+    target_rows[1500][2] = "none"
+    for file_name, rows in ((source_file, source_rows), (target_file, target_rows)):
+        exl.create_workbook(
+            workbook_name=file_name, sheet_data=rows, overwrite_if_exists=True, load_after_create=False
+        )
+
+    differences = exl.compare_excels(source_excel=source_file, target_excel=target_file, key_columns=["Id"])
+    chunked = exl.compare_excels(
+        source_excel=source_file, target_excel=target_file, key_columns=["Id"], memory_limit=1
+    )
+    for name in ("added", "removed", "changed"):
+        pd.testing.assert_frame_equal(chunked[name], differences[name])
+    assert_that(chunked["changed"].values.tolist()).is_equal_to([[1499, "Amount", 1499, "none"]])
+
+    differences = exl.compare_excels(source_excel=source_file, target_excel=target_file)
+    chunked = exl.compare_excels(source_excel=source_file, target_excel=target_file, memory_limit=1)
+    pd.testing.assert_frame_equal(chunked, differences)
+
+
+def test_compare_excels_identical_sheets(setup_teardown):
+    source_file = os.path.join(DATA_DIR, "compare_identical_source.xlsx")
+    target_file = os.path.join(DATA_DIR, "compare_identical_target.xlsx")
+    copied_file = os.path.join(DATA_DIR, "compare_identical_copy.xlsx")
+    workbook = Workbook()
+    workbook.active.title = "Data"
+    for row in [["Id", "Name"], [1, "Mark"], [2, "John"]]:
+        workbook["Data"].append(row)
+    workbook.create_sheet("Other").append(["Total"])
+    workbook["Other"].append([10])
+    workbook.save(source_file)
+    shutil.copy(source_file, copied_file)
+    workbook["Other"]["A2"] = 20
+    workbook.save(target_file)
+    workbook.close()
+
+    for target in (copied_file, target_file):
+        differences = exl.compare_excels(
+            source_excel=source_file, target_excel=target, target_excel_config={"sheet_name": "Data"}
+        )
+        assert_that(differences.empty).is_true()
+        assert_that(differences.columns.tolist()).is_equal_to(["Id", "Name", "Excel_Source"])
+
+    differences = exl.compare_excels(source_excel=source_file, target_excel=target_file, key_columns="Id")
+    assert_that([len(frame) for frame in differences.values()]).is_equal_to([0, 0, 0])
+    assert_that(differences["changed"].columns.tolist()).is_equal_to(["Id", "Column", "Source", "Target"])
+
+    other_config = {"sheet_name": "Other"}
+    differences = exl.compare_excels(
+        source_excel=source_file,
+        target_excel=target_file,
+        source_excel_config=other_config,
+        target_excel_config=other_config,
+    )
+    assert_that(differences.values.tolist()).is_equal_to([[10, "Source"], [20, "Target"]])
+
+
+def test_compare_workbooks_success(setup_teardown):
+    source_file = os.path.join(DATA_DIR, "compare_workbooks_source.xlsx")
+    target_file = os.path.join(DATA_DIR, "compare_workbooks_target.xlsx")
+
+    def create_workbook(filename, sheets_data):
+        workbook = Workbook()
+        workbook.remove(workbook.active)
+        for sheet_name, sheet_data in sheets_data.items():
+            sheet = workbook.create_sheet(title=sheet_name)
+            for row in sheet_data:
+                sheet.append(row)
+        workbook.save(filename)
+        workbook.close()
+
+    customers = [["Id", "Name"], [1, "Mark"], [2, "John"]]
+    create_workbook(
+        source_file,
+        {
+            "Orders": [["Id", "Amount"], [1, 10], [2, 20], [3, 30]],
+            "Customers": customers,
+            "Archive": [["Id"], [1]],
+        },
+    )
+    create_workbook(
+        target_file,
+        {
+            "Customers": customers,
+            "Orders": [["Id", "Amount"], [2, 25], [1, 10], [4, 40]],
+            "Audit": [["Id"], [1]],
+        },
+    )
+
+    summaries = exl.compare_workbooks(
+        source_excel=source_file,
+        target_excel=target_file,
+        key_columns={"Orders": "Id"},
+        include_details=True,
+        max_workers=2,
+    )
+
+    assert_that([summary["source_sheet"] for summary in summaries]).is_equal_to(
+        ["Orders", "Customers", "Archive", None]
+    )
+    assert_that([summary["status"] for summary in summaries]).is_equal_to(
+        ["different", "identical", "missing_in_target", "missing_in_source"]
+    )
+    orders = summaries[0]
+    assert_that([orders["rows_added"], orders["rows_removed"], orders["rows_changed"]]).is_equal_to([1, 1, 1])
+    assert_that(orders["differences"]["changed"].values.tolist()).is_equal_to([[2, "Amount", 20, 25]])
+    assert_that([summaries[1]["rows_added"], summaries[1]["rows_removed"], summaries[1]["rows_changed"]]).is_equal_to(
+        [0, 0, None]
+    )
+
+    with pytest.raises(ColumnMismatchError) as exc_info:
+        exl.compare_workbooks(source_excel=source_file, target_excel=target_file, pair_by="position", max_workers=2)
+    assert_that(str(exc_info.value)).starts_with("Column mismatch found in excel files.")
+
+
+def test_compare_workbooks_invalid_arguments(setup_teardown):
+    with pytest.raises(ValueError) as exc_info:
+        exl.compare_workbooks(source_excel=EXCEL_FILE_PATH, target_excel=EXCEL_FILE_PATH, pair_by="index")
+    assert_that(str(exc_info.value)).is_equal_to("Invalid pair by value. Use 'name' or 'position'.")
+
+    with pytest.raises(ExcelFileNotFoundError):
+        exl.compare_workbooks(source_excel=EXCEL_FILE_PATH, target_excel=INVALID_EXCEL_FILE_PATH)
+
+
 def test_compare_excels_file_not_found(setup_teardown):
     with pytest.raises(ExcelFileNotFoundError) as exc_info:
         exl.compare_excels(
@@ -3609,6 +4730,54 @@ def test_remove_empty_rows_preserves_structure(setup_teardown):
             os.remove(output_file)
 
 
+def test_remove_empty_rows_large_sheet_keeps_other_columns(setup_teardown):
+    test_file = os.path.join(DATA_DIR, "test_remove_empty_large.xlsx")
+    output_file = os.path.join(DATA_DIR, "test_remove_empty_large_output.xlsx")
+
+    try:
+        wb = excel.Workbook()
+        ws = wb.active
+        ws.title = "Sheet1"
+        ws.append(["Note", "Name", "Age"])
+        for row in range(2, 12003):
+            empty = row % 1000 == 0
+            ws.append([f"note {row}", None if empty else f"Name {row}", None if empty else row])
+        wb.save(test_file)
+        wb.close()
+
+        exl.open_workbook(workbook_name=test_file)
+
+        rows_removed = exl.remove_empty_rows(
+            sheet_name="Sheet1",
+            output_filename=output_file,
+            starting_cell="B1",
+        )
+
+        assert_that(rows_removed).is_equal_to(12)
+
+        sheet = excel.load_workbook(output_file)["Sheet1"]
+        assert_that(sheet["A1000"].value).is_equal_to("note 1000")
+        assert_that(sheet["B1000"].value).is_equal_to("Name 1001")
+        assert_that(sheet["C11990"].value).is_equal_to(12002)
+        assert_that(sheet["B11991"].value).is_none()
+        assert_that(sheet["A12002"].value).is_equal_to("note 12002")
+
+        assert_that(
+            exl.remove_empty_rows(
+                sheet_name="Sheet1",
+                output_filename=output_file,
+                starting_cell="B1",
+                overwrite_if_exists=True,
+            )
+        ).is_equal_to(0)
+
+    finally:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+        if os.path.exists(output_file):
+            os.remove(output_file)
+
+
 def test_cell_value_should_be_success(setup_teardown):
     exl.open_workbook(workbook_name=EXCEL_FILE_PATH)
     exl.cell_value_should_be(cell_name="A1", expected_value="First Name")
@@ -3680,6 +4849,17 @@ def test_column_should_not_contain_duplicates_failure(setup_teardown):
         exl.column_should_not_contain_duplicates(column_name_or_letter="Name")
 
 
+def test_column_should_not_contain_duplicates_hash_collision(setup_teardown):
+    # -1 and -2 have the same hash in CPython, so only the exact comparison tells them apart.
+    sheet_data = [["Code", "Age"], [-1, 30], [-2, 40]]
+    exl.create_workbook(
+        workbook_name=ASSERTION_EXCEL_FILE_PATH,
+        overwrite_if_exists=True,
+        sheet_data=sheet_data,
+    )
+    exl.column_should_not_contain_duplicates(column_name_or_letter="Code")
+
+
 def test_sheet_should_not_contain_empty_rows_success(setup_teardown):
     sheet_data = [["Name", "Age"], ["Alice", 30], ["Bob", 40]]
     exl.create_workbook(